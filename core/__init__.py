@@ -16,6 +16,7 @@ from .validate import (
 )
 from .normalize import (
     normalize_descriptor,
+    normalize_descriptors_batch,
     normalize_value,
     normalize_field_name,
     are_values_equivalent,
@@ -24,6 +25,7 @@ from .normalize import (
     is_hierarchical,
     get_parent_value,
     get_root_value,
+    clear_normalize_caches,
     HIERARCHY_SEPARATOR,
 )
 from .errors import (
@@ -49,6 +51,7 @@ __all__ = [
     
     # Normalization
     'normalize_descriptor',
+    'normalize_descriptors_batch',
     'normalize_value',
     'normalize_field_name',
     'are_values_equivalent',
@@ -57,6 +60,7 @@ __all__ = [
     'is_hierarchical',
     'get_parent_value',
     'get_root_value',
+    'clear_normalize_caches',
     'HIERARCHY_SEPARATOR',
     
     # Errors
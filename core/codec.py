@@ -0,0 +1,111 @@
+"""
+JSON codec for Semantic Dropdown Search.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so callers never need to care which backend is active.
+Output is always UTF-8 with non-ASCII characters left unescaped, and is
+byte-for-byte the same whichever backend produced it: compact output
+has no spaces after separators, as orjson writes it.
+"""
+
+import json
+import re
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+
+# A run of 19+ digits may be an integer outside int64/uint64
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_B = re.compile(rb"\d{19}")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document from str or UTF-8 bytes.
+
+    Documents orjson rejects (NaN, Infinity) or would read differently
+    (integers wider than 64 bits, which it turns into floats) are parsed
+    by the standard library.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS if isinstance(data, str) else _LONG_DIGITS_B
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+_PLAIN_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_equivalent(obj: Any) -> bool:
+    """
+    True if orjson serializes obj exactly as json.dumps would.
+
+    orjson writes non-finite floats as null, spells exponents without
+    '+' or zero padding (1e16 rather than 1e+16) and natively encodes
+    types json.dumps rejects (datetime, UUID, dataclasses, enums), so
+    only trees of plain JSON values with str/int/bool/None keys, and
+    floats repr() writes without an exponent, qualify.
+    """
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        value = pop()
+        t = type(value)
+        if t in _PLAIN_SCALARS:
+            continue
+        if t is float:
+            # Also False for NaN and infinities
+            if not (value == 0.0 or 1e-4 <= abs(value) < 1e16):
+                return False
+        elif t is dict:
+            for key in value:
+                if type(key) not in _PLAIN_SCALARS:
+                    return False
+            extend(value.values())
+        elif t is list or t is tuple:
+            extend(value)
+        else:
+            return False
+    return True
+
+
+def dumpb(obj: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    orjson only supports 2-space indentation; other indents, and values
+    orjson would encode differently from json.dumps (see
+    _orjson_equivalent) or rejects (integers wider than 64 bits), go
+    through the standard library, which also raises TypeError for
+    non-JSON types as before. The standard library is given orjson's
+    compact separators so both write the same bytes.
+    """
+    if orjson is not None and indent in (None, 2) and _orjson_equivalent(obj):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    separators = (',', ':') if indent is None else None
+    return json.dumps(
+        obj, indent=indent, separators=separators, ensure_ascii=False
+    ).encode('utf-8')
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize obj to a JSON string (see dumpb)."""
+    return dumpb(obj, indent=indent).decode('utf-8')
@@ -5,13 +5,25 @@ This module defines the core SemanticDescriptor class that represents
 a semantic description of content.
 """
 
-import json
-from typing import Dict, Optional, Set, Any
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Any
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
-from .validate import SchemaValidator, ValidationResult
-from .normalize import normalize_descriptor, normalize_value
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only needed for to_msgpack/from_msgpack
+    msgpack = None
+
+from . import codec
+from .validate import ValidationResult, _get_validator
+from .normalize import (
+    normalize_descriptor,
+    normalize_descriptors_batch,
+    normalize_value,
+)
 from .errors import ValidationError
 
 
@@ -19,9 +31,74 @@ from .errors import ValidationError
 # Defined once here and imported wherever needed to avoid duplication.
 STANDARD_FIELDS: frozenset = frozenset({'domain', 'intent', 'tone', 'audience', 'stability'})
 
+# Standard fields in declaration (and serialization) order.
+_STANDARD_FIELD_ORDER = ('domain', 'intent', 'tone', 'audience', 'stability')
+
+
+def _build_standard_normalizer():
+    """
+    Generate a function that normalizes the standard fields in place.
+    
+    The field list is fixed, so the per-field None check, normalize call
+    and attribute store are emitted as straight-line code instead of
+    round-tripping through a dict.
+    """
+    lines = ["def _normalize_standard_fields(self):"]
+    for name in _STANDARD_FIELD_ORDER:
+        lines.append(f"    value = self.{name}")
+        lines.append("    if value is not None:")
+        lines.append(f"        _set(self, '{name}', _normalize(value, True))")
+    namespace = {'_set': object.__setattr__, '_normalize': normalize_value}
+    exec("\n".join(lines), namespace)
+    return namespace['_normalize_standard_fields']
+
+
+_normalize_standard_fields = _build_standard_normalizer()
+
+
+# Bumped whenever a standard field of an already constructed descriptor
+# is reassigned, so the field indexes built over descriptors can tell
+# they may be stale (see indexer.index_text.TextIndex)
+_field_revision = 0
+
+def field_revision() -> int:
+    """Count of standard-field changes made to existing descriptors."""
+    return _field_revision
+
+
+class _DerivedStateSlots:
+    """
+    Slots for SemanticDescriptor's derived state.
+    
+    Declared on a base class so they are not dataclass fields and stay
+    out of fields(), asdict() and the generated __init__.
+    """
+    
+    __slots__ = ('_cache', '_valid_for')
+
+
+_trust_state = threading.local()
+
+
+@contextmanager
+def trust_normalized() -> Iterator[None]:
+    """
+    Skip normalization for descriptors constructed inside this block.
+    
+    Only use this for data known to be canonical already, e.g. records
+    written by to_dict()/to_file(). Nesting is supported and the flag is
+    per-thread.
+    """
+    previous = getattr(_trust_state, 'enabled', False)
+    _trust_state.enabled = True
+    try:
+        yield
+    finally:
+        _trust_state.enabled = previous
+
 
-@dataclass
-class SemanticDescriptor:
+@dataclass(slots=True, eq=False, init=False)
+class SemanticDescriptor(_DerivedStateSlots):
     """
     A semantic descriptor that describes content using structured metadata.
     
@@ -32,6 +109,16 @@ class SemanticDescriptor:
         audience: Target audience (e.g., "Researchers")
         stability: Content stability (e.g., "Hypothesis (Not yet validated)")
         custom_fields: Additional custom fields not in standard schema
+    
+    Derived state used by to_dict(), get_filled_fields() and hashing is
+    computed once and reused until a field is reassigned or the contents
+    of custom_fields change.
+    
+    Instances use __slots__, so arbitrary attributes cannot be attached.
+    Equality and hashing are defined explicitly below.
+    
+    Normalized field names and values are interned, so descriptors built
+    from the same vocabulary share their strings rather than copying them.
     """
     
     domain: Optional[str] = None
@@ -41,8 +128,100 @@ class SemanticDescriptor:
     stability: Optional[str] = None
     custom_fields: Dict[str, str] = field(default_factory=dict)
     
+    # Derived state (see _DerivedStateSlots): _cache holds _cached_state(),
+    # _valid_for the schema version this descriptor last passed complete
+    # validation against.
+    
+    def __init__(
+        self,
+        domain: Optional[str] = None,
+        intent: Optional[str] = None,
+        tone: Optional[str] = None,
+        audience: Optional[str] = None,
+        stability: Optional[str] = None,
+        custom_fields: Optional[Dict[str, str]] = None,
+    ):
+        # Stored directly: __setattr__ handles changes after construction
+        _set = object.__setattr__
+        _set(self, 'domain', domain)
+        _set(self, 'intent', intent)
+        _set(self, 'tone', tone)
+        _set(self, 'audience', audience)
+        _set(self, 'stability', stability)
+        _set(self, 'custom_fields', {} if custom_fields is None else custom_fields)
+        _set(self, '_cache', None)
+        _set(self, '_valid_for', None)
+        self.__post_init__()
+    
+    def __setattr__(self, name: str, value: Any):
+        """Assign an attribute, discarding derived state on field changes."""
+        global _field_revision
+        if name in STANDARD_FIELDS:
+            _field_revision += 1
+        object.__setattr__(self, name, value)
+        if name != '_cache' and name != '_valid_for':
+            object.__setattr__(self, '_cache', None)
+            object.__setattr__(self, '_valid_for', None)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the fields only; derived state is rebuilt on demand."""
+        return {
+            'domain': self.domain,
+            'intent': self.intent,
+            'tone': self.tone,
+            'audience': self.audience,
+            'stability': self.stability,
+            'custom_fields': self.custom_fields,
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_cache', None)
+        object.__setattr__(self, '_valid_for', None)
+    
+    def _cached_state(self) -> tuple:
+        """
+        Return (dict without None values, filled field names, sorted
+        item tuple used as the equality key, hash of that key, copy of
+        custom_fields the state was built from).
+        
+        Built lazily on first use, cleared by __setattr__ and rebuilt
+        (dropping the validation memo) when custom_fields was changed
+        in place.
+        """
+        cache = self._cache
+        if cache is None or cache[4] != self.custom_fields:
+            object.__setattr__(self, '_valid_for', None)
+            data = {
+                k: v for k, v in (
+                    ('domain', self.domain),
+                    ('intent', self.intent),
+                    ('tone', self.tone),
+                    ('audience', self.audience),
+                    ('stability', self.stability),
+                    *self.custom_fields.items(),
+                )
+                if v is not None
+            }
+            key = tuple(sorted(data.items()))
+            cache = (data, frozenset(data), key, hash(key), dict(self.custom_fields))
+            object.__setattr__(self, '_cache', cache)
+        return cache
+    
     def __post_init__(self):
         """Normalize all fields after initialization."""
+        if getattr(_trust_state, 'enabled', False):
+            return
+        
+        # Common case: no custom fields, so there is nothing to merge,
+        # rename or check for collisions. The caller's empty dict is
+        # still replaced, as the general path does, so it is not shared.
+        if not self.custom_fields and isinstance(self.custom_fields, dict):
+            _normalize_standard_fields(self)
+            object.__setattr__(self, 'custom_fields', {})
+            return
+        
         # Build descriptor dict from standard fields
         descriptor_dict = {
             'domain': self.domain,
@@ -61,12 +240,10 @@ class SemanticDescriptor:
         # Normalize
         normalized = normalize_descriptor(descriptor_dict, strict=True)
         
-        # Update standard fields with normalized values
-        self.domain = normalized.get('domain')
-        self.intent = normalized.get('intent')
-        self.tone = normalized.get('tone')
-        self.audience = normalized.get('audience')
-        self.stability = normalized.get('stability')
+        # Update standard fields with normalized values (still
+        # constructing, so not counted as field changes)
+        for name in _STANDARD_FIELD_ORDER:
+            object.__setattr__(self, name, normalized.get(name))
         
         # Update custom fields
         self.custom_fields = {
@@ -75,12 +252,29 @@ class SemanticDescriptor:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, str]) -> 'SemanticDescriptor':
+    def _from_normalized(cls, standard: Dict[str, str],
+                         custom: Dict[str, str]) -> 'SemanticDescriptor':
+        """Construct from already-canonical field values without normalizing."""
+        with trust_normalized():
+            return cls(
+                domain=standard.get('domain'),
+                intent=standard.get('intent'),
+                tone=standard.get('tone'),
+                audience=standard.get('audience'),
+                stability=standard.get('stability'),
+                custom_fields=dict(custom),
+            )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, str],
+                  trusted: bool = False) -> 'SemanticDescriptor':
         """
         Create a SemanticDescriptor from a dictionary.
         
         Args:
             data: Dictionary mapping field names to values
+            trusted: If True, data is known to be normalized already
+                and normalization is skipped
             
         Returns:
             SemanticDescriptor instance
@@ -89,6 +283,19 @@ class SemanticDescriptor:
         standard = {k: v for k, v in data.items() if k in STANDARD_FIELDS}
         custom = {k: v for k, v in data.items() if k not in STANDARD_FIELDS}
         
+        if trusted:
+            # Normalization would intern these; share one object per value
+            standard = {
+                k: sys.intern(v) if type(v) is str else v
+                for k, v in standard.items()
+            }
+            custom = {
+                sys.intern(k) if type(k) is str else k:
+                    sys.intern(v) if type(v) is str else v
+                for k, v in custom.items()
+            }
+            return cls._from_normalized(standard, custom)
+        
         return cls(
             domain=standard.get('domain'),
             intent=standard.get('intent'),
@@ -99,37 +306,62 @@ class SemanticDescriptor:
         )
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'SemanticDescriptor':
+    def from_dicts(cls, data: List[Dict[str, str]]) -> List['SemanticDescriptor']:
+        """
+        Create many SemanticDescriptors from a list of dictionaries.
+        
+        Normalization runs once over the whole batch (see
+        normalize_descriptors_batch) instead of once per descriptor.
+        
+        Args:
+            data: List of dictionaries mapping field names to values
+            
+        Returns:
+            List of SemanticDescriptor instances, in input order
+        """
+        descriptors = []
+        for normalized in normalize_descriptors_batch(data, strict=True):
+            standard = {k: v for k, v in normalized.items() if k in STANDARD_FIELDS}
+            custom = {k: v for k, v in normalized.items() if k not in STANDARD_FIELDS}
+            descriptors.append(cls._from_normalized(standard, custom))
+        return descriptors
+    
+    @classmethod
+    def from_json(cls, json_str: str,
+                  trusted: bool = False) -> 'SemanticDescriptor':
         """
         Create a SemanticDescriptor from a JSON string.
         
         Args:
             json_str: JSON string representing descriptor
+            trusted: If True, skip normalization (see from_dict)
             
         Returns:
             SemanticDescriptor instance
         """
-        data = json.loads(json_str)
+        data = codec.loads(json_str)
         if not isinstance(data, dict):
             raise ValidationError(
                 f"JSON must represent an object (dict), got {type(data).__name__}"
             )
-        return cls.from_dict(data)
+        return cls.from_dict(data, trusted=trusted)
     
     @classmethod
-    def from_file(cls, filepath: Path) -> 'SemanticDescriptor':
+    def from_file(cls, filepath: Path,
+                  trusted: bool = False) -> 'SemanticDescriptor':
         """
         Load a SemanticDescriptor from a JSON file.
         
         Args:
             filepath: Path to JSON file
+            trusted: If True, skip normalization (see from_dict)
             
         Returns:
             SemanticDescriptor instance
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        with open(filepath, 'rb') as f:
+            data = codec.loads(f.read())
+        return cls.from_dict(data, trusted=trusted)
     
     def to_dict(self, include_none: bool = False) -> Dict[str, str]:
         """
@@ -141,6 +373,9 @@ class SemanticDescriptor:
         Returns:
             Dictionary representation
         """
+        if not include_none:
+            return dict(self._cached_state()[0])
+        
         result = {
             'domain': self.domain,
             'intent': self.intent,
@@ -152,10 +387,6 @@ class SemanticDescriptor:
         # Add custom fields
         result.update(self.custom_fields)
         
-        # Remove None values if requested
-        if not include_none:
-            result = {k: v for k, v in result.items() if v is not None}
-        
         return result
     
     def to_json(self, indent: int = 2, include_none: bool = False) -> str:
@@ -169,7 +400,7 @@ class SemanticDescriptor:
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict(include_none=include_none), indent=indent)
+        return codec.dumps(self.to_dict(include_none=include_none), indent=indent)
     
     def to_file(self, filepath: Path, indent: int = 2, include_none: bool = False):
         """
@@ -180,29 +411,84 @@ class SemanticDescriptor:
             indent: JSON indentation level
             include_none: If True, include fields with None values
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(include_none=include_none), f, indent=indent)
+        # One encode and one write; json.dump() issues a write per chunk
+        payload = codec.dumpb(self.to_dict(include_none=include_none), indent=indent)
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+    
+    def to_msgpack(self, include_none: bool = False) -> bytes:
+        """
+        Convert descriptor to msgpack bytes.
+        
+        A compact binary alternative to to_json() for bulk persistence.
+        Requires the optional msgpack package.
+        
+        Args:
+            include_none: If True, include fields with None values
+            
+        Returns:
+            msgpack-encoded bytes
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for to_msgpack()")
+        return msgpack.packb(self.to_dict(include_none=include_none))
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes,
+                     trusted: bool = False) -> 'SemanticDescriptor':
+        """
+        Create a SemanticDescriptor from msgpack bytes.
+        
+        Args:
+            data: Bytes produced by to_msgpack()
+            trusted: If True, skip normalization (see from_dict)
+            
+        Returns:
+            SemanticDescriptor instance
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for from_msgpack()")
+        decoded = msgpack.unpackb(data, raw=False)
+        if not isinstance(decoded, dict):
+            raise ValidationError(
+                f"msgpack data must represent a map (dict), got {type(decoded).__name__}"
+            )
+        return cls.from_dict(decoded, trusted=trusted)
     
     def validate(self, schema_version: str = "v1", 
-                 partial: bool = False) -> ValidationResult:
+                 partial: bool = False, explain: bool = True) -> ValidationResult:
         """
         Validate this descriptor against schemas.
         
         Args:
             schema_version: Schema version to validate against
             partial: If True, only validate present fields (not completeness)
+            explain: If False, skip building suggestions for invalid values
             
         Returns:
             ValidationResult
+        
+        A clean pass of complete validation is remembered per schema
+        version until a field changes, so re-validating an
+        unchanged descriptor (e.g. adding it to several indexes) is free.
         """
-        validator = SchemaValidator(version=schema_version)
+        # Refreshed first: it drops the memo if custom_fields changed in place
+        self._cached_state()
+        if not partial and self._valid_for == schema_version:
+            return ValidationResult(valid=True, errors=[], warnings=[])
+        
+        validator = _get_validator(schema_version)
         
         descriptor_dict = self.to_dict(include_none=False)
         
         if partial:
-            return validator.validate_values(descriptor_dict)
-        else:
-            return validator.validate_complete_descriptor(descriptor_dict)
+            return validator.validate_values(descriptor_dict, explain=explain)
+        
+        result = validator.validate_complete_descriptor(descriptor_dict,
+                                                        explain=explain)
+        if result.valid and not result.warnings:
+            self._valid_for = schema_version
+        return result
     
     def is_valid(self, schema_version: str = "v1", partial: bool = False) -> bool:
         """
@@ -215,7 +501,8 @@ class SemanticDescriptor:
         Returns:
             True if valid
         """
-        return bool(self.validate(schema_version=schema_version, partial=partial))
+        return bool(self.validate(schema_version=schema_version, partial=partial,
+                                  explain=False))
     
     def validate_or_raise(self, schema_version: str = "v1", partial: bool = False):
         """
@@ -248,16 +535,8 @@ class SemanticDescriptor:
         """
         field_name = field_name.lower()
         
-        standard_fields_map = {
-            'domain': self.domain,
-            'intent': self.intent,
-            'tone': self.tone,
-            'audience': self.audience,
-            'stability': self.stability,
-        }
-        
-        if field_name in standard_fields_map:
-            return standard_fields_map[field_name]
+        if field_name in STANDARD_FIELDS:
+            return getattr(self, field_name)
         
         return self.custom_fields.get(field_name)
     
@@ -277,6 +556,8 @@ class SemanticDescriptor:
             setattr(self, normalized_field, normalized_value)
         else:
             self.custom_fields[normalized_field] = normalized_value
+            self._cache = None
+            self._valid_for = None
     
     def get_filled_fields(self) -> Set[str]:
         """
@@ -285,22 +566,7 @@ class SemanticDescriptor:
         Returns:
             Set of field names that have values
         """
-        filled = set()
-        
-        if self.domain is not None:
-            filled.add('domain')
-        if self.intent is not None:
-            filled.add('intent')
-        if self.tone is not None:
-            filled.add('tone')
-        if self.audience is not None:
-            filled.add('audience')
-        if self.stability is not None:
-            filled.add('stability')
-        
-        filled.update(self.custom_fields.keys())
-        
-        return filled
+        return set(self._cached_state()[1])
     
     def is_complete(self, schema_version: str = "v1") -> bool:
         """
@@ -312,11 +578,9 @@ class SemanticDescriptor:
         Returns:
             True if all required fields are present
         """
-        validator = SchemaValidator(version=schema_version)
-        required = validator.get_required_fields()
-        filled = self.get_filled_fields()
+        required = _get_validator(schema_version)._required_fields
         
-        return required.issubset(filled)
+        return required.issubset(self._cached_state()[1])
     
     def __str__(self) -> str:
         """String representation of descriptor."""
@@ -342,13 +606,14 @@ class SemanticDescriptor:
     
     def __eq__(self, other: Any) -> bool:
         """Check equality with another descriptor."""
+        if self is other:
+            return True
         if not isinstance(other, SemanticDescriptor):
             return False
         
-        return self.to_dict() == other.to_dict()
+        return self._cached_state()[2] == other._cached_state()[2]
     
     def __hash__(self) -> int:
         """Make descriptor hashable for use in sets/dicts."""
-        # Convert to tuple of sorted items for consistent hashing
-        items = tuple(sorted(self.to_dict().items()))
-        return hash(items)
+        # Hash of sorted items, computed once per field state
+        return self._cached_state()[3]
@@ -17,16 +17,14 @@ class ValidationError(SemanticDropdownError):
         self.warnings = warnings or []
     
     def __str__(self):
-        msg = super().__str__()
+        parts = [super().__str__()]
         if self.errors:
-            msg += "\n\nErrors:"
-            for error in self.errors:
-                msg += f"\n  • {error}"
+            parts.append("\n\nErrors:")
+            parts.extend(f"\n  • {error}" for error in self.errors)
         if self.warnings:
-            msg += "\n\nWarnings:"
-            for warning in self.warnings:
-                msg += f"\n  • {warning}"
-        return msg
+            parts.append("\n\nWarnings:")
+            parts.extend(f"\n  • {warning}" for warning in self.warnings)
+        return "".join(parts)
 
 
 class SchemaError(SemanticDropdownError):
@@ -4,15 +4,48 @@ Schema validation for Semantic Dropdown Search.
 This module validates semantic descriptors against versioned JSON schemas.
 """
 
+import copy
 import json
+import re
+import sys
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
+from . import codec
 from .errors import SchemaError, SchemaVersionError
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; suggestions fall back to substring matching
+    fuzz = process = None
 
-@dataclass
+# Minimum rapidfuzz WRatio score (0-100) for a value to be suggested.
+SUGGESTION_SCORE_CUTOFF = 60
+
+# Splits values into lower-case word tokens for the suggestion fallback.
+_TOKEN_SPLIT = re.compile(r'\W+')
+
+
+def _tokens(text: str) -> FrozenSet[str]:
+    """Word tokens of text, lower-cased."""
+    return frozenset(t for t in _TOKEN_SPLIT.split(text.lower()) if t)
+
+
+@lru_cache(maxsize=64)
+def _parse_schema_file(schema_file: Path, mtime_ns: int, size: int) -> Dict:
+    """
+    Parsed JSON of a schema file, shared by every validator that loads it.
+    
+    Keyed by modification time and size as well as path, so a file that
+    is rewritten is parsed again. Invalid JSON raises and is not cached.
+    """
+    return codec.loads(schema_file.read_bytes())
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of schema validation."""
     valid: bool
@@ -30,18 +63,54 @@ class ValidationResult:
                 msg += f" (with {len(self.warnings)} warnings)"
             return msg
         else:
-            msg = f"✗ Validation failed with {len(self.errors)} error(s)"
-            for error in self.errors:
-                msg += f"\n  • {error}"
+            parts = [f"✗ Validation failed with {len(self.errors)} error(s)"]
+            parts.extend(f"\n  • {error}" for error in self.errors)
             if self.warnings:
-                msg += f"\n\nWarnings:"
-                for warning in self.warnings:
-                    msg += f"\n  • {warning}"
-            return msg
+                parts.append("\n\nWarnings:")
+                parts.extend(f"\n  • {warning}" for warning in self.warnings)
+            return "".join(parts)
+
+
+class _LazySchemas(Mapping):
+    """
+    Read-only mapping of field name -> parsed schema.
+    
+    The schemas themselves are parsed up front; accessing a value
+    (including via items()/values()) builds that field's derived tables
+    once, so membership tests, len() and key iteration never do.
+    """
+    
+    def __init__(self, schemas: Dict[str, Dict], prepare: Callable[[str, Dict], None]):
+        self._schemas = schemas
+        self._prepare = prepare
+        self._prepared: Set[str] = set()
+    
+    def __getitem__(self, field_name: str) -> Dict:
+        schema = self._schemas[field_name]
+        if field_name not in self._prepared:
+            self._prepare(field_name, schema)
+            self._prepared.add(field_name)
+        return schema
+    
+    def __contains__(self, field_name: object) -> bool:
+        return field_name in self._schemas
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schemas)
+    
+    def __len__(self) -> int:
+        return len(self._schemas)
 
 
 class SchemaValidator:
-    """Validates semantic descriptors against schema definitions."""
+    """
+    Validates semantic descriptors against schema definitions.
+    
+    Every schema file is parsed and checked at construction, so a broken
+    file fails there; the value tables derived from a schema are built
+    only when its field is first used. Parsed files are shared between
+    validators (see _parse_schema_file), so get_schema() returns a copy.
+    """
     
     def __init__(self, schema_dir: Path = None, version: str = "v1"):
         """
@@ -58,8 +127,16 @@ class SchemaValidator:
             schema_dir = Path(__file__).parent.parent / "schema" / version
         
         self.schema_dir = Path(schema_dir)
-        self._schemas: Dict[str, Dict] = {}
-        self._load_schemas()
+        # Derived from each schema when its field is first used; schemas
+        # are treated as read-only afterwards.
+        self._valid_values: Dict[str, FrozenSet[str]] = {}
+        self._sorted_values: Dict[str, tuple] = {}
+        self._lowered_values: Dict[str, tuple] = {}
+        self._value_tokens: Dict[str, tuple] = {}
+        # Explanations of invalid values of known fields; the tables they
+        # are built from never change, so repeated mistakes are looked up
+        self._explain_value = lru_cache(maxsize=1024)(self._build_explanation)
+        self._schemas: Mapping = self._load_schemas()
     
     def _validate_schema_structure(self, schema: Dict, schema_file: Path):
         """
@@ -97,8 +174,8 @@ class SchemaValidator:
                 schema_file=schema_name
             )
     
-    def _load_schemas(self):
-        """Load all JSON schemas from schema directory."""
+    def _load_schemas(self) -> Mapping:
+        """Parse and check every JSON schema in the schema directory."""
         if not self.schema_dir.exists():
             raise SchemaError(
                 f"Schema directory not found: {self.schema_dir}",
@@ -112,27 +189,92 @@ class SchemaValidator:
                 schema_file=str(self.schema_dir)
             )
         
-        for schema_file in schema_files:
-            field_name = schema_file.stem  # e.g., "domain" from "domain.json"
-            
-            try:
-                with open(schema_file, 'r', encoding='utf-8') as f:
-                    schema = json.load(f)
-                
-                # Validate schema structure before accepting it
-                self._validate_schema_structure(schema, schema_file)
-                
-                self._schemas[field_name] = schema
-                
-            except json.JSONDecodeError as e:
-                raise SchemaError(
-                    f"Invalid JSON: {e}",
-                    schema_file=schema_file.name
-                )
+        # e.g., "domain" from "domain.json"
+        schemas = {
+            schema_file.stem: self._load_schema(schema_file)
+            for schema_file in schema_files
+        }
+        return _LazySchemas(schemas, self._build_value_tables)
+    
+    def _load_schema(self, schema_file: Path) -> Dict:
+        """Parse and check one schema file."""
+        stat = schema_file.stat()
+        try:
+            schema = _parse_schema_file(schema_file, stat.st_mtime_ns, stat.st_size)
+        except json.JSONDecodeError as e:
+            raise SchemaError(
+                f"Invalid JSON: {e}",
+                schema_file=schema_file.name
+            )
+        
+        # Validate schema structure before accepting it
+        self._validate_schema_structure(schema, schema_file)
+        return schema
+    
+    def _build_value_tables(self, field_name: str, schema: Dict) -> None:
+        """Build the value lookup tables of one field from its schema."""
+        valid_values = frozenset(self._extract_values(schema.get('values', [])))
+        self._valid_values[field_name] = valid_values
+        self._sorted_values[field_name] = tuple(sorted(valid_values))
+        self._lowered_values[field_name] = tuple(
+            (v.lower(), v) for v in self._sorted_values[field_name]
+        )
+        self._value_tokens[field_name] = tuple(
+            (_tokens(v), v) for v in self._sorted_values[field_name]
+        )
+    
+    @cached_property
+    def _required_fields(self) -> FrozenSet[str]:
+        """Required field names (builds every field's value tables on first use)."""
+        return frozenset(
+            field_name for field_name, schema in self._schemas.items()
+            if schema.get('required', False)
+        )
+    
+    @cached_property
+    def _complete_check(self) -> Callable[[Dict[str, str]], bool]:
+        """
+        Generated predicate: True if a descriptor would pass complete
+        validation with no errors and no warnings.
+        
+        The schema set is fixed once loaded, so each field's check is
+        emitted as straight-line code against its frozen value set. Any
+        descriptor it rejects goes through the generic path, which builds
+        the messages.
+        """
+        required = self._required_fields  # builds every value table
+        missing = object()
+        namespace = {'_missing': missing}
+        lines = ["def _complete_check(descriptor):", "    provided = 0"]
+        for i, field_name in enumerate(sorted(self._schemas)):
+            namespace[f'_valid_{i}'] = self._valid_values[field_name]
+            lines.append(f"    value = descriptor.get({field_name!r}, _missing)")
+            if field_name in required:
+                lines.append(f"    if value is _missing or value not in _valid_{i}:")
+                lines.append("        return False")
+                lines.append("    provided += 1")
+            else:
+                lines.append("    if value is not _missing:")
+                lines.append(f"        if value not in _valid_{i}:")
+                lines.append("            return False")
+                lines.append("        provided += 1")
+        # Any remaining key is an unknown field, which the generic path warns about
+        lines.append("    return provided == len(descriptor)")
+        exec("\n".join(lines), namespace)
+        return namespace['_complete_check']
     
     def get_schema(self, field_name: str) -> Optional[Dict]:
-        """Get schema for a specific field."""
-        return self._schemas.get(field_name)
+        """Get a copy of the schema for a specific field."""
+        schema = self._schemas.get(field_name)
+        return copy.deepcopy(schema) if schema is not None else None
+    
+    def _valid_value_set(self, field_name: str) -> FrozenSet[str]:
+        """Precomputed valid values of a known field, building its tables if needed."""
+        values = self._valid_values.get(field_name)
+        if values is None:
+            self._schemas[field_name]  # builds the tables, filling _valid_values
+            values = self._valid_values[field_name]
+        return values
     
     def get_valid_values(self, field_name: str) -> Set[str]:
         """
@@ -144,15 +286,19 @@ class SchemaValidator:
         Returns:
             Set of valid values (flattened hierarchy)
         """
-        schema = self.get_schema(field_name)
-        if not schema:
+        if self._schemas.get(field_name) is None:
             return set()
         
-        return self._extract_values(schema.get('values', []))
+        return set(self._valid_values[field_name])
     
     def _extract_values(self, values: List, prefix: str = None) -> Set[str]:
         """
-        Recursively extract all valid values from hierarchical schema.
+        Extract all valid values from hierarchical schema.
+        
+        Walks the hierarchy with an explicit stack, writing every value
+        into a single result set (no recursion, no per-level sets). Values
+        are interned so each distinct path is stored once; only
+        schema-derived strings go through here, never user input.
         
         Args:
             values: List of values or nested dictionaries
@@ -162,28 +308,26 @@ class SchemaValidator:
             Set of all valid values including hierarchical paths
         """
         result = set()
+        stack = [(prefix, values)]
         
-        for item in values:
-            if isinstance(item, str):
-                # Simple string value
-                if prefix:
-                    result.add(f"{prefix} → {item}")
-                else:
-                    result.add(item)
-                    
-            elif isinstance(item, dict):
-                # Hierarchical structure like {"Science": ["Biology", "Physics"]}
-                for key, children in item.items():
-                    # Add the parent key itself
-                    if prefix:
-                        full_key = f"{prefix} → {key}"
-                    else:
-                        full_key = key
-                    result.add(full_key)
+        while stack:
+            prefix, items = stack.pop()
+            
+            for item in items:
+                if isinstance(item, str):
+                    # Simple string value
+                    result.add(sys.intern(f"{prefix} → {item}" if prefix else item))
                     
-                    # Recursively process children with current key as prefix
-                    if isinstance(children, list):
-                        result.update(self._extract_values(children, prefix=full_key))
+                elif isinstance(item, dict):
+                    # Hierarchical structure like {"Science": ["Biology", "Physics"]}
+                    for key, children in item.items():
+                        # Add the parent key itself
+                        full_key = sys.intern(f"{prefix} → {key}" if prefix else key)
+                        result.add(full_key)
+                        
+                        # Process children later with current key as prefix
+                        if isinstance(children, list):
+                            stack.append((full_key, children))
         
         return result
     
@@ -198,7 +342,7 @@ class SchemaValidator:
         Returns:
             Human-readable explanation string
         """
-        schema = self.get_schema(field_name)
+        schema = self._schemas.get(field_name)
         
         if not schema:
             return (
@@ -206,15 +350,12 @@ class SchemaValidator:
                 f"Available fields are: {', '.join(sorted(self._schemas.keys()))}"
             )
         
-        valid_values = self.get_valid_values(field_name)
-        
-        # Find similar values for suggestions (simple string matching)
-        suggestions = [v for v in valid_values if value.lower() in v.lower()]
-        if not suggestions:
-            # Try partial matching
-            suggestions = [v for v in valid_values if any(
-                part.lower() in v.lower() for part in value.split()
-            )]
+        return self._explain_value(field_name, value)
+    
+    def _build_explanation(self, field_name: str, value: str) -> str:
+        """explain_invalid() for a field whose schema is loaded."""
+        sorted_values = self._sorted_values[field_name]
+        suggestions = self._suggest(field_name, value)
         
         explanation = (
             f"The value '{value}' is not allowed for field '{field_name}'.\n\n"
@@ -222,24 +363,59 @@ class SchemaValidator:
         
         if suggestions:
             explanation += "Did you mean one of these?\n"
-            for suggestion in sorted(suggestions)[:5]:  # Show top 5 suggestions
+            for suggestion in suggestions:
                 explanation += f"  • {suggestion}\n"
         else:
             explanation += f"Allowed values for '{field_name}' include:\n"
-            for allowed in sorted(valid_values)[:10]:  # Show first 10
+            for allowed in sorted_values[:10]:  # Show first 10
                 explanation += f"  • {allowed}\n"
-            if len(valid_values) > 10:
-                explanation += f"  ... and {len(valid_values) - 10} more\n"
+            if len(sorted_values) > 10:
+                explanation += f"  ... and {len(sorted_values) - 10} more\n"
         
         return explanation.strip()
     
-    def validate_field(self, field_name: str, value: str) -> ValidationResult:
+    def _suggest(self, field_name: str, value: str, limit: int = 5) -> List[str]:
+        """
+        Return up to `limit` valid values of a known field resembling `value`.
+        
+        Uses rapidfuzz similarity ranking when installed, otherwise
+        case-insensitive substring matching of the whole value, then
+        ranking by words shared with each value, against tables built at
+        load time.
+        """
+        if process is not None:
+            matches = process.extract(
+                value, self._sorted_values[field_name], scorer=fuzz.WRatio,
+                limit=limit, score_cutoff=SUGGESTION_SCORE_CUTOFF
+            )
+            return [match for match, _score, _index in matches]
+        
+        # Find similar values for suggestions (simple string matching)
+        lowered = self._lowered_values[field_name]
+        needle = value.lower()
+        suggestions = [v for low, v in lowered if needle in low]
+        if not suggestions:
+            # Fall back to shared words, most shared first
+            query = _tokens(value)
+            scored = [
+                (len(tokens & query), v)
+                for tokens, v in self._value_tokens[field_name]
+                if not tokens.isdisjoint(query)
+            ]
+            scored.sort(key=lambda match: -match[0])  # stable: ties stay sorted
+            suggestions = [v for _shared, v in scored]
+        return suggestions[:limit]
+    
+    def validate_field(self, field_name: str, value: str,
+                       explain: bool = True) -> ValidationResult:
         """
         Validate a single field value against its schema.
         
         Args:
             field_name: Name of the semantic field (e.g., "domain")
             value: Value to validate
+            explain: If False, report invalid values with a short message
+                instead of building suggestions via explain_invalid()
             
         Returns:
             ValidationResult with validation status
@@ -248,7 +424,7 @@ class SchemaValidator:
         warnings = []
         
         # Check if schema exists
-        schema = self.get_schema(field_name)
+        schema = self._schemas.get(field_name)
         if not schema:
             errors.append(
                 f"Unknown field: '{field_name}'. "
@@ -256,15 +432,20 @@ class SchemaValidator:
             )
             return ValidationResult(valid=False, errors=errors, warnings=warnings)
         
-        # Check if value is in valid set
-        valid_values = self.get_valid_values(field_name)
-        if value not in valid_values:
-            errors.append(self.explain_invalid(field_name, value))
+        # Check if value is in valid set (precomputed at load time)
+        if value not in self._valid_values[field_name]:
+            if explain:
+                errors.append(self.explain_invalid(field_name, value))
+            else:
+                errors.append(
+                    f"Invalid value '{value}' for field '{field_name}'"
+                )
             return ValidationResult(valid=False, errors=errors, warnings=warnings)
         
         return ValidationResult(valid=True, errors=errors, warnings=warnings)
     
-    def validate_values(self, descriptor: Dict[str, str]) -> ValidationResult:
+    def validate_values(self, descriptor: Dict[str, str],
+                        explain: bool = True) -> ValidationResult:
         """
         Validate only the VALUES in a descriptor (does not check completeness).
         
@@ -273,30 +454,35 @@ class SchemaValidator:
         
         Args:
             descriptor: Dictionary mapping field names to values
+            explain: If False, skip building suggestions for invalid values
             
         Returns:
             ValidationResult with validation status
         """
         errors = []
         warnings = []
+        schemas = self._schemas
         
-        # Check for unknown fields
-        known_fields = set(self._schemas.keys())
-        provided_fields = set(descriptor.keys())
-        unknown = provided_fields - known_fields
+        # Validate each provided field (same checks as validate_field,
+        # inlined to avoid a ValidationResult per field)
+        unknown = []
+        for field_name, value in descriptor.items():
+            if field_name not in schemas:
+                unknown.append(field_name)
+                continue
+            if value not in self._valid_value_set(field_name):
+                if explain:
+                    errors.append(self.explain_invalid(field_name, value))
+                else:
+                    errors.append(
+                        f"Invalid value '{value}' for field '{field_name}'"
+                    )
         
         if unknown:
             warnings.append(
                 f"Unknown fields will be ignored: {', '.join(sorted(unknown))}"
             )
         
-        # Validate each provided field
-        for field_name, value in descriptor.items():
-            if field_name in known_fields:
-                result = self.validate_field(field_name, value)
-                errors.extend(result.errors)
-                warnings.extend(result.warnings)
-        
         return ValidationResult(
             valid=len(errors) == 0,
             errors=errors,
@@ -310,13 +496,10 @@ class SchemaValidator:
         Returns:
             Set of field names that are marked as required
         """
-        required = set()
-        for field_name, schema in self._schemas.items():
-            if schema.get('required', False):
-                required.add(field_name)
-        return required
+        return set(self._required_fields)
     
-    def validate_complete_descriptor(self, descriptor: Dict[str, str]) -> ValidationResult:
+    def validate_complete_descriptor(self, descriptor: Dict[str, str],
+                                     explain: bool = True) -> ValidationResult:
         """
         Validate a COMPLETE semantic descriptor (checks values AND completeness).
         
@@ -327,10 +510,14 @@ class SchemaValidator:
         
         Args:
             descriptor: Dictionary mapping field names to values
+            explain: If False, skip building suggestions for invalid values
             
         Returns:
             ValidationResult indicating if descriptor is valid and complete
         """
+        if self._complete_check(descriptor):
+            return ValidationResult(valid=True, errors=[], warnings=[])
+        
         errors = []
         warnings = []
         
@@ -345,7 +532,7 @@ class SchemaValidator:
             )
         
         # Validate all provided values
-        value_result = self.validate_values(descriptor)
+        value_result = self.validate_values(descriptor, explain=explain)
         errors.extend(value_result.errors)
         warnings.extend(value_result.warnings)
         
@@ -355,6 +542,55 @@ class SchemaValidator:
             warnings=warnings
         )
     
+    def validate_many(self, descriptors: List[Dict[str, str]],
+                      partial: bool = False,
+                      explain: bool = True) -> Tuple[List[bool], List[List[str]]]:
+        """
+        Validate a batch of descriptors in one pass per field.
+        
+        Gives the same verdicts and error messages as calling
+        validate_complete_descriptor() (or validate_values() when partial)
+        on each descriptor, without building a ValidationResult per row.
+        Each field's value table is looked up once for the whole batch.
+        Errors for a descriptor list missing fields first, then invalid
+        values in field-name order; unknown-field warnings are not reported.
+        
+        Args:
+            descriptors: Dictionaries mapping field names to values
+            partial: If True, only validate values (not completeness)
+            explain: If False, skip building suggestions for invalid values
+            
+        Returns:
+            Tuple of (valid flag per descriptor, error list per descriptor)
+        """
+        errors = [[] for _ in descriptors]
+        
+        if not partial:
+            required = self._required_fields
+            for row, descriptor in zip(errors, descriptors):
+                missing = required.difference(descriptor)
+                if missing:
+                    row.append(
+                        f"Missing required fields: {', '.join(sorted(missing))}"
+                    )
+        
+        schemas = self._schemas
+        fields = set().union(*descriptors)
+        for field_name in sorted(f for f in fields if f in schemas):
+            valid_values = self._valid_value_set(field_name)
+            for row, descriptor in zip(errors, descriptors):
+                if field_name not in descriptor:
+                    continue
+                value = descriptor[field_name]
+                if value in valid_values:
+                    continue
+                if explain:
+                    row.append(self.explain_invalid(field_name, value))
+                else:
+                    row.append(f"Invalid value '{value}' for field '{field_name}'")
+        
+        return [not row for row in errors], errors
+    
     def validate_descriptor(self, descriptor: Dict[str, str]) -> ValidationResult:
         """
         Validate a semantic descriptor (default: complete validation).
@@ -371,6 +607,18 @@ class SchemaValidator:
         return self.validate_complete_descriptor(descriptor)
 
 
+@lru_cache(maxsize=8)
+def _get_validator(version: str) -> SchemaValidator:
+    """
+    Return a shared validator for the default schema directory.
+    
+    Schema files are read and parsed once per version per process.
+    Validators are not modified after construction, so sharing them
+    between callers (and threads) is safe.
+    """
+    return SchemaValidator(version=version)
+
+
 def validate(descriptor: Dict[str, str], schema_version: str = "v1", 
              partial: bool = False) -> ValidationResult:
     """
@@ -384,7 +632,7 @@ def validate(descriptor: Dict[str, str], schema_version: str = "v1",
     Returns:
         ValidationResult
     """
-    validator = SchemaValidator(version=schema_version)
+    validator = _get_validator(schema_version)
     
     if partial:
         return validator.validate_values(descriptor)
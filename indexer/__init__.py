@@ -16,6 +16,7 @@ from .serialize import (
     JSONSerializer,
     NDJSONSerializer,
     CSVSerializer,
+    MsgpackSerializer,
     serialize,
     deserialize,
     save_to_file,
@@ -42,6 +43,7 @@ __all__ = [
     'JSONSerializer',
     'NDJSONSerializer',
     'CSVSerializer',
+    'MsgpackSerializer',
     'serialize',
     'deserialize',
     'save_to_file',
@@ -7,43 +7,106 @@ storage backends (files, directories, memory).
 Adapters are intentionally simple and do not implement indexing logic.
 """
 
-from typing import List, Optional, Dict, Any
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Any, Protocol, Tuple, runtime_checkable
 from pathlib import Path
-from abc import ABC, abstractmethod
 
 from indexer.index_text import IndexedText, TextIndex
 from indexer.serialize import (
     JSONSerializer,
     NDJSONSerializer,
     CSVSerializer,
-    save_to_file,
+    serialize,
     load_from_file,
 )
+from core import codec
 from core.errors import IndexingError
 
 
+# Upper bound on threads used by DirectoryAdapter for concurrent file I/O.
+MAX_IO_WORKERS = 32
+
+
+def _render(items: List[IndexedText], format: str) -> bytes:
+    """Serialize items to the exact bytes save_to_file would write."""
+    if format in ("ndjson", "jsonl"):
+        # newline-terminated, so the file stays appendable
+        return NDJSONSerializer.serialize_bytes(items)
+    payload = serialize(items, format=format)
+    if isinstance(payload, bytes):  # binary formats (msgpack)
+        return payload
+    return payload.encode("utf-8")
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """
+    (inode, size, mtime) of path, or None if it cannot be read.
+
+    Taken right after a write, it tells whether anything has replaced
+    or modified the file since.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
 # -------------------------
 # BASE ADAPTER
 # -------------------------
 
-class StorageAdapter(ABC):
-    """Abstract base class for storage adapters."""
+@runtime_checkable
+class StorageAdapter(Protocol):
+    """
+    Interface for storage adapters.
 
-    @abstractmethod
-    def save(self, index: TextIndex):
-        pass
+    Structural: any object with these methods can back an IndexManager.
+    The bundled adapters subclass it for documentation only.
+    """
+
+    def save(self, index: TextIndex) -> None:
+        ...
 
-    @abstractmethod
     def load(self) -> TextIndex:
-        pass
+        ...
 
-    @abstractmethod
     def exists(self) -> bool:
-        pass
+        ...
 
-    @abstractmethod
-    def delete(self):
-        pass
+    def delete(self) -> None:
+        ...
+
+
+# -------------------------
+# NDJSON APPEND SESSION
+# -------------------------
+
+class _NDJSONAppendSession:
+    """
+    Keeps an NDJSON file open for buffered appends.
+
+    Records are written through one large buffer and reach the file when
+    the buffer fills or the session closes.
+    """
+
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, filepath: Path):
+        self._fh = open(filepath, "ab", buffering=self.BUFFER_SIZE)
+
+    def append(self, item: IndexedText):
+        self._fh.write(codec.dumpb(item.to_dict()) + b"\n")
+
+    def append_many(self, items: List[IndexedText]):
+        self._fh.write(b"".join(codec.dumpb(item.to_dict()) + b"\n" for item in items))
+
+    def close(self):
+        self._fh.close()
 
 
 # -------------------------
@@ -55,6 +118,14 @@ class FileAdapter(StorageAdapter):
     File-based storage adapter.
 
     Supports JSON, NDJSON, and CSV formats.
+
+    The digest of the last payload written is remembered, so saving an
+    unchanged index does not touch the file again, unless the file has
+    been modified by another writer since.
+
+    NDJSON files get a companion "<name>.idx" file mapping item IDs to
+    byte offsets, which lets get_item() read a single record through
+    mmap without loading the whole index.
     """
 
     def __init__(
@@ -68,6 +139,11 @@ class FileAdapter(StorageAdapter):
         self.format = format or self._detect_format()
         self.validate_on_load = validate_on_load
         self.schema_version = schema_version
+        self._last_write_digest: Optional[bytes] = None
+        self._last_write_signature: Optional[Tuple[int, int, int]] = None
+        self._append_session: Optional[_NDJSONAppendSession] = None
+        self._offsets: Optional[Dict[str, int]] = None
+        self._offsets_size: Optional[int] = None
 
     def _detect_format(self) -> str:
         ext = self.filepath.suffix.lstrip(".").lower()
@@ -77,14 +153,41 @@ class FileAdapter(StorageAdapter):
             return "ndjson"
         if ext == "csv":
             return "csv"
+        if ext == "msgpack":
+            return "msgpack"
         return "json"
 
+    @property
+    def offsets_path(self) -> Path:
+        return self.filepath.with_name(self.filepath.name + ".idx")
+
     def save(self, index: TextIndex):
-        save_to_file(
-            index.get_all(),
-            self.filepath,
-            format=self.format,
-        )
+        items = index.get_all()
+        offsets = None
+        if self.format == "ndjson":
+            lines = [codec.dumpb(item.to_dict()) + b"\n" for item in items]
+            data = b"".join(lines)
+            offsets, position = {}, 0
+            for item, line in zip(items, lines):
+                offsets[item.id] = position
+                position += len(line)
+        else:
+            data = _render(items, self.format)
+
+        digest = hashlib.blake2b(data).digest()
+        if (
+            digest == self._last_write_digest
+            and _file_signature(self.filepath) == self._last_write_signature
+        ):
+            return
+
+        with open(self.filepath, "wb") as f:
+            f.write(data)
+        self._last_write_digest = digest
+        self._last_write_signature = _file_signature(self.filepath)
+
+        if offsets is not None:
+            self._store_offsets(offsets, len(data))
 
     def load(self) -> TextIndex:
         if not self.exists():
@@ -93,7 +196,10 @@ class FileAdapter(StorageAdapter):
                 schema_version=self.schema_version,
             )
 
-        items = load_from_file(self.filepath, format=self.format)
+        if self.format == "ndjson":
+            items = NDJSONSerializer.iter_from_file(self.filepath)
+        else:
+            items = load_from_file(self.filepath, format=self.format)
 
         index = TextIndex(
             validate_on_add=False,
@@ -108,16 +214,146 @@ class FileAdapter(StorageAdapter):
         return self.filepath.exists()
 
     def delete(self):
+        self._last_write_digest = None
+        self._offsets = self._offsets_size = None
         if self.exists():
             self.filepath.unlink()
+        if self.offsets_path.exists():
+            self.offsets_path.unlink()
 
-    def append(self, item: IndexedText):
-        if self.format != "ndjson":
+    @property
+    def supports_random_access(self) -> bool:
+        return self.format == "ndjson"
+
+    def get_item(self, item_id: str) -> Optional[IndexedText]:
+        """
+        Read one item from an NDJSON file without loading the index.
+
+        Uses the offset file when it matches the data file, and rebuilds
+        it with a single scan otherwise (e.g. after appends, or when the
+        file was rewritten by something other than this adapter).
+        """
+        if not self.supports_random_access:
+            raise IndexingError(
+                "Random access is only supported for NDJSON format"
+            )
+        if not self.exists():
+            return None
+
+        offsets = self._current_offsets()
+        if item_id not in offsets:
+            return None
+        data = self._read_record(offsets[item_id])
+        if data is None or data.get("id") != item_id:
+            offsets = self._current_offsets(rebuild=True)
+            if item_id not in offsets:
+                return None
+            data = self._read_record(offsets[item_id])
+        return IndexedText.from_dict(data)
+
+    def _read_record(self, offset: int) -> Optional[Dict[str, Any]]:
+        """The record starting at offset, or None if none starts there."""
+
+        with open(self.filepath, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b"\n", offset)
+            record = mm[offset:end if end != -1 else len(mm)]
+        try:
+            data = codec.loads(record)
+        except ValueError:  # offset no longer points at a record boundary
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _store_offsets(self, offsets: Dict[str, int], size: int):
+        self._offsets, self._offsets_size = offsets, size
+        # Best effort: the offsets are also kept in memory, and get_item()
+        # must keep working on read-only directories
+        try:
+            with open(self.offsets_path, "wb") as f:
+                f.write(codec.dumpb({"size": size, "offsets": offsets}))
+        except OSError:
+            pass
+
+    def _current_offsets(self, rebuild: bool = False) -> Dict[str, int]:
+        size = self.filepath.stat().st_size
+        if not rebuild and self._offsets is not None and self._offsets_size == size:
+            return self._offsets
+
+        if not rebuild and self.offsets_path.exists():
+            with open(self.offsets_path, "rb") as f:
+                stored = codec.loads(f.read())
+            if stored.get("size") == size:
+                self._offsets, self._offsets_size = stored["offsets"], size
+                return self._offsets
+
+        # Stale or missing: rebuild with one pass over the file
+        offsets = {}
+        if size:
+            with open(self.filepath, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                position = 0
+                for line in iter(mm.readline, b""):
+                    if line.strip():
+                        try:
+                            offsets[codec.loads(line)["id"]] = position
+                        except (ValueError, TypeError, KeyError) as e:
+                            raise IndexingError(
+                                f"Invalid NDJSON record at byte {position} "
+                                f"of {self.filepath}: {e}"
+                            ) from e
+                    position += len(line)
+        self._store_offsets(offsets, size)
+        return offsets
+
+    @property
+    def supports_append(self) -> bool:
+        return self.format == "ndjson"
+
+    def _check_append(self):
+        if not self.supports_append:
             raise IndexingError(
                 "Append operation only supported for NDJSON format"
             )
+        self._last_write_digest = None
 
-        NDJSONSerializer.append_to_file(item, self.filepath)
+    def append(self, item: IndexedText):
+        self._check_append()
+
+        if self._append_session is not None:
+            self._append_session.append(item)
+        else:
+            NDJSONSerializer.append_to_file(item, self.filepath)
+
+    def append_many(self, items: List[IndexedText]):
+        """Append several items with a single open and write."""
+        self._check_append()
+
+        if self._append_session is not None:
+            self._append_session.append_many(items)
+        else:
+            session = _NDJSONAppendSession(self.filepath)
+            try:
+                session.append_many(items)
+            finally:
+                session.close()
+
+    @contextmanager
+    def append_session(self) -> Iterator["FileAdapter"]:
+        """
+        Keep the NDJSON file open so append() calls inside the block are
+        buffered; everything is flushed when the block exits.
+        """
+        self._check_append()
+        if self._append_session is not None:  # already inside a session
+            yield self
+            return
+
+        self._append_session = _NDJSONAppendSession(self.filepath)
+        try:
+            yield self
+        finally:
+            self._append_session.close()
+            self._append_session = None
 
 
 # -------------------------
@@ -173,7 +409,10 @@ class DirectoryAdapter(StorageAdapter):
     """
     Directory-based storage adapter.
 
-    Stores each indexed text as a separate file.
+    Stores each indexed text as a separate file. Files whose content is
+    unchanged since this adapter last wrote them, and that nothing else
+    has modified since, are skipped; file reads and writes run on a
+    thread pool.
     """
 
     def __init__(
@@ -187,6 +426,8 @@ class DirectoryAdapter(StorageAdapter):
         self.format = format
         self.validate_on_load = validate_on_load
         self.schema_version = schema_version
+        # item id -> (payload digest, file signature) of the last write
+        self._written_digests: Dict[str, Tuple[bytes, Optional[Tuple[int, int, int]]]] = {}
 
     def _item_path(self, item_id: str) -> Path:
         path = (self.directory / f"{item_id}.{self.format}").resolve()
@@ -197,14 +438,39 @@ class DirectoryAdapter(StorageAdapter):
         return path
 
     def save(self, index: TextIndex):
+        self.save_items(index.get_all())
+
+    def save_items(self, items: List[IndexedText]):
+        """Write the given items, skipping files already up to date."""
         self.directory.mkdir(parents=True, exist_ok=True)
 
-        for item in index.get_all():
-            save_to_file(
-                [item],
-                self._item_path(item.id),
-                format=self.format,
-            )
+        pending = []
+        for item in items:
+            path = self._item_path(item.id)
+            data = _render([item], self.format)
+            digest = hashlib.blake2b(data).digest()
+            written = self._written_digests.get(item.id)
+            if (
+                written is not None
+                and written[0] == digest
+                and _file_signature(path) == written[1]
+            ):
+                continue
+            pending.append((item.id, path, data, digest))
+
+        if len(pending) > 1:
+            workers = min(MAX_IO_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._write, pending))
+        else:
+            for entry in pending:
+                self._write(entry)
+
+    def _write(self, entry):
+        item_id, path, data, digest = entry
+        with open(path, "wb") as f:
+            f.write(data)
+        self._written_digests[item_id] = (digest, _file_signature(path))
 
     def load(self) -> TextIndex:
         index = TextIndex(
@@ -215,30 +481,47 @@ class DirectoryAdapter(StorageAdapter):
         if not self.exists():
             return index
 
-        for path in self.directory.glob(f"*.{self.format}"):
-            items = load_from_file(path, format=self.format)
+        # scandir reports the entry type from the directory read itself,
+        # so no per-file stat() or Path construction is needed to filter.
+        suffix = f".{self.format}"
+        with os.scandir(self.directory) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(suffix)
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+        if len(paths) > 1:
+            workers = min(MAX_IO_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(self._read, paths))
+        else:
+            loaded = [self._read(path) for path in paths]
+
+        for items in loaded:
             index.bulk_load(items)
 
         return index
 
+    def _read(self, path: str) -> List[IndexedText]:
+        return load_from_file(path, format=self.format)
+
     def exists(self) -> bool:
         return self.directory.exists() and self.directory.is_dir()
 
     def delete(self):
+        self._written_digests.clear()
         if self.exists():
             import shutil
             shutil.rmtree(self.directory)
 
     def save_item(self, item: IndexedText):
-        self.directory.mkdir(parents=True, exist_ok=True)
-        save_to_file(
-            [item],
-            self._item_path(item.id),
-            format=self.format,
-        )
+        self.save_items([item])
 
     def delete_item(self, item_id: str):
         path = self._item_path(item_id)
+        self._written_digests.pop(item_id, None)
         if path.exists():
             path.unlink()
 
@@ -250,19 +533,40 @@ class DirectoryAdapter(StorageAdapter):
 class IndexManager:
     """
     High-level manager for TextIndex with automatic persistence.
+
+    Mutations mark the index dirty; auto-save only writes dirty indexes
+    and is deferred to the end of a batch() block. When the only changes
+    since the last write are additions and the adapter supports appends
+    (NDJSON files), auto-save appends the new items instead of
+    rewriting the whole file.
     """
 
     def __init__(self, adapter: StorageAdapter, auto_save: bool = True):
         self.adapter = adapter
         self.auto_save = auto_save
         self._index: Optional[TextIndex] = None
+        self._dirty = False
+        self._batch_depth = 0
+        self._pending_adds: List[IndexedText] = []
+        self._needs_rewrite = False
+        # index.version at the last write, or None if nothing is on disk
+        self._persisted_version: Optional[int] = None
 
     @property
     def index(self) -> TextIndex:
         if self._index is None:
             self._index = self.adapter.load()
+            self._mark_persisted()
         return self._index
 
+    def _mark_persisted(self):
+        self._dirty = False
+        self._needs_rewrite = False
+        self._pending_adds = []
+        self._persisted_version = (
+            self._index.version if self.adapter.exists() else None
+        )
+
     def add(
         self,
         text: str,
@@ -277,24 +581,36 @@ class IndexManager:
             **kwargs,
         )
 
-        if self.auto_save:
-            self.save()
+        self._pending_adds.append(item)
+        self._changed()
 
         return item
 
     def get(self, item_id: str) -> Optional[IndexedText]:
+        """
+        Return the item with item_id, or None.
+
+        Before the index has been loaded, adapters with random access
+        read just this record, so the item returned is a detached copy:
+        changing it does not change the index. Use update() to edit it.
+        """
+        if self._index is None and getattr(self.adapter, "supports_random_access", False):
+            # NDJSON file not loaded yet: read just this record
+            return self.adapter.get_item(item_id)
         return self.index.get(item_id)
 
     def remove(self, item_id: str) -> bool:
         removed = self.index.remove(item_id)
-        if removed and self.auto_save:
-            self.save()
+        if removed:
+            self._needs_rewrite = True
+            self._changed()
         return removed
 
     def update(self, item_id: str, **kwargs) -> Optional[IndexedText]:
         item = self.index.update(item_id, **kwargs)
-        if item and self.auto_save:
-            self.save()
+        if item:
+            self._needs_rewrite = True
+            self._changed()
         return item
 
     def filter_by_field(self, field_name: str, value: str) -> List[IndexedText]:
@@ -311,11 +627,52 @@ class IndexManager:
 
     def save(self):
         self.adapter.save(self.index)
+        self._mark_persisted()
 
     def reload(self):
         self._index = self.adapter.load()
+        self._mark_persisted()
 
     def clear(self):
         self.index.clear()
-        if self.auto_save:
+        self._needs_rewrite = True
+        self._changed()
+
+    def _changed(self):
+        self._dirty = True
+        if self.auto_save and not self._batch_depth:
+            self._flush()
+
+    def _flush(self):
+        """Persist pending changes, appending when only items were added."""
+        appendable = (
+            not self._needs_rewrite
+            and self._pending_adds
+            and self._persisted_version is not None
+            and getattr(self.adapter, "supports_append", False)
+            # Each add() bumps the version once; any other movement means
+            # self.index was edited directly and the file must be rewritten
+            and self.index.version == self._persisted_version + len(self._pending_adds)
+        )
+        if not appendable:
             self.save()
+            return
+
+        self.adapter.append_many(self._pending_adds)
+        self._mark_persisted()
+
+    @contextmanager
+    def batch(self) -> Iterator["IndexManager"]:
+        """
+        Group mutations so auto-save writes once, on exit.
+
+        Nested batches flush when the outermost one exits. Nothing is
+        written if the block raises.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if self.auto_save and not self._batch_depth and self._dirty:
+            self._flush()
@@ -8,20 +8,51 @@ Indexing logic is intentionally simple and deterministic.
 No ranking, scoring, or inference is performed here.
 """
 
-from typing import Dict, List, Optional, Set, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
+import bisect
 import hashlib
+import itertools
+import re
+import sys
 import uuid
 
-from core.descriptor import SemanticDescriptor
+from core.descriptor import SemanticDescriptor, STANDARD_FIELDS, field_revision
 from core.errors import IndexingError
 
 
 _REQUIRED_SERIALIZATION_KEYS = {"id", "text", "created_at", "updated_at"}
 
+# Metadata index bucket for values that cannot be dict keys
+_UNHASHABLE = object()
 
-@dataclass
+# Bumped by IndexedText.update_text()/update_descriptor(), so an index
+# can tell an item may have changed without going through update()
+_item_revision = 0
+
+def item_revision() -> int:
+    """Count of update_text()/update_descriptor() calls on any item."""
+    return _item_revision
+
+
+# Words of the lowercased text, as kept in the token index
+_find_tokens = re.compile(r"\w+").findall
+_is_token = re.compile(r"\w+").fullmatch
+
+# Algorithm behind content_hash. Hashes are only dedup keys, so speed
+# matters more than SHA-256 compatibility; stored hashes tagged with
+# anything else (including untagged legacy SHA-256) are recomputed on load.
+CONTENT_HASH_ALGORITHM = "blake2b"
+
+
+def compute_content_hash(text: str) -> str:
+    """Hex content hash of text used for deduplication (BLAKE2b-256)."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=32).hexdigest()
+
+
+@dataclass(slots=True)
 class IndexedText:
     """
     A text object paired with its semantic descriptor.
@@ -33,7 +64,9 @@ class IndexedText:
         metadata: Additional metadata (author, title, url, etc.)
         created_at: Timestamp when indexed
         updated_at: Timestamp of last update
-        content_hash: SHA-256 hash of text for deduplication
+        content_hash: BLAKE2b-256 hash of text for deduplication
+    
+    Instances use __slots__, so arbitrary attributes cannot be attached.
     """
     
     id: str
@@ -43,6 +76,19 @@ class IndexedText:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     content_hash: str = field(default="")
+    # (datetime, isoformat) pairs, reused by to_dict while the timestamp
+    # object is unchanged; reassigning created_at/updated_at invalidates them
+    _created_iso: Tuple[Optional[datetime], str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
+    _updated_iso: Tuple[Optional[datetime], str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
+    # (text, text.lower()) for case-insensitive matching, recomputed
+    # whenever text is a different object
+    _lowered: Tuple[Optional[str], str] = field(
+        default=(None, ""), init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Generate content hash if not provided."""
@@ -50,30 +96,56 @@ class IndexedText:
             self.content_hash = self._compute_hash()
     
     def _compute_hash(self) -> str:
-        """Compute SHA-256 hash of text content."""
-        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+        """Compute the content hash of text."""
+        return compute_content_hash(self.text)
     
     def update_text(self, new_text: str, content_hash: Optional[str] = None):
         """Update text content and refresh hash and timestamp."""
+        global _item_revision
         self.text = new_text
         self.content_hash = content_hash or self._compute_hash()
         self.updated_at = datetime.now(timezone.utc)
+        _item_revision += 1
     
     def update_descriptor(self, new_descriptor: SemanticDescriptor):
         """Update semantic descriptor and refresh timestamp."""
+        global _item_revision
         self.descriptor = new_descriptor
         self.updated_at = datetime.now(timezone.utc)
+        _item_revision += 1
+    
+    def lower_text(self) -> str:
+        """text.lower(), computed once per text value."""
+        text, lowered = self._lowered
+        if text is not self.text:
+            lowered = self.text.lower()
+            self._lowered = (self.text, lowered)
+        return lowered
+    
+    def _timestamps_iso(self) -> Tuple[str, str]:
+        """ISO strings of created_at and updated_at, formatted once per value."""
+        created, created_iso = self._created_iso
+        if created is not self.created_at:
+            created_iso = self.created_at.isoformat()
+            self._created_iso = (self.created_at, created_iso)
+        updated, updated_iso = self._updated_iso
+        if updated is not self.updated_at:
+            updated_iso = self.updated_at.isoformat()
+            self._updated_iso = (self.updated_at, updated_iso)
+        return created_iso, updated_iso
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
+        created_iso, updated_iso = self._timestamps_iso()
         return {
             "id": self.id,
             "text": self.text,
             "descriptor": self.descriptor.to_dict(),
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": created_iso,
+            "updated_at": updated_iso,
             "content_hash": self.content_hash,
+            "content_hash_algo": CONTENT_HASH_ALGORITHM,
         }
     
     @classmethod
@@ -87,14 +159,27 @@ class IndexedText:
 
         descriptor = SemanticDescriptor.from_dict(data.get("descriptor", {}))
         
+        # Metadata keys repeat across records; values are left as parsed
+        metadata = data.get("metadata", {})
+        if type(metadata) is dict:
+            metadata = {
+                sys.intern(k) if type(k) is str else k: v
+                for k, v in metadata.items()
+            }
+        
+        # Hashes from another algorithm would never match new inserts
+        content_hash = ""
+        if data.get("content_hash_algo") == CONTENT_HASH_ALGORITHM:
+            content_hash = data.get("content_hash", "")
+        
         return cls(
             id=data["id"],
             text=data["text"],
             descriptor=descriptor,
-            metadata=data.get("metadata", {}),
+            metadata=metadata,
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
-            content_hash=data.get("content_hash", ""),
+            content_hash=content_hash,
         )
 
 
@@ -104,6 +189,14 @@ class TextIndex:
     
     This class deliberately performs no ranking or scoring.
     Persistence is handled externally via adapters.
+    
+    Standard descriptor fields and metadata are also kept in inverted
+    indexes (field -> value -> item ids, metadata key -> value -> item
+    ids, word -> item ids), so the filter methods only touch matching
+    items. Items changed in place through IndexedText.update_text(),
+    update_descriptor() or a descriptor's set_field()/field assignment
+    are re-indexed before the next lookup; change metadata through
+    update(), as editing it in place is not seen by the indexes.
     """
     
     def __init__(self, validate_on_add: bool = True, schema_version: str = "v1"):
@@ -111,6 +204,158 @@ class TextIndex:
         self.schema_version = schema_version
         self._items: Dict[str, IndexedText] = {}
         self._hash_to_id: Dict[str, str] = {}
+        self._by_field: Dict[str, Dict[str, Set[str]]] = {
+            name: {} for name in STANDARD_FIELDS
+        }
+        # Distinct values of each indexed field, sorted for prefix ranges
+        self._sorted_values: Dict[str, List[str]] = {
+            name: [] for name in STANDARD_FIELDS
+        }
+        # Insertion sequence per id, so index lookups return items in
+        # the same order as a scan of _items
+        self._seq: Dict[str, int] = {}
+        self._counter = itertools.count()
+        # (created_at, seq, id) sorted by creation time, for range lookups;
+        # None once naive and aware timestamps are mixed and cannot be ordered
+        self._by_created: Optional[List[Tuple[datetime, int, str]]] = []
+        # Metadata key -> value -> ids; unhashable values share one bucket
+        # under _UNHASHABLE. The (key, bucket) pairs each item was indexed
+        # under are kept so it can be unindexed after its metadata changed.
+        self._by_metadata: Dict[str, Dict[Any, Set[str]]] = {}
+        self._metadata_entries: Dict[str, Tuple[Tuple[str, Any], ...]] = {}
+        # Word of the lowercased text -> ids, with the words each item
+        # was indexed under kept like the metadata entries
+        self._by_token: Dict[str, Set[str]] = {}
+        self._token_entries: Dict[str, Tuple[str, ...]] = {}
+        # (text, content_hash, descriptor, standard field values) each
+        # item was indexed under, to spot and undo in-place changes
+        self._indexed_state: Dict[
+            str, Tuple[str, str, SemanticDescriptor, Tuple[Optional[str], ...]]
+        ] = {}
+        # (field_revision(), _item_revision) the indexes were last checked at
+        self._synced = (field_revision(), _item_revision)
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped by every write, for invalidating cached queries."""
+        self._sync()
+        return self._version
+    
+    def _field_values(self, descriptor: SemanticDescriptor) -> Tuple[Optional[str], ...]:
+        return tuple(getattr(descriptor, name) for name in self._by_field)
+    
+    def _sync(self) -> None:
+        """
+        Re-index items changed in place since the last check.
+        
+        Only runs a scan when some descriptor field was reassigned or some
+        item's update_text()/update_descriptor() was called, anywhere.
+        """
+        revision = (field_revision(), _item_revision)
+        if revision == self._synced:
+            return
+        self._synced = revision
+        stale = []
+        for item in self._items.values():
+            text, _, descriptor, values = self._indexed_state[item.id]
+            if (
+                item.text is not text
+                or item.descriptor is not descriptor
+                or self._field_values(descriptor) != values
+            ):
+                stale.append(item)
+        for item in stale:
+            old_hash = self._indexed_state[item.id][1]
+            if self._hash_to_id.get(old_hash) == item.id:
+                del self._hash_to_id[old_hash]
+            self._unindex_item(item)
+            self._index_item(item)
+            self._hash_to_id[item.content_hash] = item.id
+        if stale:
+            self._version += 1
+    
+    def _index_item(self, item: IndexedText) -> None:
+        """Add item's standard field values to the field index."""
+        seq = self._seq.setdefault(item.id, next(self._counter))
+        if self._by_created is not None:
+            try:
+                bisect.insort(self._by_created, (item.created_at, seq, item.id))
+            except TypeError:
+                self._by_created = None
+        entries = []
+        for key, value in item.metadata.items():
+            buckets = self._by_metadata.setdefault(key, {})
+            try:
+                ids = buckets.setdefault(value, set())
+            except TypeError:
+                value = _UNHASHABLE
+                ids = buckets.setdefault(value, set())
+            ids.add(item.id)
+            entries.append((key, value))
+        self._metadata_entries[item.id] = tuple(entries)
+        tokens = tuple(set(_find_tokens(item.lower_text())))
+        for token in tokens:
+            ids = self._by_token.get(token)
+            if ids is None:
+                self._by_token[token] = {item.id}
+            else:
+                ids.add(item.id)
+        self._token_entries[item.id] = tokens
+        descriptor = item.descriptor
+        field_values = self._field_values(descriptor)
+        self._indexed_state[item.id] = (
+            item.text, item.content_hash, descriptor, field_values
+        )
+        for (field_name, values), value in zip(self._by_field.items(), field_values):
+            if value is not None:
+                ids = values.get(value)
+                if ids is None:
+                    values[value] = {item.id}
+                    bisect.insort(self._sorted_values[field_name], value)
+                else:
+                    ids.add(item.id)
+    
+    def _unindex_item(self, item: IndexedText) -> None:
+        """Remove item's standard field values from the field index."""
+        if self._by_created is not None:
+            entry = (item.created_at, self._seq[item.id], item.id)
+            try:
+                i = bisect.bisect_left(self._by_created, entry)
+            except TypeError:
+                i = len(self._by_created)
+            if i < len(self._by_created) and self._by_created[i] == entry:
+                del self._by_created[i]
+            else:
+                # created_at was reassigned after indexing
+                self._by_created = [e for e in self._by_created if e[2] != item.id]
+        for key, value in self._metadata_entries.pop(item.id, ()):
+            buckets = self._by_metadata[key]
+            ids = buckets[value]
+            ids.discard(item.id)
+            if not ids:
+                del buckets[value]
+                if not buckets:
+                    del self._by_metadata[key]
+        for token in self._token_entries.pop(item.id, ()):
+            ids = self._by_token[token]
+            ids.discard(item.id)
+            if not ids:
+                del self._by_token[token]
+        field_values = self._indexed_state.pop(item.id)[3]
+        for (field_name, values), value in zip(self._by_field.items(), field_values):
+            ids = values.get(value)
+            if ids is not None:
+                ids.discard(item.id)
+                if not ids:
+                    del values[value]
+                    sorted_values = self._sorted_values[field_name]
+                    del sorted_values[bisect.bisect_left(sorted_values, value)]
+    
+    def _ordered(self, ids) -> List[IndexedText]:
+        """Items for ids, in insertion order."""
+        items = self._items
+        return [items[i] for i in sorted(ids, key=self._seq.__getitem__)]
     
     def add(
         self,
@@ -123,13 +368,50 @@ class TextIndex:
         """Add text with semantic descriptor to index."""
         
         if self.validate_on_add:
-            result = descriptor.validate(schema_version=self.schema_version)
-            if not result:
-                raise IndexingError(
-                    "Descriptor validation failed: "
-                    + "; ".join(result.errors)
-                )
+            self._check_descriptor(descriptor)
+        
+        return self._insert(text, descriptor, metadata, item_id, allow_duplicates)
+    
+    def add_many(
+        self,
+        entries: Iterable[Tuple[str, SemanticDescriptor, Optional[Dict[str, Any]]]],
+        allow_duplicates: bool = False,
+    ) -> List[IndexedText]:
+        """
+        Add many (text, descriptor, metadata) entries.
         
+        All descriptors are validated before anything is inserted, so an
+        invalid descriptor leaves the index unchanged.
+        """
+        entries = list(entries)
+        if self.validate_on_add:
+            for _text, descriptor, _metadata in entries:
+                self._check_descriptor(descriptor)
+        
+        insert = self._insert
+        return [
+            insert(text, descriptor, metadata, None, allow_duplicates)
+            for text, descriptor, metadata in entries
+        ]
+    
+    def _check_descriptor(self, descriptor: SemanticDescriptor) -> None:
+        """Raise IndexingError unless descriptor passes complete validation."""
+        result = descriptor.validate(schema_version=self.schema_version)
+        if not result:
+            raise IndexingError(
+                "Descriptor validation failed: "
+                + "; ".join(result.errors)
+            )
+    
+    def _insert(
+        self,
+        text: str,
+        descriptor: SemanticDescriptor,
+        metadata: Optional[Dict[str, Any]],
+        item_id: Optional[str],
+        allow_duplicates: bool,
+    ) -> IndexedText:
+        """Insert one already-validated entry."""
         if item_id is None:
             item_id = str(uuid.uuid4())
         elif item_id in self._items:
@@ -137,7 +419,7 @@ class TextIndex:
                 f"Item with ID '{item_id}' already exists. Use update() instead."
             )
         
-        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        content_hash = compute_content_hash(text)
         
         if not allow_duplicates and content_hash in self._hash_to_id:
             existing_id = self._hash_to_id[content_hash]
@@ -155,6 +437,8 @@ class TextIndex:
         
         self._items[item_id] = item
         self._hash_to_id[content_hash] = item_id
+        self._index_item(item)
+        self._version += 1
         
         return item
     
@@ -164,9 +448,13 @@ class TextIndex:
     
     def remove(self, item_id: str) -> bool:
         """Remove indexed text by ID."""
+        self._sync()
         item = self._items.pop(item_id, None)
         if item:
             self._hash_to_id.pop(item.content_hash, None)
+            self._unindex_item(item)
+            del self._seq[item_id]
+            self._version += 1
             return True
         return False
     
@@ -179,12 +467,14 @@ class TextIndex:
         allow_duplicates: bool = False,
     ) -> Optional[IndexedText]:
         """Update an indexed text item."""
+        self._sync()
         item = self._items.get(item_id)
         if not item:
             return None
         
+        self._version += 1
         if text is not None:
-            new_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            new_hash = compute_content_hash(text)
             if not allow_duplicates and new_hash in self._hash_to_id:
                 existing_id = self._hash_to_id[new_hash]
                 if existing_id != item_id:
@@ -192,27 +482,34 @@ class TextIndex:
                         f"Duplicate content detected (existing id: {existing_id})"
                     )
             self._hash_to_id.pop(item.content_hash, None)
+            self._unindex_item(item)
             item.update_text(text, content_hash=new_hash)
+            self._index_item(item)
             self._hash_to_id[new_hash] = item_id
         
         if descriptor is not None:
             if self.validate_on_add:
-                result = descriptor.validate(schema_version=self.schema_version)
-                if not result:
-                    raise IndexingError(
-                        "Descriptor validation failed: "
-                        + "; ".join(result.errors)
-                    )
+                self._check_descriptor(descriptor)
+            self._unindex_item(item)
             item.update_descriptor(descriptor)
+            self._index_item(item)
         
         if metadata is not None:
+            self._unindex_item(item)
             item.metadata.update(metadata)
             item.updated_at = datetime.now(timezone.utc)
+            self._index_item(item)
         
+        # The item changes above were indexed already
+        self._synced = (field_revision(), _item_revision)
         return item
     
     def filter_by_field(self, field_name: str, value: str) -> List[IndexedText]:
         """Filter indexed texts by exact field match."""
+        self._sync()
+        values = self._by_field.get(field_name.lower())
+        if values is not None and value is not None:
+            return self._ordered(values.get(value, ()))
         return [
             item
             for item in self._items.values()
@@ -221,6 +518,19 @@ class TextIndex:
     
     def filter_by_fields(self, filters: Dict[str, str]) -> List[IndexedText]:
         """Filter indexed texts by multiple fields (AND logic)."""
+        self._sync()
+        buckets = []
+        for k, v in filters.items():
+            values = self._by_field.get(k.lower())
+            if values is None or v is None:
+                break
+            buckets.append(values.get(v, set()))
+        else:
+            if buckets:
+                # Intersect starting from the smallest candidate set
+                buckets.sort(key=len)
+                return self._ordered(buckets[0].intersection(*buckets[1:]))
+        
         results = []
         for item in self._items.values():
             if all(
@@ -233,6 +543,11 @@ class TextIndex:
     def filter_by_prefix(self, field_name: str, prefix: str) -> List[IndexedText]:
         """Filter indexed texts by hierarchical prefix."""
         delimiter = f"{prefix} → "
+        ids = self.ids_with_prefix(field_name, delimiter)
+        if ids is not None:
+            if prefix:
+                ids |= self.ids_with_values(field_name, (prefix,))
+            return self._ordered(ids)
         return [
             item
             for item in self._items.values()
@@ -240,12 +555,148 @@ class TextIndex:
             and (value == prefix or value.startswith(delimiter))
         ]
     
+    def ids_with_values(self, field_name: str,
+                        values: Iterable[str]) -> Optional[Set[str]]:
+        """
+        Return ids of items whose field equals any of values.
+        
+        Returns None when the field is not in the field index (custom
+        fields), so callers can fall back to a scan.
+        """
+        self._sync()
+        index = self._by_field.get(field_name.lower())
+        if index is None:
+            return None
+        ids = set()
+        for value in values:
+            ids.update(index.get(value, ()))
+        return ids
+    
+    def ids_with_prefix(self, field_name: str, prefix: str) -> Optional[Set[str]]:
+        """
+        Return ids of items whose field value starts with prefix.
+        
+        Returns None when the field is not in the field index.
+        """
+        self._sync()
+        index = self._by_field.get(field_name.lower())
+        if index is None:
+            return None
+        # Values sharing a prefix form one contiguous run of the sorted values
+        ids = set()
+        sorted_values = self._sorted_values[field_name.lower()]
+        i = bisect.bisect_left(sorted_values, prefix)
+        while i < len(sorted_values) and sorted_values[i].startswith(prefix):
+            ids.update(index[sorted_values[i]])
+            i += 1
+        return ids
+    
+    def ids_where(self, field_name: str,
+                  value_test: Callable[[str], bool]) -> Optional[Set[str]]:
+        """
+        Return ids of items whose field value satisfies value_test.
+        
+        value_test is called once per distinct value, not once per item.
+        Returns None when the field is not in the field index.
+        """
+        self._sync()
+        index = self._by_field.get(field_name.lower())
+        if index is None:
+            return None
+        return self.ids_with_values(field_name, [v for v in index if value_test(v)])
+    
+    def ids_created(self, after: Optional[datetime] = None,
+                    before: Optional[datetime] = None) -> Optional[Set[str]]:
+        """
+        Return ids of items created strictly between after and before.
+        
+        Either bound may be omitted. Returns None when the stored
+        timestamps cannot be ordered (naive mixed with aware).
+        """
+        entries = self._by_created
+        if entries is None:
+            return None
+        created = itemgetter(0)
+        lo = 0 if after is None else bisect.bisect_right(entries, after, key=created)
+        hi = len(entries) if before is None else bisect.bisect_left(entries, before, key=created)
+        return {entry[2] for entry in entries[lo:hi]}
+    
+    def ids_with_metadata(self, key: str, value: Any) -> Optional[Set[str]]:
+        """
+        Return ids of items whose metadata may have key == value.
+        
+        Items holding an unhashable value under key are always included,
+        so the result can be a superset. Returns None when value itself
+        is unhashable.
+        """
+        buckets = self._by_metadata.get(key)
+        if buckets is None:
+            return set()
+        try:
+            ids = set(buckets.get(value, ()))
+        except TypeError:
+            return None
+        ids.update(buckets.get(_UNHASHABLE, ()))
+        return ids
+    
+    def ids_with_metadata_key(self, key: str) -> Set[str]:
+        """Return ids of items whose metadata has key."""
+        ids = set()
+        for bucket in self._by_metadata.get(key, {}).values():
+            ids.update(bucket)
+        return ids
+    
+    def ids_containing(self, substring: str) -> Optional[Set[str]]:
+        """
+        Ids of items whose lowercased text contains substring.lower(),
+        from the token index: a run of word characters can only occur
+        inside a word, so only words containing it are looked at.
+        None when the lowered substring is not made of word characters.
+        """
+        needle = substring.lower()
+        if not _is_token(needle):
+            return None
+        self._sync()
+        ids = set()
+        for token, token_ids in self._by_token.items():
+            if needle in token:
+                ids.update(token_ids)
+        return ids
+    
+    def all_ids(self) -> Set[str]:
+        """Ids of every indexed item."""
+        return set(self._items)
+    
+    def get_many(self, item_ids: Iterable[str]) -> List[IndexedText]:
+        """Return the items for item_ids, in insertion order."""
+        return self._ordered(i for i in set(item_ids) if i in self._items)
+    
+    def scan_text(self, substrings: Iterable[str],
+                  case_sensitive: bool = False) -> Set[str]:
+        """
+        Return ids of items whose text contains any of the substrings.
+        
+        All substrings are compiled into one pattern, so the index is
+        scanned once regardless of how many there are.
+        """
+        needles = [s if case_sensitive else s.lower() for s in substrings]
+        if not needles:
+            return set()
+        search = re.compile("|".join(map(re.escape, needles))).search
+        if case_sensitive:
+            return {i for i, item in self._items.items() if search(item.text)}
+        return {i for i, item in self._items.items() if search(item.lower_text())}
+    
     def get_all(self) -> List[IndexedText]:
         """Return all indexed items."""
         return list(self._items.values())
     
     def get_field_values(self, field_name: str) -> Set[str]:
         """Get all unique values for a given field."""
+        self._sync()
+        values = self._by_field.get(field_name.lower())
+        if values is not None:
+            return set(values)
         return {
             value
             for item in self._items.values()
@@ -256,16 +707,42 @@ class TextIndex:
         """Return number of indexed items."""
         return len(self._items)
     
-    def bulk_load(self, items: List["IndexedText"]) -> None:
-        """Load items directly into the index, bypassing validation and dedup checks."""
-        for item in items:
-            self._items[item.id] = item
-            self._hash_to_id[item.content_hash] = item.id
+    def bulk_load(self, items: Iterable["IndexedText"]) -> None:
+        """
+        Load items directly into the index, bypassing validation and dedup checks.
+        
+        items may be any iterable (e.g. a generator streaming from a file);
+        it is consumed once, without building an intermediate list.
+        """
+        by_id = self._items
+        by_hash = self._hash_to_id
+        try:
+            for item in items:
+                previous = by_id.get(item.id)
+                if previous is not None:
+                    self._unindex_item(previous)
+                by_id[item.id] = item
+                by_hash[item.content_hash] = item.id
+                self._index_item(item)
+        finally:
+            self._version += 1
     
     def clear(self):
         """Clear the index."""
         self._items.clear()
         self._hash_to_id.clear()
+        for values in self._by_field.values():
+            values.clear()
+        for sorted_values in self._sorted_values.values():
+            sorted_values.clear()
+        self._seq.clear()
+        self._by_created = []
+        self._by_metadata.clear()
+        self._metadata_entries.clear()
+        self._by_token.clear()
+        self._token_entries.clear()
+        self._indexed_state.clear()
+        self._version += 1
     
     def to_list(self) -> List[Dict[str, Any]]:
         """Convert index to list of dictionaries."""
@@ -274,18 +751,17 @@ class TextIndex:
     @classmethod
     def from_list(
         cls,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         validate_on_add: bool = True,
         schema_version: str = "v1",
     ) -> "TextIndex":
-        """Create TextIndex from serialized list."""
+        """Create TextIndex from serialized records (a list or any iterable)."""
         index = cls(
             validate_on_add=validate_on_add,
             schema_version=schema_version,
         )
         
-        items = [IndexedText.from_dict(item_data) for item_data in data]
-        index.bulk_load(items)
+        index.bulk_load(IndexedText.from_dict(item_data) for item_data in data)
         
         return index
 
@@ -10,11 +10,17 @@ No validation, ranking, or inference is performed here.
 
 import json
 import csv
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from io import StringIO
 
-from indexer.index_text import IndexedText
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only needed for the msgpack format
+    msgpack = None
+
+from indexer.index_text import CONTENT_HASH_ALGORITHM, IndexedText
+from core import codec
 from core.descriptor import SemanticDescriptor, STANDARD_FIELDS
 from core.errors import IndexingError
 
@@ -48,15 +54,14 @@ class JSONSerializer(Serializer):
 
     @staticmethod
     def serialize(items: List[IndexedText], indent: int = 2) -> str:
-        return json.dumps(
+        return codec.dumps(
             [item.to_dict() for item in items],
             indent=indent,
-            ensure_ascii=False,
         )
 
     @staticmethod
     def deserialize(data: str, max_items: Optional[int] = None) -> List[IndexedText]:
-        items_data = json.loads(data)
+        items_data = codec.loads(data)
         if max_items is not None and len(items_data) > max_items:
             raise IndexingError(
                 f"Input exceeds max_items limit of {max_items} "
@@ -70,20 +75,19 @@ class JSONSerializer(Serializer):
         filepath: Path,
         indent: int = 2,
     ):
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(
-                [item.to_dict() for item in items],
-                f,
-                indent=indent,
-                ensure_ascii=False,
-            )
+        payload = codec.dumpb(
+            [item.to_dict() for item in items],
+            indent=indent,
+        )
+        with open(filepath, "wb") as f:
+            f.write(payload)
 
     @staticmethod
     def deserialize_from_file(filepath: Path) -> List[IndexedText]:
-        with open(filepath, "r", encoding="utf-8") as f:
+        with open(filepath, "rb") as f:
             return [
                 IndexedText.from_dict(d)
-                for d in json.load(f)
+                for d in codec.loads(f.read())
             ]
 
 
@@ -101,10 +105,16 @@ class NDJSONSerializer(Serializer):
 
     @staticmethod
     def serialize(items: List[IndexedText]) -> str:
-        return "\n".join(
-            json.dumps(item.to_dict(), ensure_ascii=False)
-            for item in items
-        )
+        return NDJSONSerializer.serialize_bytes(items)[:-1].decode("utf-8")
+
+    @staticmethod
+    def serialize_bytes(items: List[IndexedText]) -> bytes:
+        """Serialize to UTF-8 bytes, each record terminated by a newline."""
+        buf = bytearray()
+        for item in items:
+            buf += codec.dumpb(item.to_dict())
+            buf += b"\n"
+        return bytes(buf)
 
     @staticmethod
     def deserialize(data: str, max_items: Optional[int] = None) -> List[IndexedText]:
@@ -116,35 +126,31 @@ class NDJSONSerializer(Serializer):
                         f"Input exceeds max_items limit of {max_items}"
                     )
                 items.append(
-                    IndexedText.from_dict(json.loads(line))
+                    IndexedText.from_dict(codec.loads(line))
                 )
         return items
 
     @staticmethod
     def serialize_to_file(items: List[IndexedText], filepath: Path):
-        with open(filepath, "w", encoding="utf-8") as f:
-            for item in items:
-                f.write(
-                    json.dumps(item.to_dict(), ensure_ascii=False) + "\n"
-                )
+        with open(filepath, "wb") as f:
+            f.writelines(codec.dumpb(item.to_dict()) + b"\n" for item in items)
 
     @staticmethod
     def deserialize_from_file(filepath: Path) -> List[IndexedText]:
-        items = []
-        with open(filepath, "r", encoding="utf-8") as f:
+        return list(NDJSONSerializer.iter_from_file(filepath))
+
+    @staticmethod
+    def iter_from_file(filepath: Path) -> Iterator[IndexedText]:
+        """Yield items one line at a time, without reading the whole file."""
+        with open(filepath, "rb") as f:
             for line in f:
                 if line.strip():
-                    items.append(
-                        IndexedText.from_dict(json.loads(line))
-                    )
-        return items
+                    yield IndexedText.from_dict(codec.loads(line))
 
     @staticmethod
     def append_to_file(item: IndexedText, filepath: Path):
-        with open(filepath, "a", encoding="utf-8") as f:
-            f.write(
-                json.dumps(item.to_dict(), ensure_ascii=False) + "\n"
-            )
+        with open(filepath, "ab") as f:
+            f.write(codec.dumpb(item.to_dict()) + b"\n")
 
 
 # -------------------------
@@ -171,25 +177,35 @@ class CSVSerializer(Serializer):
         "created_at",
         "updated_at",
         "content_hash",
+        "content_hash_algo",
     ]
 
     @staticmethod
-    def _flatten(item: IndexedText) -> Dict[str, str]:
-        descriptor = item.descriptor.to_dict()
-
-        return {
-            "id": item.id,
-            "text": item.text,
-            "domain": descriptor.get("domain", ""),
-            "intent": descriptor.get("intent", ""),
-            "tone": descriptor.get("tone", ""),
-            "audience": descriptor.get("audience", ""),
-            "stability": descriptor.get("stability", ""),
-            "metadata": json.dumps(item.metadata, ensure_ascii=False),
-            "created_at": item.created_at.isoformat(),
-            "updated_at": item.updated_at.isoformat(),
-            "content_hash": item.content_hash,
-        }
+    def _flatten(item: IndexedText) -> Tuple[str, ...]:
+        """One CSV row in FIELDNAMES order."""
+        descriptor = item.descriptor
+        created_iso, updated_iso = item._timestamps_iso()
+
+        return (
+            item.id,
+            item.text,
+            descriptor.domain or "",
+            descriptor.intent or "",
+            descriptor.tone or "",
+            descriptor.audience or "",
+            descriptor.stability or "",
+            json.dumps(item.metadata, ensure_ascii=False),
+            created_iso,
+            updated_iso,
+            item.content_hash,
+            CONTENT_HASH_ALGORITHM,
+        )
+
+    @staticmethod
+    def _write_rows(f, items: List[IndexedText]):
+        writer = csv.writer(f)
+        writer.writerow(CSVSerializer.FIELDNAMES)
+        writer.writerows(map(CSVSerializer._flatten, items))
 
     @staticmethod
     def _unflatten(row: Dict[str, str]) -> IndexedText:
@@ -207,17 +223,13 @@ class CSVSerializer(Serializer):
             "created_at": row["created_at"],
             "updated_at": row["updated_at"],
             "content_hash": row.get("content_hash", ""),
+            "content_hash_algo": row.get("content_hash_algo"),
         })
 
     @staticmethod
     def serialize(items: List[IndexedText]) -> str:
         output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=CSVSerializer.FIELDNAMES)
-        writer.writeheader()
-
-        for item in items:
-            writer.writerow(CSVSerializer._flatten(item))
-
+        CSVSerializer._write_rows(output, items)
         return output.getvalue()
 
     @staticmethod
@@ -235,10 +247,7 @@ class CSVSerializer(Serializer):
     @staticmethod
     def serialize_to_file(items: List[IndexedText], filepath: Path):
         with open(filepath, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=CSVSerializer.FIELDNAMES)
-            writer.writeheader()
-            for item in items:
-                writer.writerow(CSVSerializer._flatten(item))
+            CSVSerializer._write_rows(f, items)
 
     @staticmethod
     def deserialize_from_file(filepath: Path) -> List[IndexedText]:
@@ -247,6 +256,55 @@ class CSVSerializer(Serializer):
             return [CSVSerializer._unflatten(row) for row in reader]
 
 
+# -------------------------
+# MSGPACK
+# -------------------------
+
+class MsgpackSerializer(Serializer):
+    """
+    msgpack serialization for indexed texts.
+
+    The same records as the JSON format, packed as one binary array.
+    Works on bytes rather than str. Requires the optional msgpack package.
+    """
+
+    @staticmethod
+    def _require_msgpack():
+        if msgpack is None:
+            raise ImportError("msgpack is required for the msgpack format")
+
+    @staticmethod
+    def serialize(items: List[IndexedText]) -> bytes:
+        MsgpackSerializer._require_msgpack()
+        return msgpack.packb([item.to_dict() for item in items])
+
+    @staticmethod
+    def deserialize(data: bytes, max_items: Optional[int] = None) -> List[IndexedText]:
+        MsgpackSerializer._require_msgpack()
+        items_data = msgpack.unpackb(data, raw=False)
+        if not isinstance(items_data, list):
+            raise IndexingError(
+                f"msgpack data must represent an array, got {type(items_data).__name__}"
+            )
+        if max_items is not None and len(items_data) > max_items:
+            raise IndexingError(
+                f"Input exceeds max_items limit of {max_items} "
+                f"(got {len(items_data)} records)"
+            )
+        return [IndexedText.from_dict(d) for d in items_data]
+
+    @staticmethod
+    def serialize_to_file(items: List[IndexedText], filepath: Path):
+        payload = MsgpackSerializer.serialize(items)
+        with open(filepath, "wb") as f:
+            f.write(payload)
+
+    @staticmethod
+    def deserialize_from_file(filepath: Path) -> List[IndexedText]:
+        with open(filepath, "rb") as f:
+            return MsgpackSerializer.deserialize(f.read())
+
+
 # -------------------------
 # FORMAT REGISTRY
 # -------------------------
@@ -256,6 +314,7 @@ SERIALIZERS = {
     "ndjson": NDJSONSerializer,
     "jsonl": NDJSONSerializer,
     "csv": CSVSerializer,
+    "msgpack": MsgpackSerializer,
 }
 
 
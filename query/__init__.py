@@ -31,6 +31,7 @@ from .predicates import (
 from .filters import (
     Filter,
     filter_items,
+    filter_items_parallel,
     filter_index,
     find_by_domain,
     find_by_intent,
@@ -85,6 +86,7 @@ __all__ = [
     # Filters
     'Filter',
     'filter_items',
+    'filter_items_parallel',
     'filter_index',
     'find_by_domain',
     'find_by_intent',
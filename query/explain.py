@@ -6,10 +6,20 @@ This module provides human-readable explanations of queries and query results.
 
 from typing import List, Dict, Any, Optional
 from collections import Counter
+from functools import singledispatch
+from operator import attrgetter
 
 from core.descriptor import STANDARD_FIELDS
 from indexer import IndexedText
-from .predicates import Predicate
+from .predicates import (
+    Predicate,
+    AndPredicate,
+    OrPredicate,
+    NotPredicate,
+    FieldEquals,
+    HierarchyMatches,
+    TextContains,
+)
 from .query_builder import QueryResult
 
 
@@ -75,13 +85,13 @@ def analyze_field_distribution(items: List[IndexedText]) -> Dict[str, Counter]:
     Analyze distribution of field values in items.
     """
     distribution = {}
+    descriptors = [item.descriptor for item in items]
 
     for field_name in sorted(STANDARD_FIELDS):
-        counter = Counter()
-        for item in items:
-            value = item.descriptor.get_field(field_name)
-            if value:
-                counter[value] += 1
+        # Counter counts an iterable in C; unset values are dropped after
+        counter = Counter(map(attrgetter(field_name), descriptors))
+        counter.pop(None, None)
+        counter.pop("", None)
 
         if counter:
             distribution[field_name] = counter
@@ -89,33 +99,44 @@ def analyze_field_distribution(items: List[IndexedText]) -> Dict[str, Counter]:
     return distribution
 
 
-def explain_predicate_tree(predicate: Predicate, indent: int = 0) -> str:
-    """
-    Generate tree visualization of predicate structure.
-    """
-    from .predicates import AndPredicate, OrPredicate, NotPredicate
+# Predicate-tree walkers dispatch on the predicate's type through
+# functools.singledispatch (one cached dict lookup per node, subclasses
+# included) instead of an isinstance chain.
 
-    prefix = "  " * indent
+@singledispatch
+def _tree_text(predicate: Predicate, indent: int) -> str:
+    return f"{'  ' * indent}• {predicate.explain()}"
 
-    if isinstance(predicate, AndPredicate):
-        lines = [f"{prefix}AND:"]
-        for p in predicate.predicates:
-            lines.append(explain_predicate_tree(p, indent + 1))
-        return "\n".join(lines)
 
-    elif isinstance(predicate, OrPredicate):
-        lines = [f"{prefix}OR:"]
-        for p in predicate.predicates:
-            lines.append(explain_predicate_tree(p, indent + 1))
-        return "\n".join(lines)
+@_tree_text.register
+def _(predicate: AndPredicate, indent: int) -> str:
+    lines = [f"{'  ' * indent}AND:"]
+    for p in predicate.predicates:
+        lines.append(_tree_text(p, indent + 1))
+    return "\n".join(lines)
 
-    elif isinstance(predicate, NotPredicate):
-        lines = [f"{prefix}NOT:"]
-        lines.append(explain_predicate_tree(predicate.predicate, indent + 1))
-        return "\n".join(lines)
 
-    else:
-        return f"{prefix}• {predicate.explain()}"
+@_tree_text.register
+def _(predicate: OrPredicate, indent: int) -> str:
+    lines = [f"{'  ' * indent}OR:"]
+    for p in predicate.predicates:
+        lines.append(_tree_text(p, indent + 1))
+    return "\n".join(lines)
+
+
+@_tree_text.register
+def _(predicate: NotPredicate, indent: int) -> str:
+    return "\n".join([
+        f"{'  ' * indent}NOT:",
+        _tree_text(predicate.predicate, indent + 1),
+    ])
+
+
+def explain_predicate_tree(predicate: Predicate, indent: int = 0) -> str:
+    """
+    Generate tree visualization of predicate structure.
+    """
+    return _tree_text(predicate, indent)
 
 
 def summarize_results(items: List[IndexedText], max_items: int = 10) -> str:
@@ -175,6 +196,46 @@ def compare_queries(result1: QueryResult, result2: QueryResult) -> str:
     return "\n".join(lines)
 
 
+@singledispatch
+def _match_lines(pred: Predicate, item: IndexedText, indent: str) -> List[str]:
+    return [f"{indent}• {pred.explain()}"]
+
+
+@_match_lines.register
+def _(pred: AndPredicate, item: IndexedText, indent: str) -> List[str]:
+    result = [f"{indent}All of the following were true:"]
+    for p in pred.predicates:
+        result.extend(_match_lines(p, item, indent + "  "))
+    return result
+
+
+@_match_lines.register
+def _(pred: OrPredicate, item: IndexedText, indent: str) -> List[str]:
+    result = [f"{indent}At least one of the following was true:"]
+    for p in pred.predicates:
+        if p.test(item):
+            result.extend(_match_lines(p, item, indent + "  "))
+            break
+    return result
+
+
+@_match_lines.register
+def _(pred: FieldEquals, item: IndexedText, indent: str) -> List[str]:
+    value = item.descriptor.get_field(pred.field_name)
+    return [f"{indent}• {pred.field_name} = '{value}'"]
+
+
+@_match_lines.register
+def _(pred: HierarchyMatches, item: IndexedText, indent: str) -> List[str]:
+    value = item.descriptor.get_field(pred.field_name)
+    return [f"{indent}• {pred.field_name} = '{value}' (hierarchy match)"]
+
+
+@_match_lines.register
+def _(pred: TextContains, item: IndexedText, indent: str) -> List[str]:
+    return [f"{indent}• text contains '{pred.substring}'"]
+
+
 def explain_why_matched(item: IndexedText, predicate: Optional[Predicate]) -> str:
     """
     Explain why an item matched a predicate.
@@ -182,44 +243,43 @@ def explain_why_matched(item: IndexedText, predicate: Optional[Predicate]) -> st
     if predicate is None:
         return f"Item {item.id} matched because no filter was applied."
 
-    from .predicates import AndPredicate, OrPredicate, FieldEquals, HierarchyMatches, TextContains
-
     lines = [f"Item {item.id} matched because:\n"]
+    lines.extend(_match_lines(predicate, item, ""))
+    return "\n".join(lines)
 
-    def explain_match(pred: Predicate, level: int = 0) -> List[str]:
-        indent = "  " * level
-        result = []
 
-        if isinstance(pred, AndPredicate):
-            result.append(f"{indent}All of the following were true:")
-            for p in pred.predicates:
-                result.extend(explain_match(p, level + 1))
+@singledispatch
+def _non_match_lines(pred: Predicate, item: IndexedText, indent: str) -> List[str]:
+    return [f"{indent}• {pred.explain()} was false"]
 
-        elif isinstance(pred, OrPredicate):
-            result.append(f"{indent}At least one of the following was true:")
-            for p in pred.predicates:
-                if p.test(item):
-                    result.extend(explain_match(p, level + 1))
-                    break
 
-        elif isinstance(pred, FieldEquals):
-            value = item.descriptor.get_field(pred.field_name)
-            result.append(f"{indent}• {pred.field_name} = '{value}'")
+@_non_match_lines.register
+def _(pred: AndPredicate, item: IndexedText, indent: str) -> List[str]:
+    failed = [p for p in pred.predicates if not p.test(item)]
+    result = [f"{indent}The following conditions failed:"]
+    for p in failed:
+        result.extend(_non_match_lines(p, item, indent + "  "))
+    return result
 
-        elif isinstance(pred, HierarchyMatches):
-            value = item.descriptor.get_field(pred.field_name)
-            result.append(f"{indent}• {pred.field_name} = '{value}' (hierarchy match)")
 
-        elif isinstance(pred, TextContains):
-            result.append(f"{indent}• text contains '{pred.substring}'")
+@_non_match_lines.register
+def _(pred: OrPredicate, item: IndexedText, indent: str) -> List[str]:
+    result = [f"{indent}None of the following were true:"]
+    for p in pred.predicates:
+        result.extend(_non_match_lines(p, item, indent + "  "))
+    return result
 
-        else:
-            result.append(f"{indent}• {pred.explain()}")
 
-        return result
+@_non_match_lines.register
+def _(pred: FieldEquals, item: IndexedText, indent: str) -> List[str]:
+    value = item.descriptor.get_field(pred.field_name)
+    return [f"{indent}• {pred.field_name} = '{value}' (expected '{pred.value}')"]
 
-    lines.extend(explain_match(predicate))
-    return "\n".join(lines)
+
+@_non_match_lines.register
+def _(pred: HierarchyMatches, item: IndexedText, indent: str) -> List[str]:
+    value = item.descriptor.get_field(pred.field_name)
+    return [f"{indent}• {pred.field_name} = '{value}' (expected under '{pred.path}')"]
 
 
 def explain_why_not_matched(item: IndexedText, predicate: Optional[Predicate]) -> str:
@@ -229,43 +289,8 @@ def explain_why_not_matched(item: IndexedText, predicate: Optional[Predicate]) -
     if predicate is None:
         return f"Item {item.id} was excluded because no filter was applied."
 
-    from .predicates import AndPredicate, OrPredicate, FieldEquals, HierarchyMatches
-
     lines = [f"Item {item.id} did NOT match because:\n"]
-
-    def explain_non_match(pred: Predicate, level: int = 0) -> List[str]:
-        indent = "  " * level
-        result = []
-
-        if isinstance(pred, AndPredicate):
-            failed = [p for p in pred.predicates if not p.test(item)]
-            result.append(f"{indent}The following conditions failed:")
-            for p in failed:
-                result.extend(explain_non_match(p, level + 1))
-
-        elif isinstance(pred, OrPredicate):
-            result.append(f"{indent}None of the following were true:")
-            for p in pred.predicates:
-                result.extend(explain_non_match(p, level + 1))
-
-        elif isinstance(pred, FieldEquals):
-            value = item.descriptor.get_field(pred.field_name)
-            result.append(
-                f"{indent}• {pred.field_name} = '{value}' (expected '{pred.value}')"
-            )
-
-        elif isinstance(pred, HierarchyMatches):
-            value = item.descriptor.get_field(pred.field_name)
-            result.append(
-                f"{indent}• {pred.field_name} = '{value}' (expected under '{pred.path}')"
-            )
-
-        else:
-            result.append(f"{indent}• {pred.explain()} was false")
-
-        return result
-
-    lines.extend(explain_non_match(predicate))
+    lines.extend(_non_match_lines(predicate, item, ""))
     return "\n".join(lines)
 
 
@@ -7,8 +7,13 @@ predicate primitives.
 Filters are convenience utilities, not a query language.
 """
 
-from typing import List, Set, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+import os
+import pickle
 
 from indexer.index_text import IndexedText, TextIndex
 from query.predicates import (
@@ -28,20 +33,91 @@ from query.predicates import (
 # LOW-LEVEL HELPERS
 # -------------------------
 
+# Below this many items, generating a compiled predicate costs more than
+# it saves
+_COMPILE_MIN_ITEMS = 64
+
+
 def filter_items(
     items: List[IndexedText],
     predicate: Predicate,
 ) -> List[IndexedText]:
     """Filter a list of items using a predicate."""
-    return [item for item in items if predicate(item)]
+    test = _item_test(predicate, len(items))
+    return [item for item in items if test(item)]
+
+
+def _item_test(predicate: Predicate, n_items: int) -> Callable[[IndexedText], bool]:
+    """The compiled predicate for large batches, the tree itself for small ones."""
+    if n_items < _COMPILE_MIN_ITEMS:
+        return predicate
+    return predicate.compile()
+
+
+def _matching_positions(predicate: Predicate, items: List[IndexedText]) -> List[int]:
+    """Positions in items that match predicate (runs in a worker process)."""
+    return [i for i, item in enumerate(items) if predicate(item)]
+
+
+def filter_items_parallel(
+    items: List[IndexedText],
+    predicate: Predicate,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[IndexedText]:
+    """
+    Filter a list of items across worker processes.
+
+    Items are split into contiguous chunks, so results keep their order.
+    Each chunk is pickled to a worker, so this only pays off for large
+    batches with expensive predicates. Predicates that cannot be pickled
+    (e.g. a lambda in CustomPredicate or TextMatches) are evaluated in
+    this process instead.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(items) < 2:
+        return filter_items(items, predicate)
+    try:
+        pickle.dumps(predicate)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return filter_items(items, predicate)
+
+    chunksize = chunksize or -(-len(items) // workers)
+    starts = range(0, len(items), chunksize)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _matching_positions,
+            repeat(predicate),
+            (items[start:start + chunksize] for start in starts),
+        )
+        return [
+            items[start + i]
+            for start, positions in zip(starts, results)
+            for i in positions
+        ]
 
 
 def filter_index(
     index: TextIndex,
     predicate: Predicate,
+    workers: Optional[int] = None,
 ) -> List[IndexedText]:
-    """Filter a TextIndex using a predicate."""
-    return filter_items(index.get_all(), predicate)
+    """
+    Filter a TextIndex using a predicate.
+
+    Only the candidates the index's field lookups return for the
+    predicate are tested, and only against the parts the lookups did
+    not answer exactly; predicates the index cannot answer test every
+    item. If workers is given, the candidates are tested across that
+    many processes (see filter_items_parallel).
+    """
+    ids, remaining = predicate.resolve(index)
+    items = index.get_all() if ids is None else index.get_many(ids)
+    if remaining is None:
+        return items
+    if workers is not None:
+        return filter_items_parallel(items, remaining, workers)
+    return filter_items(items, remaining)
 
 
 # -------------------------
@@ -57,16 +133,20 @@ class Filter:
 
     def __init__(self, items: Optional[List[IndexedText]] = None):
         self._items: List[IndexedText] = items or []
+        self._index: Optional[TextIndex] = None
         self._predicates: List[Predicate] = []
+        self._built: Optional[Tuple[Tuple[Predicate, ...], AndPredicate]] = None
 
     # ---- sources ----
 
     def with_items(self, items: List[IndexedText]) -> "Filter":
         self._items = items
+        self._index = None
         return self
 
     def from_index(self, index: TextIndex) -> "Filter":
         self._items = index.get_all()
+        self._index = index
         return self
 
     # ---- semantic fields ----
@@ -142,25 +222,61 @@ class Filter:
     def get_predicate(self) -> Optional[Predicate]:
         if not self._predicates:
             return None
-        return AndPredicate(*self._predicates)
-
-    def execute(self) -> List[IndexedText]:
-        if not self._predicates:
+        # Rebuilt only when where_*() has added a predicate since the last
+        # call, so count()/first()/exists() share one simplified tree
+        built_from = tuple(self._predicates)
+        if self._built is None or self._built[0] != built_from:
+            self._built = (built_from, AndPredicate(*built_from))
+        return self._built[1]
+
+    def execute(self, workers: Optional[int] = None) -> List[IndexedText]:
+        """
+        Run the filter.
+
+        Args:
+            workers: If given, test items across this many processes
+                (see filter_items_parallel)
+        """
+        predicate = self.get_predicate()
+        if predicate is None:
             return self._items
-        return filter_items(
-            self._items,
-            AndPredicate(*self._predicates),
-        )
+        items = self._items
+        if self._index is not None:
+            # Keep the snapshot taken by from_index(), narrowed to the
+            # candidates from the index's field lookups
+            ids, remaining = predicate.resolve(self._index)
+            if ids is not None:
+                items = [item for item in items if item.id in ids]
+                if remaining is None:
+                    return items
+                predicate = remaining
+        if workers is not None:
+            return filter_items_parallel(items, predicate, workers)
+        return filter_items(items, predicate)
+
+    def _iter_matches(self) -> Iterator[IndexedText]:
+        """Lazily yield matching items, for callers that stop early."""
+        predicate = self.get_predicate()
+        if predicate is None:
+            return iter(self._items)
+        items = self._items
+        if self._index is not None:
+            ids, remaining = predicate.resolve(self._index)
+            if ids is not None:
+                items = (item for item in items if item.id in ids)
+                if remaining is None:
+                    return items
+                predicate = remaining
+        return filter(_item_test(predicate, len(self._items)), items)
 
     def count(self) -> int:
         return len(self.execute())
 
     def first(self) -> Optional[IndexedText]:
-        results = self.execute()
-        return results[0] if results else None
+        return next(self._iter_matches(), None)
 
     def exists(self) -> bool:
-        return self.count() > 0
+        return next(self._iter_matches(), None) is not None
 
     def explain(self) -> str:
         predicate = self.get_predicate()
@@ -191,31 +307,39 @@ def find_by_intent(
     return Filter(items).where_intent(intent, exact).execute()
 
 
+# Predicates are immutable, so the fixed conditions of the helpers below
+# are built once and shared, and combinations are cached per argument set
+_RESEARCH = HierarchyMatches("intent", "Research")
+_TUTORIALS = HierarchyMatches("intent", "Documentation → Tutorial")
+
+
+@lru_cache(maxsize=256)
+def _narrowed(base: Predicate, domain: Optional[str],
+              stability: Optional[str] = None) -> Predicate:
+    """base AND the optional domain and stability conditions."""
+    predicates = [base]
+    if domain:
+        predicates.append(HierarchyMatches("domain", domain))
+    if stability:
+        predicates.append(FieldEquals("stability", stability))
+    if len(predicates) == 1:
+        return base
+    return AndPredicate(*predicates)
+
+
 def find_research_posts(
     items: List[IndexedText],
     domain: Optional[str] = None,
     stability: Optional[str] = None,
 ) -> List[IndexedText]:
-    f = Filter(items).where_intent("Research", exact=False)
-
-    if domain:
-        f.where_domain(domain, exact=False)
-    if stability:
-        f.where_stability(stability)
-
-    return f.execute()
+    return filter_items(items, _narrowed(_RESEARCH, domain, stability))
 
 
 def find_tutorials(
     items: List[IndexedText],
     domain: Optional[str] = None,
 ) -> List[IndexedText]:
-    f = Filter(items).where_intent("Documentation → Tutorial")
-
-    if domain:
-        f.where_domain(domain, exact=False)
-
-    return f.execute()
+    return filter_items(items, _narrowed(_TUTORIALS, domain))
 
 
 def find_by_author(
@@ -8,11 +8,17 @@ Predicates are pure boolean filters.
 They perform no ranking, scoring, or inference.
 """
 
-from typing import Callable, Set, Any, Optional
+from typing import Callable, Dict, Hashable, Iterable, List, Set, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime
-
-from indexer.index_text import IndexedText
+from collections import OrderedDict
+from operator import attrgetter, methodcaller
+import re
+import sys
+import threading
+
+from core.descriptor import STANDARD_FIELDS
+from indexer.index_text import IndexedText, TextIndex
 from core.normalize import (
     HIERARCHY_SEPARATOR,
     get_hierarchy_path,
@@ -27,6 +33,12 @@ from core.normalize import (
 class Predicate(ABC):
     """Abstract base class for query predicates."""
 
+    # True when candidate_ids() returns exactly the matching items
+    exact_candidates = False
+    # Attributes that identify the predicate for cache_key(); None marks
+    # predicates that cannot be keyed (arbitrary callables)
+    _key_fields: Optional[Tuple[str, ...]] = None
+
     @abstractmethod
     def test(self, item: IndexedText) -> bool:
         """Return True if item matches predicate."""
@@ -37,6 +49,75 @@ class Predicate(ABC):
         """Return human-readable explanation."""
         pass
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        """
+        Ids of the items in index that may match, from its field index.
+
+        Returns None when the predicate cannot be answered from the
+        index. A returned set may be a superset of the matches, so the
+        candidates are still tested unless exact_candidates is set.
+        """
+        return None
+
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Key shared by predicates that match the same items, or None when
+        the predicate cannot be keyed (e.g. it wraps a Python callable).
+
+        Only a class that declares _key_fields itself is keyed: a subclass
+        may add state (and its own test()) that inherited fields miss.
+        """
+        cls = type(self)
+        key_fields = cls.__dict__.get("_key_fields")
+        if key_fields is None:
+            return None
+        return (cls,) + tuple(getattr(self, name) for name in key_fields)
+
+    def resolve(
+        self, index: TextIndex
+    ) -> Tuple[Optional[Set[str]], Optional["Predicate"]]:
+        """
+        Split into candidate ids from the index and the predicate the
+        candidates still have to pass (None when the ids are exact).
+
+        A subclass that overrides test() without its own candidate_ids()
+        is not answered from the index: the inherited lookup knows
+        nothing of the new test.
+        """
+        cls = type(self)
+        if _defined_in(cls, "candidate_ids") is not _defined_in(cls, "test"):
+            return None, self
+        return self._resolve(index)
+
+    def _resolve(
+        self, index: TextIndex
+    ) -> Tuple[Optional[Set[str]], Optional["Predicate"]]:
+        ids = self.candidate_ids(index)
+        if ids is not None and self.exact_candidates:
+            return ids, None
+        return ids, self
+
+    def compile_expr(self, env: Dict[str, Any]) -> str:
+        """
+        Python expression over `item` equivalent to test(item).
+
+        Constants are bound into env, which becomes the globals of the
+        compiled function (see compile_predicate). A subclass that
+        overrides test() without providing its own expression is called
+        through test().
+        """
+        cls = type(self)
+        if _defined_in(cls, "_compile_expr") is _defined_in(cls, "test"):
+            return self._compile_expr(env)
+        return f"{_bind(env, self)}.test(item)"
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"{_bind(env, self)}.test(item)"
+
+    def compile(self) -> Callable[[IndexedText], bool]:
+        """Return a generated function equivalent to test (see compile_predicate)."""
+        return compile_predicate(self)
+
     def __call__(self, item: IndexedText) -> bool:
         return self.test(item)
 
@@ -50,6 +131,42 @@ class Predicate(ABC):
         return NotPredicate(self)
 
 
+def _defined_in(cls: type, name: str) -> type:
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return object
+
+
+def _bind(env: Dict[str, Any], value: Any) -> str:
+    """Store value in env under a fresh name and return the name."""
+    name = f"_c{len(env)}"
+    env[name] = value
+    return name
+
+
+def _local(env: Dict[str, Any]) -> str:
+    """Reserve a fresh name for a local variable of the compiled function."""
+    return _bind(env, None)
+
+
+def _field_getter(field_name: str) -> Callable[[Any], Optional[str]]:
+    """Equivalent of descriptor.get_field(field_name), resolved once."""
+    name = field_name.lower()
+    if name in STANDARD_FIELDS:
+        return attrgetter(name)
+    return methodcaller("get_field", field_name)
+
+
+def _field_access(field_name: str) -> str:
+    # Standard fields are plain attributes; get_field() would look them up
+    # the same way after lowercasing the name
+    name = field_name.lower()
+    if name in STANDARD_FIELDS:
+        return f"item.descriptor.{name}"
+    return f"item.descriptor.get_field({field_name!r})"
+
+
 # -------------------------
 # FIELD-BASED PREDICATES
 # -------------------------
@@ -57,12 +174,24 @@ class Predicate(ABC):
 class FieldEquals(Predicate):
     """Match items where a semantic field equals a value."""
 
+    exact_candidates = True
+    _key_fields = ("field_name", "value")
+
     def __init__(self, field_name: str, value: str):
-        self.field_name = field_name
-        self.value = value
+        self.field_name = sys.intern(field_name)
+        self._value_of = _field_getter(field_name)
+        self.value = sys.intern(value) if type(value) is str else value
 
     def test(self, item: IndexedText) -> bool:
-        return item.descriptor.get_field(self.field_name) == self.value
+        return self._value_of(item.descriptor) == self.value
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        if self.value is None:
+            return None
+        return index.ids_with_values(self.field_name, (self.value,))
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"{_field_access(self.field_name)} == {_bind(env, self.value)}"
 
     def explain(self) -> str:
         return f"{self.field_name} = '{self.value}'"
@@ -71,12 +200,28 @@ class FieldEquals(Predicate):
 class FieldIn(Predicate):
     """Match items where a semantic field is in a set of values."""
 
-    def __init__(self, field_name: str, values: Set[str]):
-        self.field_name = field_name
-        self.values = values
+    exact_candidates = True
+    _key_fields = ("field_name", "values")
+
+    def __init__(self, field_name: str, values: Iterable[str]):
+        self.field_name = sys.intern(field_name)
+        self._value_of = _field_getter(field_name)
+        # Frozen once so lists and tuples still test in O(1); interned so
+        # lookups of interned descriptor values compare by identity
+        self.values = frozenset(
+            sys.intern(v) if type(v) is str else v for v in values
+        )
 
     def test(self, item: IndexedText) -> bool:
-        return item.descriptor.get_field(self.field_name) in self.values
+        return self._value_of(item.descriptor) in self.values
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        if None in self.values:
+            return None
+        return index.ids_with_values(self.field_name, self.values)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"{_field_access(self.field_name)} in {_bind(env, self.values)}"
 
     def explain(self) -> str:
         vals = ", ".join(f"'{v}'" for v in sorted(self.values))
@@ -86,14 +231,28 @@ class FieldIn(Predicate):
 class FieldStartsWith(Predicate):
     """Match items where a semantic field starts with a prefix."""
 
+    exact_candidates = True
+    _key_fields = ("field_name", "prefix")
+
     def __init__(self, field_name: str, prefix: str):
-        self.field_name = field_name
+        self.field_name = sys.intern(field_name)
+        self._value_of = _field_getter(field_name)
         self.prefix = prefix
 
     def test(self, item: IndexedText) -> bool:
-        value = item.descriptor.get_field(self.field_name)
+        value = self._value_of(item.descriptor)
         return value is not None and value.startswith(self.prefix)
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return index.ids_with_prefix(self.field_name, self.prefix)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        v = _local(env)
+        return (
+            f"(({v} := {_field_access(self.field_name)}) is not None"
+            f" and {v}.startswith({_bind(env, self.prefix)}))"
+        )
+
     def explain(self) -> str:
         return f"{self.field_name} starts with '{self.prefix}'"
 
@@ -108,20 +267,41 @@ class HierarchyMatches(Predicate):
     of a given path.
     """
 
+    exact_candidates = True
+    _key_fields = ("field_name", "path", "exact")
+
     def __init__(self, field_name: str, path: str, exact: bool = False):
-        self.field_name = field_name
-        self.path = path
+        self.field_name = sys.intern(field_name)
+        self._value_of = _field_getter(field_name)
+        self.path = sys.intern(path)
         self.exact = exact
+        self._child_prefix = f"{path}{HIERARCHY_SEPARATOR}"
 
     def test(self, item: IndexedText) -> bool:
-        value = item.descriptor.get_field(self.field_name)
+        value = self._value_of(item.descriptor)
         if value is None:
             return False
 
         if self.exact:
             return value == self.path
 
-        return value == self.path or value.startswith(f"{self.path}{HIERARCHY_SEPARATOR}")
+        return value == self.path or value.startswith(self._child_prefix)
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        ids = index.ids_with_values(self.field_name, (self.path,))
+        if ids is not None and not self.exact:
+            ids |= index.ids_with_prefix(self.field_name, self._child_prefix)
+        return ids
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        path = _bind(env, self.path)
+        if self.exact:
+            return f"{_field_access(self.field_name)} == {path}"
+        v = _local(env)
+        return (
+            f"(({v} := {_field_access(self.field_name)}) == {path}"
+            f" or ({v} is not None and {v}.startswith({_bind(env, self._child_prefix)})))"
+        )
 
     def explain(self) -> str:
         return (
@@ -134,21 +314,27 @@ class HierarchyMatches(Predicate):
 class HierarchyDepth(Predicate):
     """Match items based on hierarchy depth."""
 
+    exact_candidates = True
+    _key_fields = ("field_name", "min_depth", "max_depth")
+
     def __init__(
         self,
         field_name: str,
         min_depth: Optional[int] = None,
         max_depth: Optional[int] = None,
     ):
-        self.field_name = field_name
+        self.field_name = sys.intern(field_name)
+        self._value_of = _field_getter(field_name)
         self.min_depth = min_depth
         self.max_depth = max_depth
 
     def test(self, item: IndexedText) -> bool:
-        value = item.descriptor.get_field(self.field_name)
+        value = self._value_of(item.descriptor)
         if value is None:
             return False
+        return self._depth_matches(value)
 
+    def _depth_matches(self, value: str) -> bool:
         depth = get_hierarchy_depth(value)
 
         if self.min_depth is not None and depth < self.min_depth:
@@ -158,6 +344,17 @@ class HierarchyDepth(Predicate):
 
         return True
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        # Depth is computed once per distinct value rather than per item
+        return index.ids_where(self.field_name, self._depth_matches)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        v = _local(env)
+        return (
+            f"(({v} := {_field_access(self.field_name)}) is not None"
+            f" and {_bind(env, self._depth_matches)}({v}))"
+        )
+
     def explain(self) -> str:
         parts = []
         if self.min_depth is not None:
@@ -174,25 +371,96 @@ class HierarchyDepth(Predicate):
 class TextContains(Predicate):
     """Match items where text contains a substring."""
 
+    _key_fields = ("substring", "case_sensitive")
+
     def __init__(self, substring: str, case_sensitive: bool = False):
         self.substring = substring
         self.case_sensitive = case_sensitive
+        # Lowered once here rather than once per tested item
+        self._needle = substring if case_sensitive else substring.lower()
+        self.exact_candidates = not case_sensitive
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        # The token index is over lowercased text
+        if self.case_sensitive:
+            return None
+        return index.ids_containing(self.substring)
 
     def test(self, item: IndexedText) -> bool:
-        text = item.text
-        needle = self.substring
+        if self.case_sensitive:
+            return self._needle in item.text
+        return self._needle in item.lower_text()
 
-        if not self.case_sensitive:
-            text = text.lower()
-            needle = needle.lower()
+    def test_many(self, items: List[IndexedText]) -> List[bool]:
+        """Test every item, returning one bool per item in order."""
+        needle = self._needle
+        if self.case_sensitive:
+            return [needle in item.text for item in items]
+        return [needle in item.lower_text() for item in items]
 
-        return needle in text
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        text = "item.text" if self.case_sensitive else "item.lower_text()"
+        return f"({_bind(env, self._needle)} in {text})"
 
     def explain(self) -> str:
         mode = "case-sensitive" if self.case_sensitive else "case-insensitive"
         return f"text contains '{self.substring}' ({mode})"
 
 
+class _AllTextContains(Predicate):
+    """
+    Case-insensitive TextContains conjuncts of one AND, merged so the
+    item text is lowercased once for all of their substrings.
+    """
+
+    _key_fields = ("needles",)
+
+    def __init__(self, members: Tuple[TextContains, ...]):
+        self.members = members
+        self.needles = tuple(p._needle for p in members)
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return self.resolve(index)[0]
+
+    def _resolve(
+        self, index: TextIndex
+    ) -> Tuple[Optional[Set[str]], Optional[Predicate]]:
+        known = []
+        remaining = []
+        for p in self.members:
+            ids = p.resolve(index)[0]
+            if ids is None:
+                remaining.append(p)
+            else:
+                known.append(ids)
+        if not known:
+            return None, self
+        known.sort(key=len)
+        ids = known[0].intersection(*known[1:])
+        if not remaining:
+            return ids, None
+        if len(remaining) == 1:
+            return ids, remaining[0]
+        return ids, _AllTextContains(tuple(remaining))
+
+    def test(self, item: IndexedText) -> bool:
+        text = item.lower_text()
+        for needle in self.needles:
+            if needle not in text:
+                return False
+        return True
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        text = _local(env)
+        first, *rest = self.needles
+        checks = [f"{_bind(env, first)} in ({text} := item.lower_text())"]
+        checks.extend(f"{_bind(env, needle)} in {text}" for needle in rest)
+        return "(" + " and ".join(checks) + ")"
+
+    def explain(self) -> str:
+        return "(" + " AND ".join(p.explain() for p in self.members) + ")"
+
+
 class TextMatches(Predicate):
     """Match items using a custom text matcher function."""
 
@@ -203,6 +471,9 @@ class TextMatches(Predicate):
     def test(self, item: IndexedText) -> bool:
         return self.matcher(item.text)
 
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"{_bind(env, self.matcher)}(item.text)"
+
     def explain(self) -> str:
         return f"text {self.description}"
 
@@ -214,13 +485,24 @@ class TextMatches(Predicate):
 class MetadataEquals(Predicate):
     """Match items where a metadata key equals a value."""
 
+    _key_fields = ("key", "value")
+
     def __init__(self, key: str, value: Any):
-        self.key = key
-        self.value = value
+        self.key = sys.intern(key)
+        self.value = sys.intern(value) if type(value) is str else value
 
     def test(self, item: IndexedText) -> bool:
         return item.metadata.get(self.key) == self.value
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        if self.value is None:
+            # Also matches items that lack the key entirely
+            return None
+        return index.ids_with_metadata(self.key, self.value)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"item.metadata.get({_bind(env, self.key)}) == {_bind(env, self.value)}"
+
     def explain(self) -> str:
         return f"metadata['{self.key}'] = {self.value!r}"
 
@@ -228,12 +510,21 @@ class MetadataEquals(Predicate):
 class MetadataExists(Predicate):
     """Match items where a metadata key exists."""
 
+    exact_candidates = True
+    _key_fields = ("key",)
+
     def __init__(self, key: str):
-        self.key = key
+        self.key = sys.intern(key)
 
     def test(self, item: IndexedText) -> bool:
         return self.key in item.metadata
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return index.ids_with_metadata_key(self.key)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"({_bind(env, self.key)} in item.metadata)"
+
     def explain(self) -> str:
         return f"metadata['{self.key}'] exists"
 
@@ -245,12 +536,20 @@ class MetadataExists(Predicate):
 class CreatedAfter(Predicate):
     """Match items created after a timestamp."""
 
+    _key_fields = ("timestamp",)
+
     def __init__(self, timestamp: datetime):
         self.timestamp = timestamp
 
     def test(self, item: IndexedText) -> bool:
         return item.created_at > self.timestamp
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return index.ids_created(after=self.timestamp)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"item.created_at > {_bind(env, self.timestamp)}"
+
     def explain(self) -> str:
         return f"created after {self.timestamp.isoformat()}"
 
@@ -258,12 +557,20 @@ class CreatedAfter(Predicate):
 class CreatedBefore(Predicate):
     """Match items created before a timestamp."""
 
+    _key_fields = ("timestamp",)
+
     def __init__(self, timestamp: datetime):
         self.timestamp = timestamp
 
     def test(self, item: IndexedText) -> bool:
         return item.created_at < self.timestamp
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return index.ids_created(before=self.timestamp)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"item.created_at < {_bind(env, self.timestamp)}"
+
     def explain(self) -> str:
         return f"created before {self.timestamp.isoformat()}"
 
@@ -271,12 +578,17 @@ class CreatedBefore(Predicate):
 class UpdatedAfter(Predicate):
     """Match items updated after a timestamp."""
 
+    _key_fields = ("timestamp",)
+
     def __init__(self, timestamp: datetime):
         self.timestamp = timestamp
 
     def test(self, item: IndexedText) -> bool:
         return item.updated_at > self.timestamp
 
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"item.updated_at > {_bind(env, self.timestamp)}"
+
     def explain(self) -> str:
         return f"updated after {self.timestamp.isoformat()}"
 
@@ -284,12 +596,17 @@ class UpdatedAfter(Predicate):
 class UpdatedBefore(Predicate):
     """Match items updated before a timestamp."""
 
+    _key_fields = ("timestamp",)
+
     def __init__(self, timestamp: datetime):
         self.timestamp = timestamp
 
     def test(self, item: IndexedText) -> bool:
         return item.updated_at < self.timestamp
 
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"item.updated_at < {_bind(env, self.timestamp)}"
+
     def explain(self) -> str:
         return f"updated before {self.timestamp.isoformat()}"
 
@@ -299,31 +616,217 @@ class UpdatedBefore(Predicate):
 # -------------------------
 
 class AndPredicate(Predicate):
-    """Combine predicates using AND logic."""
+    """
+    Combine predicates using AND logic.
+
+    Nested ANDs are flattened, simplified (see _simplify) and the
+    conjuncts tested cheapest first (see _EVALUATION_COST), so field
+    checks reject most items before any text scan or custom function
+    runs. Case-insensitive TextContains conjuncts share one lowercased
+    copy of the text. `predicates` keeps the declared order for
+    explanations.
+    """
 
     def __init__(self, *predicates: Predicate):
         self.predicates = predicates
+        flat = _simplify(predicates, AndPredicate, AlwaysTrue, AlwaysFalse)
+        texts = tuple(
+            p for p in flat if type(p) is TextContains and not p.case_sensitive
+        )
+        if len(texts) > 1:
+            merged = _AllTextContains(texts)
+            flat = tuple(p for p in flat if p not in texts) + (merged,)
+        # Stable sort: equal-cost predicates keep their declared order
+        self._evaluation_order = tuple(
+            sorted(flat, key=_evaluation_cost)
+        )
 
     def test(self, item: IndexedText) -> bool:
-        return all(p.test(item) for p in self.predicates)
+        for p in self._evaluation_order:
+            if not p.test(item):
+                return False
+        return True
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        # Intersect whichever conjuncts the index can answer, smallest first
+        known = [
+            ids for ids in (p.resolve(index)[0] for p in self._evaluation_order)
+            if ids is not None
+        ]
+        if not known:
+            return None
+        known.sort(key=len)
+        return known[0].intersection(*known[1:])
+
+    def _resolve(
+        self, index: TextIndex
+    ) -> Tuple[Optional[Set[str]], Optional[Predicate]]:
+        # Conjuncts answered exactly by the index are not tested again
+        known = []
+        remaining = []
+        for p in self._evaluation_order:
+            ids, rest = p.resolve(index)
+            if ids is not None:
+                known.append(ids)
+            if rest is not None:
+                remaining.append(rest)
+        if not known:
+            return None, self
+        known.sort(key=len)
+        ids = known[0].intersection(*known[1:])
+        if not remaining:
+            return ids, None
+        if len(remaining) == 1:
+            return ids, remaining[0]
+        return ids, AndPredicate(*remaining)
+
+    def cache_key(self) -> Optional[Hashable]:
+        return _combined_key("AND", self._evaluation_order)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        if not self._evaluation_order:
+            return "True"
+        return "(" + " and ".join(p.compile_expr(env) for p in self._evaluation_order) + ")"
 
     def explain(self) -> str:
         return "(" + " AND ".join(p.explain() for p in self.predicates) + ")"
 
 
 class OrPredicate(Predicate):
-    """Combine predicates using OR logic."""
+    """
+    Combine predicates using OR logic.
+
+    Nested ORs are flattened and simplified like AND (see _simplify).
+    Two or more TextContains children with the same case sensitivity are
+    also compiled into one alternation pattern, so the text is scanned
+    once for all of their substrings instead of once per substring.
+    """
 
     def __init__(self, *predicates: Predicate):
         self.predicates = predicates
+        self._evaluation_order = _simplify(predicates, OrPredicate, AlwaysFalse, AlwaysTrue)
+        self._text_patterns, self._others = self._compile_text_children(
+            self._evaluation_order
+        )
+
+    @staticmethod
+    def _compile_text_children(
+        predicates,
+    ) -> Tuple[List[Tuple[re.Pattern, bool]], Tuple[Predicate, ...]]:
+        groups = {False: [], True: []}
+        for p in predicates:
+            if type(p) is TextContains:
+                groups[p.case_sensitive].append(p)
+
+        patterns = []
+        combined = set()
+        for case_sensitive, members in groups.items():
+            if len(members) < 2:
+                continue
+            needles = [p._needle for p in members]
+            patterns.append(
+                (re.compile("|".join(map(re.escape, needles))), case_sensitive)
+            )
+            combined.update(map(id, members))
+
+        others = tuple(p for p in predicates if id(p) not in combined)
+        return patterns, others
 
     def test(self, item: IndexedText) -> bool:
-        return any(p.test(item) for p in self.predicates)
+        for pattern, case_sensitive in self._text_patterns:
+            if pattern.search(item.text if case_sensitive else item.lower_text()):
+                return True
+        for p in self._others:
+            if p.test(item):
+                return True
+        return False
+
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        # Every disjunct must be answerable, or any item could match
+        ids = set()
+        for p in self._evaluation_order:
+            candidates = p.resolve(index)[0]
+            if candidates is None:
+                return None
+            ids |= candidates
+        return ids
+
+    def _resolve(
+        self, index: TextIndex
+    ) -> Tuple[Optional[Set[str]], Optional[Predicate]]:
+        ids = set()
+        exact = True
+        for p in self._evaluation_order:
+            candidates, rest = p.resolve(index)
+            if candidates is None:
+                return None, self
+            ids |= candidates
+            exact = exact and rest is None
+        return ids, None if exact else self
+
+    def cache_key(self) -> Optional[Hashable]:
+        return _combined_key("OR", self._evaluation_order)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        parts = []
+        for pattern, case_sensitive in self._text_patterns:
+            text = "item.text" if case_sensitive else "item.lower_text()"
+            parts.append(f"({_bind(env, pattern.search)}({text}) is not None)")
+        parts.extend(p.compile_expr(env) for p in self._others)
+        if not parts:
+            return "False"
+        return "(" + " or ".join(parts) + ")"
 
     def explain(self) -> str:
         return "(" + " OR ".join(p.explain() for p in self.predicates) + ")"
 
 
+def _simplify(
+    predicates, combinator: type, identity: type, absorbing: type
+) -> Tuple[Predicate, ...]:
+    """
+    Children of an AND/OR as they are evaluated: nested combinators of
+    the same type flattened, identity constants dropped, duplicates (by
+    cache_key) removed, and the whole list reduced to the absorbing
+    constant if one is present.
+    """
+    flat = []
+    seen = set()
+    stack = list(reversed(predicates))
+    while stack:
+        p = stack.pop()
+        kind = type(p)
+        if kind is combinator:
+            stack.extend(reversed(p.predicates))
+            continue
+        if kind is identity:
+            continue
+        if kind is absorbing:
+            return (p,)
+        key = p.cache_key()
+        if key is not None:
+            try:
+                if key in seen:
+                    continue
+                seen.add(key)
+            except TypeError:  # unhashable constant, e.g. a list value
+                pass
+        flat.append(p)
+    return tuple(flat)
+
+
+def _combined_key(op: str, predicates) -> Optional[Hashable]:
+    # AND and OR are commutative and idempotent, so the order and
+    # repetition of children do not change the key
+    keys = [p.cache_key() for p in predicates]
+    if None in keys:
+        return None
+    try:
+        return (op, frozenset(keys))
+    except TypeError:  # a child keyed on an unhashable value, e.g. a list
+        return None
+
+
 class NotPredicate(Predicate):
     """Negate a predicate."""
 
@@ -333,6 +836,35 @@ class NotPredicate(Predicate):
     def test(self, item: IndexedText) -> bool:
         return not self.predicate.test(item)
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return self.resolve(index)[0]
+
+    def _resolve(
+        self, index: TextIndex
+    ) -> Tuple[Optional[Set[str]], Optional[Predicate]]:
+        # Only an exact id set can be complemented: inexact candidates
+        # may still fail the inner test and so match the negation
+        ids, rest = self.predicate.resolve(index)
+        if ids is None or rest is not None:
+            return None, self
+        return index.all_ids() - ids, None
+
+    def cache_key(self) -> Optional[Hashable]:
+        key = self.predicate.cache_key()
+        if key is None:
+            return None
+        try:
+            hash(key)
+        except TypeError:  # keyed on an unhashable value, e.g. a list
+            return None
+        return ("NOT", key)
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        if type(self.predicate) is NotPredicate:
+            # Double negation
+            return self.predicate.predicate.compile_expr(env)
+        return f"(not {self.predicate.compile_expr(env)})"
+
     def explain(self) -> str:
         return f"NOT ({self.predicate.explain()})"
 
@@ -344,9 +876,14 @@ class NotPredicate(Predicate):
 class AlwaysTrue(Predicate):
     """Predicate that always matches."""
 
+    _key_fields = ()
+
     def test(self, item: IndexedText) -> bool:
         return True
 
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return "True"
+
     def explain(self) -> str:
         return "always true"
 
@@ -354,9 +891,18 @@ class AlwaysTrue(Predicate):
 class AlwaysFalse(Predicate):
     """Predicate that never matches."""
 
+    exact_candidates = True
+    _key_fields = ()
+
     def test(self, item: IndexedText) -> bool:
         return False
 
+    def candidate_ids(self, index: TextIndex) -> Optional[Set[str]]:
+        return set()
+
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return "False"
+
     def explain(self) -> str:
         return "always false"
 
@@ -375,5 +921,83 @@ class CustomPredicate(Predicate):
     def test(self, item: IndexedText) -> bool:
         return self.test_func(item)
 
+    def _compile_expr(self, env: Dict[str, Any]) -> str:
+        return f"{_bind(env, self.test_func)}(item)"
+
     def explain(self) -> str:
         return self.description
+
+
+# Rough relative cost of testing one item, used to order AND conjuncts.
+_DEFAULT_COST = 5
+_EVALUATION_COST = {
+    AlwaysFalse: 0,
+    AlwaysTrue: 0,
+    FieldEquals: 1,
+    FieldIn: 1,
+    MetadataEquals: 1,
+    MetadataExists: 1,
+    CreatedAfter: 1,
+    CreatedBefore: 1,
+    UpdatedAfter: 1,
+    UpdatedBefore: 1,
+    FieldStartsWith: 2,
+    HierarchyMatches: 2,
+    HierarchyDepth: 2,
+    NotPredicate: 3,
+    OrPredicate: 5,
+    TextContains: 10,
+    _AllTextContains: 10,
+    TextMatches: 20,
+    CustomPredicate: 20,
+}
+
+
+def _evaluation_cost(predicate: Predicate) -> int:
+    # An exact hierarchy match is a single equality check
+    if type(predicate) is HierarchyMatches and predicate.exact:
+        return _EVALUATION_COST[FieldEquals]
+    return _EVALUATION_COST.get(type(predicate), _DEFAULT_COST)
+
+
+# -------------------------
+# COMPILATION
+# -------------------------
+
+_COMPILE_CACHE_SIZE = 256
+_compiled: "OrderedDict[Hashable, Callable[[IndexedText], bool]]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_predicate(predicate: Predicate) -> Callable[[IndexedText], bool]:
+    """
+    Compile a predicate tree into one generated function of `item`.
+
+    The tree's expressions (see Predicate.compile_expr) are emitted as a
+    single return statement, so testing an item runs one Python frame
+    instead of one test() call per node. Results are cached by
+    cache_key(), so equivalent queries reuse the compiled function.
+    """
+    try:
+        key = predicate.cache_key()
+        hash(key)
+    except TypeError:  # keyed on an unhashable value: compile uncached
+        key = None
+    if key is not None:
+        with _compiled_lock:
+            func = _compiled.get(key)
+            if func is not None:
+                _compiled.move_to_end(key)
+                return func
+
+    env: Dict[str, Any] = {}
+    expr = predicate.compile_expr(env)
+    exec(f"def _compiled_predicate(item):\n    return True if {expr} else False\n", env)
+    func = env["_compiled_predicate"]
+
+    if key is not None:
+        with _compiled_lock:
+            _compiled[key] = func
+            if len(_compiled) > _COMPILE_CACHE_SIZE:
+                _compiled.popitem(last=False)
+    return func
@@ -8,11 +8,17 @@ This is an advanced interface built on top of predicates.
 Most users should prefer `filters.py`.
 """
 
-from typing import List, Optional, Set, Any, Callable
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple
+from collections import OrderedDict
 from datetime import datetime
-from dataclasses import dataclass
-
-from indexer.index_text import IndexedText, TextIndex
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+import heapq
+import threading
+import weakref
+
+from indexer.index_text import IndexedText, TextIndex, item_revision
 from query.predicates import (
     Predicate,
     FieldEquals,
@@ -33,6 +39,7 @@ from query.predicates import (
     NotPredicate,
     CustomPredicate,
 )
+from query.filters import _item_test, filter_index
 from core.errors import QueryError
 
 
@@ -40,12 +47,52 @@ from core.errors import QueryError
 # QUERY RESULT
 # -------------------------
 
-@dataclass
 class QueryResult:
-    """Result of query execution."""
-    items: List[IndexedText]
-    total: int
-    query_explanation: str
+    """
+    Result of query execution.
+
+    `total` is the number of matches before pagination, and len()
+    returns it; iterate or index `items` for the page itself.
+    `query_explanation` is built from `explain` on first access when
+    execute() passes one instead of the text.
+    """
+
+    def __init__(
+        self,
+        items: List[IndexedText],
+        total: Optional[int] = None,
+        query_explanation: str = "",
+        explain: Optional[Callable[[], str]] = None,
+    ):
+        self.items = items
+        self._query_explanation = query_explanation
+        self._explain = explain
+        self.total = len(items) if total is None else total
+
+    @property
+    def query_explanation(self) -> str:
+        if self._explain is not None:
+            self._query_explanation = self._explain()
+            self._explain = None
+        return self._query_explanation
+
+    @query_explanation.setter
+    def query_explanation(self, value: str) -> None:
+        self._query_explanation = value
+        self._explain = None
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryResult(items={self.items!r}, total={self.total!r}, "
+            f"query_explanation={self.query_explanation!r})"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, QueryResult):
+            return NotImplemented
+        return (self.items, self.total, self.query_explanation) == (
+            other.items, other.total, other.query_explanation
+        )
 
     def __len__(self):
         return self.total
@@ -57,6 +104,86 @@ class QueryResult:
         return self.items[index]
 
 
+def _explain_query(predicate: Optional[Predicate], sorted_: bool,
+                   offset: int, limit: Optional[int]) -> str:
+    """SQL-like summary of a query (see QueryBuilder.explain)."""
+    parts = []
+
+    if predicate:
+        parts.append(f"WHERE {predicate.explain()}")
+    if sorted_:
+        parts.append("ORDER BY")
+    if offset:
+        parts.append(f"OFFSET {offset}")
+    if limit is not None:
+        parts.append(f"LIMIT {limit}")
+
+    return "SELECT items " + " ".join(parts) if parts else "SELECT all items"
+
+
+# -------------------------
+# RESULT CACHE
+# -------------------------
+
+# Filtered items per index, keyed by predicate cache_key() and tagged
+# with the index version they were computed at; any write bumps the
+# version, so a stale entry is never served
+_RESULT_CACHE_SIZE = 128
+_result_cache: "weakref.WeakKeyDictionary[TextIndex, Tuple[int, OrderedDict]]" = (
+    weakref.WeakKeyDictionary()
+)
+_result_cache_lock = threading.Lock()
+
+
+def _filter_cached(index: TextIndex, predicate: Predicate,
+                   workers: Optional[int] = None) -> List[IndexedText]:
+    """
+    filter_index() with results memoized per index version.
+
+    The item revision is part of the version checked: update_text() and
+    update_descriptor() refresh updated_at even when the index has
+    nothing to re-index, and predicates may test it.
+    """
+    key = predicate.cache_key()
+    try:
+        hash(key)
+    except TypeError:  # e.g. MetadataEquals on a list value
+        key = None
+    if key is None:
+        return filter_index(index, predicate, workers)
+
+    version = (index.version, item_revision())
+    with _result_cache_lock:
+        entry = _result_cache.get(index)
+        if entry is None or entry[0] != version:
+            entry = (version, OrderedDict())
+            _result_cache[index] = entry
+        cache = entry[1]
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            return list(hit)
+
+    items = filter_index(index, predicate, workers)
+    with _result_cache_lock:
+        if (index.version, item_revision()) == version:
+            cache[key] = tuple(items)
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+    return items
+
+
+def _count_matches(index: TextIndex, predicate: Optional[Predicate]) -> int:
+    """Number of items matching predicate, without building the result list."""
+    if predicate is None:
+        return index.count()
+    ids, remaining = predicate.resolve(index)
+    if remaining is None:
+        return len(ids)
+    items = index.get_all() if ids is None else index.get_many(ids)
+    return sum(1 for _ in filter(_item_test(remaining, len(items)), items))
+
+
 # -------------------------
 # QUERY BUILDER
 # -------------------------
@@ -72,6 +199,7 @@ class QueryBuilder:
     def __init__(self, index: Optional[TextIndex] = None):
         self._index = index
         self._predicates: List[Predicate] = []
+        self._built: Optional[Tuple[Tuple[Predicate, ...], AndPredicate]] = None
 
         self._limit: Optional[int] = None
         self._offset: int = 0
@@ -220,10 +348,10 @@ class QueryBuilder:
         return self
 
     def order_by_created(self, descending: bool = True) -> "QueryBuilder":
-        return self.order_by(lambda item: item.created_at, reverse=descending)
+        return self.order_by(attrgetter("created_at"), reverse=descending)
 
     def order_by_updated(self, descending: bool = True) -> "QueryBuilder":
-        return self.order_by(lambda item: item.updated_at, reverse=descending)
+        return self.order_by(attrgetter("updated_at"), reverse=descending)
 
     def limit(self, n: int) -> "QueryBuilder":
         if n < 0:
@@ -249,6 +377,9 @@ class QueryBuilder:
         cloned._offset = self._offset
         cloned._sort_key = self._sort_key
         cloned._sort_reverse = self._sort_reverse
+        # Predicates are immutable, so the built tree is shared until
+        # either side adds a condition
+        cloned._built = self._built
         return cloned
 
     def reset(self) -> "QueryBuilder":
@@ -262,16 +393,45 @@ class QueryBuilder:
 
     def count(self) -> int:
         """Return the total number of items matching the query (before pagination)."""
-        return self.execute().total
+        if self._index is None:
+            raise QueryError("No index set. Use from_index() first.")
+        return _count_matches(self._index, self.build_predicate())
 
     def first(self) -> Optional[IndexedText]:
         """Return the first matching item, if any."""
-        results = self.clone().limit(1).execute().items
-        return results[0] if results else None
+        if self._index is None:
+            raise QueryError("No index set. Use from_index() first.")
+        # Like clone().limit(1).execute(): any limit set is ignored
+        matches = self._iter_matches()
+        if self._sort_key is None:
+            # Unsorted: stop at the first match past the offset
+            return next(islice(matches, self._offset, None), None)
+        # Sorted: select from the matches as they stream past instead of
+        # collecting and sorting them. min/max keep the first of equal
+        # keys, as the stable sort in execute() does.
+        if not self._offset:
+            select = max if self._sort_reverse else min
+            return select(matches, key=self._sort_key, default=None)
+        select = heapq.nlargest if self._sort_reverse else heapq.nsmallest
+        results = select(self._offset + 1, matches, key=self._sort_key)
+        return results[self._offset] if len(results) > self._offset else None
 
     def exists(self) -> bool:
         """Return True if any items match the query."""
-        return self.count() > 0
+        if self._index is None:
+            raise QueryError("No index set. Use from_index() first.")
+        return next(self._iter_matches(), None) is not None
+
+    def _iter_matches(self) -> Iterator[IndexedText]:
+        """Lazily yield matching items in index order, ignoring pagination."""
+        predicate = self.build_predicate()
+        if predicate is None:
+            return iter(self._index.get_all())
+        ids, remaining = predicate.resolve(self._index)
+        items = self._index.get_all() if ids is None else self._index.get_many(ids)
+        if remaining is None:
+            return iter(items)
+        return filter(_item_test(remaining, len(items)), items)
 
     # ---------------------
     # EXECUTION
@@ -282,46 +442,78 @@ class QueryBuilder:
             return None
         if len(self._predicates) == 1:
             return self._predicates[0]
-        return AndPredicate(*self._predicates)
-
-    def execute(self) -> QueryResult:
+        # execute() and explain() both ask for the tree; build it once per
+        # set of predicates
+        built_from = tuple(self._predicates)
+        if self._built is None or self._built[0] != built_from:
+            self._built = (built_from, AndPredicate(*built_from))
+        return self._built[1]
+
+    def execute(self, workers: Optional[int] = None) -> QueryResult:
+        """
+        Run the query.
+
+        Args:
+            workers: If given, test candidates across this many processes
+                (see filter_items_parallel). Unsorted queries with a limit
+                stop at the last item of the page and always run here.
+        """
         if self._index is None:
             raise QueryError("No index set. Use from_index() first.")
 
-        items = self._index.get_all()
         predicate = self.build_predicate()
 
+        if self._limit is not None and self._sort_key is None:
+            # Index order: the page is the first matches past the offset,
+            # so stop there. The total is counted now, not on access, so it
+            # describes the same index state as the page.
+            items = list(islice(
+                self._iter_matches(), self._offset, self._offset + self._limit
+            ))
+            return QueryResult(
+                items=items,
+                total=_count_matches(self._index, predicate),
+                explain=self._explanation(),
+            )
+
         if predicate:
-            items = [item for item in items if predicate(item)]
+            items = _filter_cached(self._index, predicate, workers)
+        else:
+            items = self._index.get_all()
 
         total = len(items)
 
-        if self._sort_key:
-            items.sort(key=self._sort_key, reverse=self._sort_reverse)
-
-        if self._offset:
-            items = items[self._offset:]
-
         if self._limit is not None:
-            items = items[: self._limit]
+            end = self._offset + self._limit
+            if self._sort_key and end < total // 8:
+                # Only the first `end` items are kept: select them with a
+                # heap (O(N log end), stable like sort) instead of sorting all
+                select = heapq.nlargest if self._sort_reverse else heapq.nsmallest
+                items = select(end, items, key=self._sort_key)
+            elif self._sort_key:
+                items.sort(key=self._sort_key, reverse=self._sort_reverse)
+            items = items[self._offset:end]
+        else:
+            if self._sort_key:
+                items.sort(key=self._sort_key, reverse=self._sort_reverse)
+            if self._offset:
+                items = items[self._offset:]
 
         return QueryResult(
             items=items,
             total=total,
-            query_explanation=self.explain(),
+            explain=self._explanation(),
         )
 
     def explain(self) -> str:
-        predicate = self.build_predicate()
-        parts = []
-
-        if predicate:
-            parts.append(f"WHERE {predicate.explain()}")
-        if self._sort_key:
-            parts.append("ORDER BY")
-        if self._offset:
-            parts.append(f"OFFSET {self._offset}")
-        if self._limit is not None:
-            parts.append(f"LIMIT {self._limit}")
-
-        return "SELECT items " + " ".join(parts) if parts else "SELECT all items"
+        return self._explanation()()
+
+    def _explanation(self) -> Callable[[], str]:
+        """explain() for the query as it is now, unaffected by later builder calls."""
+        return partial(
+            _explain_query,
+            self.build_predicate(),
+            self._sort_key is not None,
+            self._offset,
+            self._limit,
+        )
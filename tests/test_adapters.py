@@ -0,0 +1,254 @@
+"""
+Tests for storage adapters and the index manager.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import SemanticDescriptor
+from core.errors import IndexingError
+from indexer.adapters import DirectoryAdapter, FileAdapter, IndexManager
+from indexer.index_text import TextIndex
+from indexer.serialize import NDJSONSerializer, save_to_file
+
+
+class TestIndexManagerBatching(unittest.TestCase):
+    """Test dirty tracking, batch() and skipped identical writes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'index.json'
+        self.adapter = FileAdapter(self.path, validate_on_load=False)
+        self.manager = IndexManager(self.adapter)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+    
+    def test_batch_saves_once(self):
+        """Test a batch saves once, on exit."""
+        with mock.patch.object(self.adapter, 'save', wraps=self.adapter.save) as save:
+            with self.manager.batch():
+                self.manager.add('one', SemanticDescriptor(domain='Science'))
+                self.manager.add('two', SemanticDescriptor(domain='Science'))
+        save.assert_called_once()
+        self.assertEqual(self.adapter.load().count(), 2)
+    
+    def test_batch_without_changes_does_not_save(self):
+        """Test a batch without changes does not save."""
+        with mock.patch.object(self.adapter, 'save') as save:
+            with self.manager.batch():
+                self.manager.remove('missing')
+        save.assert_not_called()
+    
+    def test_identical_save_skips_write(self):
+        """Test saving unchanged content skips the write."""
+        self.manager.add('one', SemanticDescriptor(domain='Science'))
+        with mock.patch('builtins.open', wraps=open) as opened:
+            self.manager.save()
+        opened.assert_not_called()
+    
+    def test_deleted_file_is_rewritten(self):
+        """Test a deleted file is written again."""
+        self.manager.add('one', SemanticDescriptor(domain='Science'))
+        self.path.unlink()
+        self.manager.save()
+        self.assertTrue(self.path.exists())
+    
+    def test_externally_modified_file_is_rewritten(self):
+        """Test a file changed on disk is written again."""
+        self.manager.add('one', SemanticDescriptor(domain='Science'))
+        self.path.write_text('[]', encoding='utf-8')
+        self.manager.save()
+        self.assertEqual(self.adapter.load().count(), 1)
+
+
+class TestDirectoryAdapterSkipsUnchanged(unittest.TestCase):
+    """Test DirectoryAdapter only rewrites items whose content changed."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.adapter = DirectoryAdapter(Path(self.tmp.name) / 'items')
+        self.index = TextIndex(validate_on_add=False)
+        for i in range(3):
+            self.index.add(f'text {i}', SemanticDescriptor(domain='Science'))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+    
+    def test_round_trip(self):
+        """Test a save and load round trip."""
+        self.adapter.save(self.index)
+        loaded = self.adapter.load()
+        self.assertEqual(
+            sorted(item.id for item in loaded.get_all()),
+            sorted(item.id for item in self.index.get_all()),
+        )
+    
+    def test_only_changed_item_rewritten(self):
+        """Test only the changed item is rewritten."""
+        self.adapter.save(self.index)
+        changed = self.index.get_all()[0]
+        self.index.update(changed.id, metadata={'edited': True})
+        with mock.patch.object(self.adapter, '_write', wraps=self.adapter._write) as write:
+            self.adapter.save(self.index)
+        self.assertEqual([call.args[0][0] for call in write.call_args_list], [changed.id])
+    
+    def test_externally_modified_file_rewritten(self):
+        """Test a file changed on disk is written again."""
+        self.adapter.save(self.index)
+        item = self.index.get_all()[0]
+        path = self.adapter._item_path(item.id)
+        path.write_text('[]', encoding='utf-8')
+        self.adapter.save(self.index)
+        self.assertEqual(self.adapter.load().get(item.id).text, item.text)
+
+
+class TestNDJSONAppendPersistence(unittest.TestCase):
+    """Test buffered appends and append-only auto-saves for NDJSON files."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'index.ndjson'
+        self.adapter = FileAdapter(self.path, validate_on_load=False)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+    
+    def _ids_on_disk(self):
+        return sorted(item.id for item in self.adapter.load().get_all())
+    
+    def test_append_session_and_append_many(self):
+        """Test append(), append_session() and append_many()."""
+        index = TextIndex(validate_on_add=False)
+        items = [index.add(f'text {i}', SemanticDescriptor(domain='Science'))
+                 for i in range(3)]
+        with self.adapter.append_session():
+            self.adapter.append(items[0])
+            self.adapter.append(items[1])
+        self.adapter.append_many(items[2:])
+        self.assertEqual(self._ids_on_disk(), sorted(item.id for item in items))
+    
+    def test_manager_appends_new_items(self):
+        """Test auto-save appends added items."""
+        manager = IndexManager(self.adapter)
+        manager.add('first', SemanticDescriptor(domain='Science'))
+        with mock.patch.object(self.adapter, 'save', wraps=self.adapter.save) as save:
+            with manager.batch():
+                manager.add('second', SemanticDescriptor(domain='Science'))
+                manager.add('third', SemanticDescriptor(domain='Science'))
+        save.assert_not_called()
+        self.assertEqual(self._ids_on_disk(),
+                         sorted(item.id for item in manager.get_all()))
+    
+    def test_manager_rewrites_after_remove(self):
+        """Test auto-save rewrites the file after a remove."""
+        manager = IndexManager(self.adapter)
+        first = manager.add('first', SemanticDescriptor(domain='Science'))
+        manager.add('second', SemanticDescriptor(domain='Science'))
+        manager.remove(first.id)
+        self.assertEqual(self._ids_on_disk(),
+                         sorted(item.id for item in manager.get_all()))
+    
+    def test_direct_index_edits_force_rewrite(self):
+        """Test direct index edits force a rewrite."""
+        manager = IndexManager(self.adapter)
+        first = manager.add('first', SemanticDescriptor(domain='Science'))
+        manager.index.remove(first.id)
+        manager.add('second', SemanticDescriptor(domain='Science'))
+        self.assertEqual(self._ids_on_disk(),
+                         sorted(item.id for item in manager.get_all()))
+    
+    def test_direct_edits_keeping_count_force_rewrite(self):
+        """Test direct edits that keep the item count still force a rewrite."""
+        manager = IndexManager(self.adapter)
+        first = manager.add('first', SemanticDescriptor(domain='Science'))
+        second = manager.add('second', SemanticDescriptor(domain='Science'))
+        manager.index.update(first.id, text='edited')
+        manager.index.remove(second.id)
+        manager.index.add('direct', SemanticDescriptor(domain='Arts'))
+        manager.add('third', SemanticDescriptor(domain='Science'))
+        on_disk = self.adapter.load()
+        self.assertEqual(sorted(item.text for item in on_disk.get_all()),
+                         ['direct', 'edited', 'third'])
+        self.assertEqual(on_disk.count(), manager.count())
+
+
+class TestNDJSONRandomAccess(unittest.TestCase):
+    """Test single-record reads through the NDJSON offset file."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'index.ndjson'
+        self.index = TextIndex(validate_on_add=False)
+        self.items = [self.index.add(f'text {i}', SemanticDescriptor(domain='Science'))
+                      for i in range(3)]
+        FileAdapter(self.path, validate_on_load=False).save(self.index)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+    
+    def test_get_item_uses_offsets(self):
+        """Test get_item() reads through the offsets file."""
+        adapter = FileAdapter(self.path)
+        self.assertTrue(adapter.offsets_path.exists())
+        item = adapter.get_item(self.items[1].id)
+        self.assertEqual(item.to_dict(), self.items[1].to_dict())
+        self.assertIsNone(adapter.get_item('missing'))
+    
+    def test_offsets_rebuilt_after_append(self):
+        """Test offsets are rebuilt after an append."""
+        adapter = FileAdapter(self.path)
+        extra = self.index.add('appended', SemanticDescriptor(domain='Science'))
+        adapter.append(extra)
+        self.assertEqual(adapter.get_item(extra.id).text, 'appended')
+    
+    def test_offsets_rechecked_after_external_rewrite(self):
+        """Test offsets are rechecked after the file is rewritten."""
+        reordered = list(reversed(self.items))
+        save_to_file(reordered, self.path, format='ndjson')
+        adapter = FileAdapter(self.path)
+        for item in self.items:
+            self.assertEqual(adapter.get_item(item.id).id, item.id)
+    
+    def test_get_item_on_read_only_directory(self):
+        """Test get_item() when the offsets file cannot be written."""
+        extra = self.index.add('appended', SemanticDescriptor(domain='Science'))
+        NDJSONSerializer.append_to_file(extra, self.path)
+        real_open = open
+        
+        def read_only_open(file, mode='r', *args, **kwargs):
+            if 'w' in mode:
+                raise PermissionError(13, 'Read-only file system', str(file))
+            return real_open(file, mode, *args, **kwargs)
+        
+        adapter = FileAdapter(self.path)
+        with mock.patch('builtins.open', read_only_open):
+            self.assertEqual(adapter.get_item(extra.id).text, 'appended')
+            self.assertEqual(adapter.get_item(self.items[0].id).text, 'text 0')
+    
+    def test_get_item_reports_corrupt_record(self):
+        """Test get_item() reports a corrupt record."""
+        with open(self.path, 'ab') as f:
+            f.write(b"{not json\n")
+        with self.assertRaises(IndexingError):
+            FileAdapter(self.path).get_item(self.items[0].id)
+    
+    def test_manager_get_without_loading(self):
+        """Test IndexManager.get() without loading the index."""
+        manager = IndexManager(FileAdapter(self.path))
+        self.assertEqual(manager.get(self.items[0].id).text, 'text 0')
+        self.assertIsNone(manager._index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Tests for the JSON codec.
+"""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from core import codec, SemanticDescriptor
+from indexer.index_text import TextIndex
+from indexer.serialize import load_from_file, save_to_file
+
+
+class TestCodecEquivalence(unittest.TestCase):
+    """Test the codec matches the stdlib json module with either backend."""
+    
+    def test_loads_stdlib_only_documents(self):
+        """Test NaN, infinities and wide ints load as with json."""
+        for text in ('{"a": NaN}', '[Infinity, -Infinity]', '%d' % 2 ** 70):
+            with self.subTest(text=text):
+                expected = json.loads(text)
+                self.assertEqual(repr(codec.loads(text)), repr(expected))
+                self.assertEqual(repr(codec.loads(text.encode())), repr(expected))
+    
+    def test_loads_invalid_raises_json_error(self):
+        """Test invalid input raises json.JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads('{"a": ')
+    
+    def test_dumps_matches_stdlib(self):
+        """Test dumps() output loads like json.dumps() output."""
+        values = [
+            {'a': float('nan'), 'b': [float('inf'), -float('inf')]},
+            {'big': 2 ** 70},
+            {1: 'one', None: 'none', True: 'yes'},
+            {'text': 'Science → Biology', 'nested': [{'x': 1.5}, (1, 2)]},
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    json.loads(codec.dumps(value)),
+                    json.loads(json.dumps(value, ensure_ascii=False)),
+                )
+                self.assertEqual(
+                    repr(codec.loads(codec.dumps(value, indent=2))),
+                    repr(json.loads(json.dumps(value))),
+                )
+    
+    @unittest.skipIf(codec.orjson is None, 'orjson not installed')
+    def test_backends_write_same_bytes(self):
+        """Test orjson and the stdlib fallback write identical bytes."""
+        values = [
+            {'text': 'Zellbiologie – Überblick', 'tags': ['a', 'b'], 'none': None},
+            {'floats': [1.5e20, 1e16, 9999999999999998.0, 1e-7, 1e-4, 0.1, -0.0, 2.5]},
+            {1: 'one', True: 'yes', None: 'none', 'nested': [{}, [], (1, 2)]},
+            [float('nan'), 2 ** 70, 'é'],
+        ]
+        for value in values:
+            for indent in (None, 2):
+                with self.subTest(value=value, indent=indent):
+                    fast = codec.dumpb(value, indent=indent)
+                    with mock.patch('core.codec.orjson', None):
+                        fallback = codec.dumpb(value, indent=indent)
+                    self.assertEqual(fast, fallback)
+    
+    def test_dumps_rejects_non_json_types(self):
+        """Test values json cannot encode raise TypeError."""
+        import enum
+        import uuid
+        
+        class Colour(enum.Enum):
+            RED = 1
+        
+        for value in ({'when': datetime(2024, 1, 1)}, {datetime(2024, 1, 1): 1},
+                      [uuid.uuid4()], {'colour': Colour.RED}):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    json.dumps(value)
+                with self.assertRaises(TypeError):
+                    codec.dumps(value)
+
+
+class TestCodecBackends(unittest.TestCase):
+    """Test that orjson and stdlib backends are interchangeable."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        self.index.add('Zellbiologie – Überblick',
+                       SemanticDescriptor(domain='Science → Biology'),
+                       {'tags': ['a', 'b'], 'score': 2})
+    
+    def test_indented_output_matches_stdlib(self):
+        """Test indented output matches json.dumps()."""
+        data = [{'text': 'é → x', 'nested': {'empty': [], 'none': None}}]
+        self.assertEqual(
+            codec.dumps(data, indent=2),
+            json.dumps(data, indent=2, ensure_ascii=False),
+        )
+    
+    def test_files_readable_by_either_backend(self):
+        """Test files written by one backend load with the other."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt in ('json', 'ndjson'):
+                path = Path(tmp) / f'items.{fmt}'
+                save_to_file(self.index.get_all(), path, format=fmt)
+                with mock.patch('core.codec.orjson', None):
+                    fallback = load_from_file(path, format=fmt)
+                    save_to_file(fallback, path, format=fmt)
+                restored = load_from_file(path, format=fmt)
+                with self.subTest(format=fmt):
+                    self.assertEqual(
+                        [item.to_dict() for item in restored],
+                        [item.to_dict() for item in self.index.get_all()],
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+"""
+Tests for the SemanticDescriptor class.
+"""
+
+import json
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import codec, NormalizationError, SemanticDescriptor
+from core import descriptor as descriptor_module
+from core.descriptor import trust_normalized
+from indexer.index_text import IndexedText
+from query.predicates import FieldEquals
+
+
+class TestDescriptorJsonIO(unittest.TestCase):
+    """Test descriptor JSON round trips regardless of codec backend."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.descriptor = SemanticDescriptor(
+            domain='Science → Biology',
+            intent='Research',
+            custom_fields={'region': 'Europe'},
+        )
+    
+    def test_json_string_round_trip(self):
+        """Test to_json() and from_json() round trip."""
+        restored = SemanticDescriptor.from_json(self.descriptor.to_json())
+        self.assertEqual(restored, self.descriptor)
+    
+    def test_json_file_round_trip(self):
+        """Test to_file() and from_file() round trip."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'descriptor.json'
+            self.descriptor.to_file(path)
+            restored = SemanticDescriptor.from_file(path)
+        self.assertEqual(restored, self.descriptor)
+    
+    def test_to_json_is_stdlib_compatible(self):
+        """Test to_json() output loads with the json module."""
+        data = json.loads(self.descriptor.to_json(indent=4))
+        self.assertEqual(data, self.descriptor.to_dict())
+    
+    def test_stdlib_fallback_round_trip(self):
+        """Test a file round trip without orjson."""
+        with mock.patch('core.codec.orjson', None):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / 'descriptor.json'
+                self.descriptor.to_file(path)
+                restored = SemanticDescriptor.from_file(path)
+        self.assertEqual(restored, self.descriptor)
+
+
+class TestTrustedConstruction(unittest.TestCase):
+    """Test the normalization-skipping construction path."""
+    
+    def test_trusted_from_dict_matches_normalized(self):
+        """Test trusted from_dict() of normalized data matches from_dict()."""
+        data = {'domain': 'Science → Biology', 'intent': 'Research'}
+        self.assertEqual(
+            SemanticDescriptor.from_dict(data, trusted=True),
+            SemanticDescriptor.from_dict(data),
+        )
+    
+    def test_trusted_skips_normalization(self):
+        """Test trusted values are kept as given."""
+        descriptor = SemanticDescriptor.from_dict(
+            {'domain': 'Science->Biology'}, trusted=True
+        )
+        self.assertEqual(descriptor.domain, 'Science->Biology')
+    
+    def test_trust_flag_is_scoped(self):
+        """Test trust_normalized() only applies inside its block."""
+        with trust_normalized():
+            with trust_normalized():
+                pass
+            raw = SemanticDescriptor(domain='Science->Biology')
+        normalized = SemanticDescriptor(domain='Science->Biology')
+        self.assertEqual(raw.domain, 'Science->Biology')
+        self.assertEqual(normalized.domain, 'Science → Biology')
+
+
+class TestDescriptorDerivedStateCache(unittest.TestCase):
+    """Test that cached dict/hash state tracks field changes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.descriptor = SemanticDescriptor(domain='Science', intent='Research')
+    
+    def test_to_dict_returns_copy(self):
+        """Test to_dict() returns a copy."""
+        self.descriptor.to_dict()['domain'] = 'Mutated'
+        self.assertEqual(self.descriptor.to_dict()['domain'], 'Science')
+    
+    def test_set_field_refreshes_state(self):
+        """Test set_field() refreshes the cached state."""
+        before = hash(self.descriptor)
+        self.descriptor.set_field('tone', 'Analytical')
+        self.descriptor.set_field('region', 'Europe')
+        self.assertIn('tone', self.descriptor.get_filled_fields())
+        self.assertIn('region', self.descriptor.to_dict())
+        self.assertNotEqual(hash(self.descriptor), before)
+    
+    def test_attribute_assignment_refreshes_state(self):
+        """Test attribute assignment refreshes the cached state."""
+        self.descriptor.to_dict()
+        self.descriptor.audience = 'Researchers'
+        self.assertEqual(self.descriptor.to_dict()['audience'], 'Researchers')
+    
+    def test_equal_descriptors_hash_equal(self):
+        """Test equal descriptors hash equal."""
+        other = SemanticDescriptor(intent='Research', domain='Science')
+        self.assertEqual(self.descriptor, other)
+        self.assertEqual(len({self.descriptor, other}), 1)
+    
+    def test_in_place_custom_field_change_refreshes_state(self):
+        """Test in-place custom_fields changes refresh the cached state."""
+        descriptor = SemanticDescriptor(
+            domain='Science', intent='Research', custom_fields={'region': 'Europe'}
+        )
+        before = hash(descriptor)
+        self.assertTrue(descriptor.validate().valid)
+        descriptor.custom_fields['region'] = 'Asia'
+        descriptor.custom_fields['status'] = 'Draft'
+        self.assertEqual(descriptor.to_dict()['region'], 'Asia')
+        self.assertIn('status', descriptor.get_filled_fields())
+        self.assertNotEqual(hash(descriptor), before)
+        self.assertEqual(descriptor, SemanticDescriptor(
+            domain='Science', intent='Research',
+            custom_fields={'region': 'Asia', 'status': 'Draft'},
+        ))
+    
+    def test_in_place_custom_field_change_drops_validation_memo(self):
+        """Test in-place custom_fields changes drop the validation memo."""
+        self.assertTrue(self.descriptor.validate().valid)
+        self.descriptor.custom_fields['tone'] = 'Not A Tone'
+        self.assertFalse(self.descriptor.validate().valid)
+    
+    def test_derived_state_is_not_a_field(self):
+        """Test the cached state is not a dataclass field."""
+        import dataclasses
+        names = [f.name for f in dataclasses.fields(SemanticDescriptor)]
+        self.assertNotIn('_cache', names)
+        self.assertNotIn('_valid_for', names)
+        self.assertEqual(dataclasses.asdict(self.descriptor)['domain'], 'Science')
+        self.assertNotIn('_cache', dataclasses.asdict(self.descriptor))
+
+
+class TestDescriptorSlots(unittest.TestCase):
+    """Test the slotted descriptor layout."""
+    
+    def test_no_instance_dict(self):
+        """Test descriptors have no __dict__."""
+        descriptor = SemanticDescriptor(domain='Science')
+        self.assertFalse(hasattr(descriptor, '__dict__'))
+        with self.assertRaises(AttributeError):
+            descriptor.unknown_attribute = 'value'
+    
+    def test_pickle_round_trip(self):
+        """Test descriptors survive pickling."""
+        descriptor = SemanticDescriptor(domain='Science', custom_fields={'a': 'b'})
+        self.assertEqual(pickle.loads(pickle.dumps(descriptor)), descriptor)
+
+
+class TestStandardFieldFastInit(unittest.TestCase):
+    """Test the generated standard-field normalizer matches the dict path."""
+    
+    def test_matches_general_path(self):
+        """Test standard fields normalize the same alongside custom fields."""
+        fields = {'domain': ' Science -> Biology ', 'intent': 'Research'}
+        fast = SemanticDescriptor(**fields)
+        general = SemanticDescriptor(**fields, custom_fields={'region': 'EU'})
+        self.assertEqual(fast.domain, general.domain)
+        self.assertEqual(fast.intent, general.intent)
+        self.assertIsNone(fast.tone)
+    
+    def test_errors_preserved(self):
+        """Test invalid values still raise NormalizationError."""
+        with self.assertRaises(NormalizationError):
+            SemanticDescriptor(domain='   ')
+        with self.assertRaises(NormalizationError):
+            SemanticDescriptor(intent=42)
+    
+    def test_empty_custom_fields_not_shared(self):
+        """Test an empty custom_fields dict passed in is not kept by reference."""
+        shared = {}
+        first = SemanticDescriptor(domain='Science', custom_fields=shared)
+        second = SemanticDescriptor(domain='Arts', custom_fields=shared)
+        first.custom_fields['region'] = 'Europe'
+        self.assertEqual(shared, {})
+        self.assertEqual(second.custom_fields, {})
+        self.assertNotIn('region', second.to_dict())
+        self.assertEqual(first.to_dict()['region'], 'Europe')
+
+
+class TestDescriptorMsgpack(unittest.TestCase):
+    """Test the optional msgpack persistence format."""
+    
+    @unittest.skipIf(descriptor_module.msgpack is None, 'msgpack not installed')
+    def test_round_trip(self):
+        """Test to_msgpack() and from_msgpack() round trip."""
+        descriptor = SemanticDescriptor(domain='Science', custom_fields={'a': 'b'})
+        restored = SemanticDescriptor.from_msgpack(descriptor.to_msgpack())
+        self.assertEqual(restored, descriptor)
+    
+    def test_missing_dependency(self):
+        """Test the msgpack methods raise ImportError without msgpack."""
+        with mock.patch('core.descriptor.msgpack', None):
+            with self.assertRaises(ImportError):
+                SemanticDescriptor(domain='Science').to_msgpack()
+            with self.assertRaises(ImportError):
+                SemanticDescriptor.from_msgpack(b'')
+
+
+class TestLoadedValueInterning(unittest.TestCase):
+    """Test that values and metadata keys from separate records are shared."""
+    
+    def test_trusted_and_loaded_records(self):
+        """Test trusted values and loaded metadata keys are shared."""
+        a = SemanticDescriptor.from_dict({'domain': ''.join(['Sci', 'ence'])}, trusted=True)
+        b = SemanticDescriptor.from_dict({'domain': ''.join(['Scie', 'nce'])}, trusted=True)
+        self.assertIs(a.domain, b.domain)
+        
+        records = [
+            codec.loads('{"id": "%s", "text": "t%s", "metadata": {"author_name": 1},'
+                        ' "created_at": "2024-01-01T00:00:00+00:00",'
+                        ' "updated_at": "2024-01-01T00:00:00+00:00"}' % (i, i))
+            for i in range(2)
+        ]
+        first, second = (IndexedText.from_dict(r) for r in records)
+        self.assertIs(next(iter(first.metadata)), next(iter(second.metadata)))
+
+
+class TestTrustedDescriptorIntern(unittest.TestCase):
+    """Test that trusted descriptors share interned field values."""
+    
+    def test_values_are_interned(self):
+        """Test trusted field values are interned."""
+        data = {'domain': ''.join(['Sci', 'ence']), 'x_key': ''.join(['cus', 'tom'])}
+        descriptor = SemanticDescriptor.from_dict(data, trusted=True)
+        self.assertIs(descriptor.domain, sys.intern('Science'))
+        self.assertIs(descriptor.custom_fields['x_key'], sys.intern('custom'))
+        self.assertTrue(FieldEquals('domain', 'Science').test(
+            IndexedText(id='a', text='t', descriptor=descriptor)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,294 @@
+"""
+Tests for the text index.
+"""
+
+import hashlib
+import pickle
+import unittest
+from unittest import mock
+
+from core import SemanticDescriptor
+from core.errors import IndexingError
+from indexer.index_text import compute_content_hash, IndexedText, TextIndex
+from query.filters import Filter, filter_index
+from query.predicates import (
+    AndPredicate,
+    FieldEquals,
+    MetadataEquals,
+    MetadataExists,
+    TextContains,
+)
+from query.query_builder import QueryBuilder
+
+
+class TestContentHashAlgorithm(unittest.TestCase):
+    """Test the content hash and migration of legacy SHA-256 hashes."""
+    
+    def _legacy_record(self, text):
+        return {
+            'id': 'legacy',
+            'text': text,
+            'created_at': '2024-01-01T00:00:00+00:00',
+            'updated_at': '2024-01-01T00:00:00+00:00',
+            'content_hash': hashlib.sha256(text.encode('utf-8')).hexdigest(),
+        }
+    
+    def test_round_trip_keeps_hash(self):
+        """Test a legacy hash is replaced and kept on round trip."""
+        item = IndexedText.from_dict(self._legacy_record('hello'))
+        again = IndexedText.from_dict(item.to_dict())
+        self.assertEqual(again.content_hash, compute_content_hash('hello'))
+    
+    def test_legacy_hash_recomputed_for_dedup(self):
+        """Test duplicates of legacy records are detected."""
+        index = TextIndex.from_list([self._legacy_record('hello')], validate_on_add=False)
+        with self.assertRaises(IndexingError):
+            index.add('hello', SemanticDescriptor(domain='Science'))
+
+
+class TestTimestampIsoCache(unittest.TestCase):
+    """Test that cached ISO timestamps track the datetime fields."""
+    
+    def test_reassigned_timestamp_is_reformatted(self):
+        """Test updated timestamps are reformatted."""
+        index = TextIndex(validate_on_add=False)
+        item = index.add('hello', SemanticDescriptor(domain='Science'))
+        first = item.to_dict()
+        self.assertEqual(first['updated_at'], item.updated_at.isoformat())
+        self.assertIs(item.to_dict()['updated_at'], first['updated_at'])
+        
+        index.update(item.id, metadata={'k': 'v'})
+        self.assertEqual(item.to_dict()['updated_at'], item.updated_at.isoformat())
+        self.assertEqual(item.to_dict()['created_at'], first['created_at'])
+
+
+class TestFieldIndex(unittest.TestCase):
+    """Test that index-backed filters match a full scan, in order."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        domains = ['Science → Biology', 'Science', 'Arts', 'Science → Physics']
+        for i, domain in enumerate(domains * 2):
+            self.index.add(f'text {i}', SemanticDescriptor(domain=domain, intent='Research'),
+                           item_id=f'id-{i}')
+        self.index.update('id-0', descriptor=SemanticDescriptor(domain='Arts'))
+        self.index.remove('id-2')
+    
+    def scan(self, predicate):
+        return [item.id for item in self.index.get_all() if predicate(item.descriptor)]
+    
+    def test_filters_match_scan(self):
+        """Test field filters match a full scan."""
+        ids = lambda items: [item.id for item in items]
+        self.assertEqual(ids(self.index.filter_by_field('Domain', 'Arts')),
+                         self.scan(lambda d: d.domain == 'Arts'))
+        self.assertEqual(ids(self.index.filter_by_fields({'domain': 'Science', 'intent': 'Research'})),
+                         self.scan(lambda d: d.domain == 'Science' and d.intent == 'Research'))
+        self.assertEqual(ids(self.index.filter_by_prefix('domain', 'Science')),
+                         self.scan(lambda d: d.domain.startswith('Science')))
+        self.assertEqual(self.index.filter_by_field('domain', 'Nope'), [])
+        self.assertEqual(self.index.get_field_values('intent'), {'Research'})
+    
+    def test_prefix_range_on_sorted_values(self):
+        """Test prefix filters over the sorted values."""
+        self.index.add('deep', SemanticDescriptor(domain='Science → Biology → Ecology'),
+                       item_id='deep')
+        self.index.add('sibling', SemanticDescriptor(domain='Sciences'), item_id='sibling')
+        ids = [item.id for item in self.index.filter_by_prefix('domain', 'Science → Biology')]
+        self.assertEqual(ids, ['id-4', 'deep'])
+        self.assertNotIn('sibling', [i.id for i in self.index.filter_by_prefix('domain', 'Science')])
+        self.index.remove('deep')
+        self.assertNotIn('Science → Biology → Ecology', self.index._sorted_values['domain'])
+        self.assertEqual(self.index._sorted_values['domain'],
+                         sorted(self.index.get_field_values('domain')))
+    
+    def test_clear_and_reload(self):
+        """Test the field index after clear() and bulk_load()."""
+        items = self.index.get_all()
+        self.index.clear()
+        self.assertEqual(self.index.get_field_values('domain'), set())
+        self.index.bulk_load(items)
+        self.assertEqual(len(self.index.filter_by_field('domain', 'Arts')), 2)
+
+
+class TestInPlaceItemChanges(unittest.TestCase):
+    """Test the inverted indexes follow items changed without update()."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        self.items = [
+            self.index.add(text, SemanticDescriptor(domain='Science', tone='Formal'),
+                           item_id=f'id-{i}')
+            for i, text in enumerate(['Quantum physics', 'Poetry'])
+        ]
+    
+    def ids(self, items):
+        return [item.id for item in items]
+    
+    def test_set_field(self):
+        """Test set_field() on an indexed descriptor."""
+        cached = QueryBuilder(self.index).where_tone('Formal').execute()
+        self.assertEqual(self.ids(cached), ['id-0', 'id-1'])
+        self.items[0].descriptor.set_field('tone', 'Analytical')
+        self.assertEqual(self.ids(self.index.filter_by_field('tone', 'Formal')), ['id-1'])
+        self.assertEqual(self.ids(QueryBuilder(self.index).where_tone('Formal').execute()),
+                         ['id-1'])
+        self.assertEqual(self.ids(filter_index(self.index, FieldEquals('tone', 'Analytical'))),
+                         ['id-0'])
+        self.assertEqual(
+            self.ids(Filter().from_index(self.index).where_tone('Analytical').execute()),
+            ['id-0'])
+    
+    def test_update_descriptor(self):
+        """Test update_descriptor() on an indexed item."""
+        self.items[1].update_descriptor(SemanticDescriptor(domain='Arts'))
+        self.assertEqual(self.ids(self.index.filter_by_prefix('domain', 'Arts')), ['id-1'])
+        self.assertEqual(self.ids(QueryBuilder(self.index).where_domain('Science').execute()),
+                         ['id-0'])
+        self.assertEqual(self.index.get_field_values('tone'), {'Formal'})
+    
+    def test_update_text(self):
+        """Test update_text() on an indexed item."""
+        self.items[1].update_text('Classical physics')
+        pred = TextContains('physics')
+        self.assertEqual(self.ids(QueryBuilder(self.index).where(pred).execute()),
+                         ['id-0', 'id-1'])
+        self.assertTrue(self.index.remove('id-1'))
+        self.assertEqual(self.index.ids_containing('physics'), {'id-0'})
+        self.index.add('Poetry', SemanticDescriptor(domain='Arts'))
+    
+    def test_update_through_index_does_not_rescan(self):
+        """Test TextIndex.update() does not trigger a rescan."""
+        self.index.version
+        self.index.update('id-0', text='Optics', descriptor=SemanticDescriptor(domain='Arts'))
+        with mock.patch.object(self.index, '_field_values',
+                               wraps=self.index._field_values) as field_values:
+            self.index.filter_by_field('domain', 'Arts')
+        field_values.assert_not_called()
+
+
+class TestAddMany(unittest.TestCase):
+    """Test batch inserts validate every entry before inserting any."""
+    
+    def test_invalid_entry_leaves_index_empty(self):
+        """Test one invalid entry leaves the index unchanged."""
+        index = TextIndex()
+        good = SemanticDescriptor(domain='Science', intent='Announcement')
+        with self.assertRaises(IndexingError):
+            index.add_many([('a', good, None), ('b', SemanticDescriptor(domain='Fake'), None)])
+        self.assertEqual(index.count(), 0)
+        
+        items = index.add_many([('a', good, None), ('b', good, {'k': 1})])
+        self.assertEqual([item.text for item in items], ['a', 'b'])
+        self.assertEqual(index.get(items[1].id).metadata, {'k': 1})
+
+
+class TestIndexedTextSlots(unittest.TestCase):
+    """Test the slotted IndexedText layout."""
+    
+    def test_no_instance_dict_and_pickle(self):
+        """Test items have no __dict__ and survive pickling."""
+        item = IndexedText(id='a', text='hello', descriptor=SemanticDescriptor(domain='Science'))
+        self.assertFalse(hasattr(item, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(item)).to_dict(), item.to_dict())
+
+
+class TestMetadataIndex(unittest.TestCase):
+    """Test metadata candidate lookups against a full scan, through updates."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        metadata = [{'author': 'ann'}, {'author': 'bob', 'tags': ['x']}, {}, {'tags': ['x']}]
+        for i, meta in enumerate(metadata):
+            self.index.add(f'text {i}', SemanticDescriptor(domain='Science'),
+                           metadata=meta, item_id=f'id-{i}')
+    
+    def assert_matches_scan(self, pred):
+        expected = [item.id for item in self.index.get_all() if pred(item)]
+        self.assertEqual([item.id for item in filter_index(self.index, pred)], expected)
+    
+    def test_lookups(self):
+        """Test metadata lookups match a full scan."""
+        for pred in (MetadataEquals('author', 'ann'), MetadataEquals('tags', ['x']),
+                     MetadataEquals('author', None), MetadataExists('tags'),
+                     MetadataExists('missing')):
+            with self.subTest(pred=pred.explain()):
+                self.assert_matches_scan(pred)
+        self.assertEqual(self.index.ids_with_metadata('author', 'ann'), {'id-0'})
+    
+    def test_update_and_remove(self):
+        """Test the metadata index follows update, remove and clear."""
+        self.index.update('id-2', metadata={'author': 'ann'})
+        self.index.remove('id-0')
+        self.assertEqual(self.index.ids_with_metadata('author', 'ann'), {'id-2'})
+        self.assert_matches_scan(MetadataEquals('author', 'ann'))
+        self.index.clear()
+        self.assertEqual(self.index.ids_with_metadata_key('author'), set())
+
+
+class TestLowerTextCache(unittest.TestCase):
+    """Test that the lowercased text is cached and follows text changes."""
+    
+    def test_cached_until_text_changes(self):
+        """Test the lowered text is reused until the text changes."""
+        item = IndexedText(id='a', text='Hello World', descriptor=SemanticDescriptor(domain='Science'))
+        lowered = item.lower_text()
+        self.assertEqual(lowered, 'hello world')
+        self.assertIs(item.lower_text(), lowered)
+        item.update_text('Bye')
+        self.assertEqual(item.lower_text(), 'bye')
+        self.assertFalse(TextContains('hello').test(item))
+        self.assertTrue(TextContains('BYE').test(item))
+
+
+class TestTokenIndex(unittest.TestCase):
+    """Test that case-insensitive TextContains is answered from the token index."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        for i, text in enumerate(['Quantum Physics', 'Classical physics intro',
+                                  'Poetry, prose', 'físICA cuántica']):
+            self.index.add(text, SemanticDescriptor(domain='Science'), item_id=f'id-{i}')
+    
+    def test_matches_substring_scan(self):
+        """Test token lookups match a substring scan."""
+        for needle in ['physics', 'PHYS', 'ics', 'a', 'cuánt', 'zzz', 'y, p', ' ']:
+            with self.subTest(needle=needle):
+                pred = TextContains(needle)
+                expected = {item.id for item in self.index.get_all() if pred(item)}
+                ids, rest = pred.resolve(self.index)
+                if ids is None:
+                    self.assertIs(rest, pred)
+                else:
+                    self.assertEqual(ids, expected)
+                    self.assertIsNone(rest)
+                result = QueryBuilder(self.index).where(pred).execute()
+                self.assertEqual({item.id for item in result}, expected)
+    
+    def test_follows_updates(self):
+        """Test the token index follows update, remove and clear."""
+        self.index.update('id-2', text='More physics')
+        self.assertEqual(self.index.ids_containing('physics'), {'id-0', 'id-1', 'id-2'})
+        self.assertEqual(self.index.ids_containing('poetry'), set())
+        self.index.remove('id-0')
+        self.assertEqual(self.index.ids_containing('quantum'), set())
+        self.index.clear()
+        self.assertEqual(self.index.ids_containing('physics'), set())
+    
+    def test_merged_and_conjuncts(self):
+        """Test AND of text conditions narrows by tokens."""
+        pred = AndPredicate(TextContains('physics'), TextContains('intro'),
+                            TextContains('s i'))
+        ids, rest = pred.resolve(self.index)
+        self.assertEqual(ids, {'id-1'})
+        self.assertIsInstance(rest, TextContains)
+        self.assertEqual([item.id for item in QueryBuilder(self.index).where(pred).execute()],
+                         ['id-1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ Tests for query functionality.
 
 import unittest
 from datetime import datetime, timedelta, timezone
+from unittest import mock
 
 from core import SemanticDescriptor
 from indexer import TextIndex, IndexedText
@@ -16,9 +17,47 @@ from query import (
     AndPredicate,
     OrPredicate,
     NotPredicate,
+    MetadataEquals,
     find_research_posts,
     find_tutorials,
+    analyze_field_distribution,
+    explain_predicate_tree,
+    explain_why_not_matched,
+    CustomPredicate,
+    FieldIn,
+    FieldStartsWith,
+    filter_index,
+    CreatedAfter,
+    CreatedBefore,
+    HierarchyDepth,
+    filter_items,
+    filter_items_parallel,
+    MetadataExists,
+    UpdatedBefore,
+    AlwaysFalse,
+    AlwaysTrue,
+    QueryResult,
 )
+from query.predicates import compile_predicate
+
+
+def make_index(domains, **fields):
+    """Build an unvalidated index with item 'id-{i}' ('text {i}') per domain."""
+    index = TextIndex(validate_on_add=False)
+    for i, domain in enumerate(domains):
+        index.add(f'text {i}', SemanticDescriptor(domain=domain, **fields), item_id=f'id-{i}')
+    return index
+
+
+class FieldIs(FieldEquals):
+    """FieldEquals subclass with extra state and its own test()."""
+    
+    def __init__(self, field_name, value, negate=False):
+        super().__init__(field_name, value)
+        self.negate = negate
+    
+    def test(self, item):
+        return super().test(item) != self.negate
 
 
 class TestPredicates(unittest.TestCase):
@@ -128,6 +167,25 @@ class TestPredicates(unittest.TestCase):
         
         self.assertIn('domain', explanation)
         self.assertIn('Science', explanation)
+    
+    def test_subclass_cache_key(self):
+        """Test a subclass is not keyed on inherited key fields."""
+        self.assertIsNone(FieldIs('tone', 'Analytical').cache_key())
+        self.assertIsNone(
+            AndPredicate(
+                FieldIs('tone', 'Analytical'),
+                FieldIs('tone', 'Analytical', negate=True)
+            ).cache_key()
+        )
+        
+        # Same name, different class: keys must not collide
+        class FieldEquals_(FieldEquals):
+            _key_fields = FieldEquals._key_fields
+        FieldEquals_.__name__ = 'FieldEquals'
+        self.assertNotEqual(
+            FieldEquals_('tone', 'Analytical').cache_key(),
+            FieldEquals('tone', 'Analytical').cache_key()
+        )
 
 
 class TestQueryBuilder(unittest.TestCase):
@@ -172,6 +230,27 @@ class TestQueryBuilder(unittest.TestCase):
         self.assertEqual(len(result.items), 2)
         self.assertEqual(result.total, 2)
     
+    def test_predicate_subclass(self):
+        """Test a subclass overriding test() is not answered by its base."""
+        for _ in range(2):
+            plain = QueryBuilder(self.index).where(
+                FieldIs('audience', 'Beginners')).execute()
+            negated = QueryBuilder(self.index).where(
+                FieldIs('audience', 'Beginners', negate=True)).execute()
+            self.assertEqual(len(plain.items), 1)
+            self.assertEqual(len(negated.items), 2)
+        
+        both = AndPredicate(
+            FieldIs('audience', 'Beginners'),
+            FieldIs('audience', 'Beginners', negate=True)
+        )
+        self.assertEqual(len(QueryBuilder(self.index).where(both).execute().items), 0)
+        either = OrPredicate(
+            FieldEquals('audience', 'Beginners'),
+            FieldIs('audience', 'Beginners', negate=True)
+        )
+        self.assertEqual(len(QueryBuilder(self.index).where(either).execute().items), 3)
+    
     def test_exact_match_query(self):
         """Test exact match query."""
         result = (QueryBuilder(self.index)
@@ -359,6 +438,24 @@ class TestFilter(unittest.TestCase):
         
         self.assertIsNotNone(item)
     
+    def test_filter_large_batch_unhashable_value(self):
+        """Test a compiled batch filter on a list-valued metadata condition."""
+        items = [
+            self.index.add(
+                f'Tagged text {i}',
+                SemanticDescriptor(domain='Science', intent='Research', tone='Neutral'),
+                metadata={'tags': ['x']}
+            )
+            for i in range(70)
+        ]
+        
+        result = (Filter(items)
+                 .where_metadata('tags', ['x'])
+                 .where_tone('Neutral')
+                 .execute())
+        
+        self.assertEqual(len(result), 70)
+    
     def test_filter_exists(self):
         """Test filter exists."""
         exists = (Filter()
@@ -459,6 +556,34 @@ class TestQueryWithMetadata(unittest.TestCase):
                  .execute())
         
         self.assertEqual(len(result.items), 2)
+    
+    def test_unhashable_metadata_value_in_composite(self):
+        """Test AND/OR/NOT around a list-valued metadata condition."""
+        self.index.add(
+            'Tagged research',
+            SemanticDescriptor(domain='Science', intent='Research'),
+            metadata={'tags': ['x']}
+        )
+        tags = MetadataEquals('tags', ['x'])
+        science = HierarchyMatches('domain', 'Science')
+        cases = [
+            (AndPredicate(tags, science), 1),
+            (OrPredicate(tags, FieldEquals('domain', 'Arts')), 1),
+            (NotPredicate(tags), 2),
+            (AndPredicate(NotPredicate(tags), science), 2),
+        ]
+        for predicate, expected in cases:
+            with self.subTest(predicate=predicate.explain()):
+                self.assertIsNone(predicate.cache_key())
+                for _ in range(2):
+                    result = QueryBuilder(self.index).where(predicate).execute()
+                    self.assertEqual(len(result.items), expected)
+        
+        result = (QueryBuilder(self.index)
+                 .where_metadata('tags', ['x'])
+                 .where_domain('Science')
+                 .execute())
+        self.assertEqual(len(result.items), 1)
 
 
 class TestQueryWithTimestamps(unittest.TestCase):
@@ -575,5 +700,684 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(len(result.items), 1)
 
 
+class TestFieldDistribution(unittest.TestCase):
+    """Test the single-pass field distribution counts."""
+    
+    def test_counts_skip_unset_values(self):
+        """Test distribution counts skip unset values."""
+        index = TextIndex(validate_on_add=False)
+        index.add('a', SemanticDescriptor(domain='Science', intent='Research'))
+        index.add('b', SemanticDescriptor(domain='Science'))
+        index.add('c', SemanticDescriptor(domain='Arts'))
+        distribution = analyze_field_distribution(index.get_all())
+        self.assertEqual(list(distribution), ['domain', 'intent'])
+        self.assertEqual(distribution['domain'], {'Science': 2, 'Arts': 1})
+        self.assertEqual(distribution['intent'], {'Research': 1})
+        self.assertEqual(analyze_field_distribution([]), {})
+
+
+class TestPredicateExplanationDispatch(unittest.TestCase):
+    """Test type-dispatched predicate walkers, including subclasses."""
+    
+    def test_tree(self):
+        """Test the predicate tree explanation."""
+        predicate = FieldEquals('domain', 'Arts') & (TextContains('x') | ~TextContains('y'))
+        self.assertEqual(
+            explain_predicate_tree(predicate),
+            "AND:\n  • domain = 'Arts'\n  OR:\n"
+            "    • text contains 'x' (case-insensitive)\n"
+            "    NOT:\n      • text contains 'y' (case-insensitive)",
+        )
+    
+    def test_subclass_uses_parent_handler(self):
+        """Test a predicate subclass is explained like its parent."""
+        class DomainEquals(FieldEquals):
+            def __init__(self, value):
+                super().__init__('domain', value)
+        
+        index = TextIndex(validate_on_add=False)
+        item = index.add('hello', SemanticDescriptor(domain='Science'))
+        explanation = explain_why_not_matched(item, DomainEquals('Arts'))
+        self.assertIn("domain = 'Science' (expected 'Arts')", explanation)
+
+
+class TestCombinedTextSearch(unittest.TestCase):
+    """Test single-pass multi-substring matching against per-substring tests."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        for i, text in enumerate(['Alpha beta', 'GAMMA', 'a.b (c)', 'delta']):
+            self.index.add(text, SemanticDescriptor(domain='Science'), item_id=f'id-{i}')
+    
+    def test_or_of_text_contains(self):
+        """Test OR of text conditions matches testing each."""
+        children = (TextContains('gamma'), TextContains('a.b'), TextContains('Beta', True),
+                    TextContains('Alpha', True), FieldEquals('domain', 'Arts'))
+        combined = OrPredicate(*children)
+        for item in self.index.get_all():
+            with self.subTest(text=item.text):
+                self.assertEqual(combined.test(item), any(p.test(item) for p in children))
+    
+    def test_scan_text(self):
+        """Test scan_text with several substrings."""
+        self.assertEqual(self.index.scan_text(['gamma', '(C)']), {'id-1', 'id-2'})
+        self.assertEqual(self.index.scan_text(['gamma'], case_sensitive=True), set())
+        self.assertEqual(self.index.scan_text([]), set())
+
+
+class TestAndPredicateOrdering(unittest.TestCase):
+    """Test that AND tests cheap conjuncts first without changing results."""
+    
+    def test_cheap_predicate_short_circuits_custom(self):
+        """Test cheap conjuncts run before custom predicates."""
+        calls = []
+        custom = CustomPredicate(lambda item: calls.append(item.id) or True, 'custom')
+        predicate = AndPredicate(custom, TextContains('hello') & FieldEquals('domain', 'Arts'))
+        index = TextIndex(validate_on_add=False)
+        science = index.add('hello', SemanticDescriptor(domain='Science'), item_id='s')
+        arts = index.add('hello', SemanticDescriptor(domain='Arts'), item_id='a',
+                         allow_duplicates=True)
+        self.assertFalse(predicate.test(science))
+        self.assertTrue(predicate.test(arts))
+        self.assertEqual(calls, ['a'])
+        self.assertEqual(
+            predicate.explain(),
+            "(custom AND (text contains 'hello' (case-insensitive) AND domain = 'Arts'))",
+        )
+    
+    def test_exact_hierarchy_ranks_with_equality(self):
+        """Test exact hierarchy matches rank with equality checks."""
+        under = HierarchyMatches('domain', 'Science')
+        exact = HierarchyMatches('intent', 'Research', exact=True)
+        tone = FieldEquals('tone', 'Calm')
+        self.assertEqual(AndPredicate(under, exact, tone)._evaluation_order, (exact, tone, under))
+
+
+class TestTextContainsBatch(unittest.TestCase):
+    """Test that the precomputed needle and test_many agree with test."""
+    
+    def test_test_many_matches_test(self):
+        """Test test_many agrees with test."""
+        items = [IndexedText(id=str(i), text=t, descriptor=SemanticDescriptor(domain='Science'))
+                 for i, t in enumerate(['Alpha Beta', 'beta', 'BETAMAX', 'gamma'])]
+        for pred in (TextContains('BeTa'), TextContains('Beta', case_sensitive=True)):
+            with self.subTest(case_sensitive=pred.case_sensitive):
+                self.assertEqual(pred.test_many(items), [pred.test(item) for item in items])
+        self.assertEqual(TextContains('beta').test_many(items), [True, True, True, False])
+
+
+class TestIndexedQueryExecution(unittest.TestCase):
+    """Test that candidate narrowing returns the same results as a full scan."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        domains = ['Science', 'Science → Physics', 'Arts', 'Science → Biology', 'Sciences']
+        for i, domain in enumerate(domains):
+            self.index.add(f'text {i}', SemanticDescriptor(domain=domain, tone='Calm' if i % 2 else None),
+                           item_id=f'id-{i}')
+    
+    def test_matches_full_scan(self):
+        """Test index-narrowed queries match a full scan."""
+        predicates = [
+            FieldEquals('domain', 'Arts'),
+            HierarchyMatches('domain', 'Science'),
+            HierarchyMatches('domain', 'Science', exact=True),
+            FieldStartsWith('domain', 'Sci'),
+            FieldIn('domain', {'Arts', 'Sciences'}),
+            AndPredicate(HierarchyMatches('domain', 'Science'), FieldEquals('tone', 'Calm')),
+            AndPredicate(HierarchyMatches('domain', 'Science'), TextContains('3')),
+            OrPredicate(FieldEquals('domain', 'Arts'), TextContains('0')),
+        ]
+        for pred in predicates:
+            with self.subTest(pred=pred.explain()):
+                expected = [item.id for item in self.index.get_all() if pred(item)]
+                result = QueryBuilder(self.index).where(pred).execute()
+                self.assertEqual([item.id for item in result], expected)
+                self.assertEqual(result.total, len(expected))
+    
+    def test_candidate_ids(self):
+        """Test candidate ids, and predicates without any."""
+        self.assertEqual(HierarchyMatches('domain', 'Science').candidate_ids(self.index),
+                         {'id-0', 'id-1', 'id-3'})
+        self.assertIsNone(TextContains('x', case_sensitive=True).candidate_ids(self.index))
+        self.assertIsNone(OrPredicate(FieldEquals('domain', 'Arts'),
+                                      TextContains('0', case_sensitive=True)).candidate_ids(self.index))
+    
+    def test_filter_helpers(self):
+        """Test filter_index and Filter.from_index snapshots."""
+        pred = HierarchyMatches('domain', 'Science')
+        expected = [item.id for item in self.index.get_all() if pred(item)]
+        self.assertEqual([item.id for item in filter_index(self.index, pred)], expected)
+        
+        snapshot = Filter().from_index(self.index).where_domain('Science')
+        self.index.add('late', SemanticDescriptor(domain='Science'), item_id='late')
+        self.assertEqual([item.id for item in snapshot.execute()], expected)
+
+
+class TestFieldInFrozenValues(unittest.TestCase):
+    """Test that FieldIn accepts any iterable and freezes it once."""
+    
+    def test_list_values(self):
+        """Test FieldIn freezes a list of values."""
+        source = ['Arts', 'Science']
+        pred = FieldIn('domain', source)
+        source.append('History')
+        self.assertIsInstance(pred.values, frozenset)
+        self.assertEqual(pred.values, {'Arts', 'Science'})
+        item = IndexedText(id='a', text='t', descriptor=SemanticDescriptor(domain='Science'))
+        self.assertTrue(pred.test(item))
+        self.assertEqual(pred.explain(), "domain in ['Arts', 'Science']")
+
+
+class TestTimestampAndDepthCandidates(unittest.TestCase):
+    """Test creation-time range and per-value depth lookups against a scan."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.index = TextIndex(validate_on_add=False)
+        domains = ['Science', 'Science → Physics', 'Science → Physics → Optics', 'Arts']
+        for i, domain in enumerate(domains):
+            self.index.add(f'text {i}', SemanticDescriptor(domain=domain), item_id=f'id-{i}')
+            self.index.get(f'id-{i}').created_at = self.base + timedelta(days=i)
+        # Re-index after moving created_at, as a load would have
+        self.index.bulk_load(self.index.get_all())
+    
+    def test_matches_full_scan(self):
+        """Test time and depth candidates match a full scan."""
+        day = timedelta(days=1)
+        predicates = [
+            CreatedAfter(self.base + day),
+            CreatedBefore(self.base + 2 * day),
+            AndPredicate(CreatedAfter(self.base), CreatedBefore(self.base + 3 * day)),
+            HierarchyDepth('domain', min_depth=2),
+            HierarchyDepth('domain', max_depth=1),
+        ]
+        for pred in predicates:
+            with self.subTest(pred=pred.explain()):
+                expected = {item.id for item in self.index.get_all() if pred(item)}
+                self.assertEqual(pred.candidate_ids(self.index), expected)
+    
+    def test_removed_items_leave_the_timeline(self):
+        """Test removed items leave the creation-time index."""
+        self.index.remove('id-3')
+        self.assertEqual(self.index.ids_created(after=self.base), {'id-1', 'id-2'})
+        self.index.clear()
+        self.assertEqual(self.index.ids_created(), set())
+
+
+class TestPredicateResolve(unittest.TestCase):
+    """Test that conjuncts answered exactly by the index are not retested."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = make_index(['Science', 'Arts', 'Science → Physics'])
+    
+    def test_residual_predicate(self):
+        """Test the part the index cannot answer is returned."""
+        text = TextContains('2', case_sensitive=True)
+        ids, rest = AndPredicate(HierarchyMatches('domain', 'Science'), text).resolve(self.index)
+        self.assertEqual(ids, {'id-0', 'id-2'})
+        self.assertIs(rest, text)
+        
+        ids, rest = OrPredicate(FieldEquals('domain', 'Arts'),
+                                FieldIn('domain', ['Science'])).resolve(self.index)
+        self.assertEqual(ids, {'id-0', 'id-1'})
+        self.assertIsNone(rest)
+    
+    def test_exact_conjuncts_skip_test(self):
+        """Test exactly answered conjuncts are not tested."""
+        pred = AndPredicate(FieldEquals('domain', 'Arts'), FieldStartsWith('domain', 'A'))
+        with mock.patch.object(FieldEquals, 'test', side_effect=AssertionError), \
+                mock.patch.object(FieldStartsWith, 'test', side_effect=AssertionError):
+            self.assertEqual([item.id for item in filter_index(self.index, pred)], ['id-1'])
+
+
+class TestQueryResultCache(unittest.TestCase):
+    """Test that repeated queries are served from cache until the index changes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = make_index(['Science', 'Arts', 'Science'])
+    
+    def run_query(self):
+        return [item.id for item in QueryBuilder(self.index).where_domain('Science').execute()]
+    
+    def test_hit_and_invalidation(self):
+        """Test cached results are dropped when the index changes."""
+        self.assertEqual(self.run_query(), ['id-0', 'id-2'])
+        with mock.patch('query.query_builder.filter_index', side_effect=AssertionError):
+            self.assertEqual(self.run_query(), ['id-0', 'id-2'])
+        self.index.remove('id-0')
+        self.assertEqual(self.run_query(), ['id-2'])
+        self.index.update('id-1', descriptor=SemanticDescriptor(domain='Science'))
+        self.assertEqual(self.run_query(), ['id-1', 'id-2'])
+    
+    def test_in_place_changes(self):
+        """Test cached results are dropped when items change in place."""
+        self.assertEqual(self.run_query(), ['id-0', 'id-2'])
+        self.index.get('id-1').descriptor.domain = 'Science'
+        self.assertEqual(self.run_query(), ['id-0', 'id-1', 'id-2'])
+        
+        now = datetime.now(timezone.utc)
+        for item in self.index.get_all():
+            item.updated_at = now - timedelta(days=1)
+        builder = QueryBuilder(self.index).where_domain('Science').where_updated_after(now - timedelta(hours=1))
+        self.assertEqual(builder.execute().items, [])
+        item = self.index.get('id-0')
+        item.update_text(item.text)
+        self.assertEqual([item.id for item in builder.execute()], ['id-0'])
+    
+    def test_cache_keys(self):
+        """Test cache keys of combined predicates."""
+        a, b = FieldEquals('domain', 'Arts'), TextContains('x')
+        self.assertEqual(AndPredicate(a, b).cache_key(), AndPredicate(b, a).cache_key())
+        self.assertNotEqual(AndPredicate(a, b).cache_key(), OrPredicate(a, b).cache_key())
+        self.assertIsNone(AndPredicate(a, CustomPredicate(lambda item: True, 'any')).cache_key())
+
+
+class TestTopKSelection(unittest.TestCase):
+    """Test that small-limit sorted queries match a full sort, ties included."""
+    
+    def test_matches_full_sort(self):
+        """Test limited sorted queries match a full sort."""
+        index = TextIndex(validate_on_add=False)
+        for i in range(60):
+            index.add(f'text {i}', SemanticDescriptor(domain='Science'),
+                      metadata={'rank': i % 5}, item_id=f'id-{i}')
+        rank = lambda item: item.metadata['rank']
+        for reverse in (False, True):
+            expected = sorted(index.get_all(), key=rank, reverse=reverse)[2:5]
+            with self.subTest(reverse=reverse):
+                result = QueryBuilder(index).order_by(rank, reverse).offset(2).limit(3).execute()
+                self.assertEqual([item.id for item in result], [item.id for item in expected])
+                self.assertEqual(result.total, 60)
+
+
+class TestParallelFilter(unittest.TestCase):
+    """Test that the multi-process filter keeps results and their order."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.items = [
+            IndexedText(id=f'id-{i}', text=f'text {i}',
+                        descriptor=SemanticDescriptor(domain='Science' if i % 3 else 'Arts'))
+            for i in range(30)
+        ]
+    
+    def test_matches_serial(self):
+        """Test the parallel filter matches a serial run."""
+        pred = AndPredicate(FieldEquals('domain', 'Science'), TextContains('1'))
+        expected = filter_items(self.items, pred)
+        self.assertEqual(filter_items_parallel(self.items, pred, workers=2, chunksize=7), expected)
+        self.assertEqual(Filter(self.items).where(pred).execute(workers=2), expected)
+    
+    def test_unpicklable_predicate_runs_serially(self):
+        """Test an unpicklable predicate is filtered serially."""
+        pred = CustomPredicate(lambda item: item.id.endswith('5'), 'ends with 5')
+        with mock.patch('query.filters.ProcessPoolExecutor', side_effect=AssertionError):
+            result = filter_items_parallel(self.items, pred, workers=2)
+        self.assertEqual([item.id for item in result], ['id-5', 'id-15', 'id-25'])
+
+
+class TestCompiledPredicate(unittest.TestCase):
+    """Test that compiled predicate trees agree with tree-walking test()."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        domains = ['Science', 'Science → Physics', 'Arts', 'History']
+        self.items = []
+        for i in range(12):
+            descriptor = SemanticDescriptor(domain=domains[i % 4], tone='Calm' if i % 2 else None)
+            item = IndexedText(id=f'id-{i}', text=f'Text {i} ALPHA' if i % 3 else f'text {i}',
+                               descriptor=descriptor, metadata={'n': i % 3} if i % 5 else {})
+            item.created_at = base + timedelta(days=i)
+            self.items.append(item)
+        self.base = base
+    
+    def test_matches_tree_walk(self):
+        """Test compiled predicates agree with test()."""
+        predicates = [
+            FieldEquals('domain', 'Arts'),
+            FieldIn('tone', ['Calm']),
+            FieldStartsWith('domain', 'Sci'),
+            HierarchyMatches('domain', 'Science'),
+            HierarchyMatches('domain', 'Science', exact=True),
+            HierarchyDepth('domain', min_depth=2),
+            TextContains('alpha'),
+            TextContains('ALPHA', case_sensitive=True),
+            MetadataEquals('n', 1),
+            MetadataExists('n'),
+            CreatedAfter(self.base + timedelta(days=5)),
+            UpdatedBefore(self.base),
+            ~FieldEquals('tone', 'Calm'),
+            AndPredicate(),
+            OrPredicate(),
+            HierarchyMatches('domain', 'Science') & TextContains('alpha') & ~MetadataExists('n'),
+            OrPredicate(TextContains('1'), TextContains('alpha'), FieldEquals('domain', 'Arts')),
+            CustomPredicate(lambda item: item.id.endswith('1'), 'ends with 1'),
+        ]
+        for pred in predicates:
+            with self.subTest(pred=pred.explain()):
+                compiled = compile_predicate(pred)
+                self.assertEqual([compiled(item) for item in self.items],
+                                 [pred.test(item) for item in self.items])
+    
+    def test_subclass_overriding_test_is_called(self):
+        """Test a subclass overriding test() is called from compiled code."""
+        class Never(FieldEquals):
+            def test(self, item):
+                return False
+        
+        self.assertFalse(any(map(compile_predicate(Never('domain', 'Arts')), self.items)))
+    
+    def test_equivalent_queries_share_function(self):
+        """Test equivalent predicates share one compiled function."""
+        a, b = FieldEquals('domain', 'Arts'), TextContains('x')
+        self.assertIs(compile_predicate(AndPredicate(a, b)), compile_predicate(AndPredicate(b, a)))
+
+
+class TestCombinatorSimplification(unittest.TestCase):
+    """Test constant folding and deduplication in AND/OR."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.item = IndexedText(id='a', text='hello', descriptor=SemanticDescriptor(domain='Arts'))
+    
+    def test_and(self):
+        """Test AND folding and deduplication."""
+        arts = FieldEquals('domain', 'Arts')
+        pred = AndPredicate(arts, AlwaysTrue(), AndPredicate(FieldEquals('domain', 'Arts')))
+        self.assertEqual(pred._evaluation_order, (arts,))
+        self.assertTrue(pred.test(self.item))
+        self.assertEqual(pred.explain(), "(domain = 'Arts' AND always true AND (domain = 'Arts'))")
+        
+        folded = AndPredicate(arts, AlwaysFalse(), CustomPredicate(self.fail, 'never called'))
+        self.assertFalse(folded.test(self.item))
+        self.assertEqual(folded.candidate_ids(TextIndex()), set())
+    
+    def test_or(self):
+        """Test OR folding and deduplication."""
+        pred = OrPredicate(AlwaysFalse(), TextContains('x'), OrPredicate(TextContains('x')))
+        self.assertEqual(len(pred._evaluation_order), 1)
+        self.assertFalse(pred.test(self.item))
+        self.assertTrue(OrPredicate(TextContains('x'), AlwaysTrue()).test(self.item))
+        self.assertFalse(OrPredicate(AlwaysFalse()).test(self.item))
+
+
+class TestAndTextMerging(unittest.TestCase):
+    """Test that case-insensitive text conjuncts are checked against one lowered copy."""
+    
+    def test_merged_conjuncts(self):
+        """Test merged text conjuncts keep their results."""
+        pred = AndPredicate(TextContains('Alpha'), FieldEquals('domain', 'Arts'),
+                            TextContains('beta'), TextContains('Gamma', case_sensitive=True))
+        self.assertEqual(len(pred._evaluation_order), 3)
+        compiled = compile_predicate(pred)
+        for text, expected in [('ALPHA beta Gamma', True), ('alpha beta gamma', False),
+                               ('alpha Gamma', False)]:
+            item = IndexedText(id='a', text=text, descriptor=SemanticDescriptor(domain='Arts'))
+            with self.subTest(text=text):
+                self.assertEqual(pred.test(item), expected)
+                self.assertEqual(compiled(item), expected)
+
+
+class TestEarlyExitLookups(unittest.TestCase):
+    """Test that first() and exists() stop at the first match."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = make_index(['Science'] * 10)
+        self.calls = []
+        self.pred = CustomPredicate(lambda item: self.calls.append(item.id) or True, 'any')
+    
+    def test_filter(self):
+        """Test Filter.first() and exists() stop early."""
+        self.assertEqual(Filter().from_index(self.index).where(self.pred).first().id, 'id-0')
+        self.assertTrue(Filter().from_index(self.index).where(self.pred).exists())
+        self.assertEqual(self.calls, ['id-0', 'id-0'])
+        self.assertIsNone(Filter().from_index(self.index).where_domain('Arts').first())
+    
+    def test_query_builder(self):
+        """Test QueryBuilder.first() and exists() stop early."""
+        self.assertEqual(QueryBuilder(self.index).where(self.pred).offset(2).first().id, 'id-2')
+        self.assertTrue(QueryBuilder(self.index).where(self.pred).exists())
+        self.assertEqual(self.calls, ['id-0', 'id-1', 'id-2', 'id-0'])
+        self.assertFalse(QueryBuilder(self.index).where_domain('Arts').exists())
+
+
+class TestFieldPredicateAccessors(unittest.TestCase):
+    """Test that field accessors resolved at construction match get_field."""
+    
+    def test_standard_and_custom_fields(self):
+        """Test accessors for standard and custom fields."""
+        descriptor = SemanticDescriptor(domain='Arts')
+        descriptor.set_field('region', 'North')
+        item = IndexedText(id='a', text='t', descriptor=descriptor)
+        self.assertTrue(FieldEquals('DOMAIN', 'Arts').test(item))
+        self.assertTrue(FieldEquals('region', 'North').test(item))
+        self.assertTrue(FieldStartsWith('Region', 'No').test(item))
+        self.assertFalse(FieldIn('tone', ['Calm']).test(item))
+
+
+class TestBuiltPredicateReuse(unittest.TestCase):
+    """Test that the combined predicate is rebuilt only after new conditions."""
+    
+    def test_filter_and_builder(self):
+        """Test Filter and QueryBuilder reuse the built predicate."""
+        for builder in (Filter(), QueryBuilder(TextIndex())):
+            get = builder.get_predicate if isinstance(builder, Filter) else builder.build_predicate
+            with self.subTest(builder=type(builder).__name__):
+                builder.where_tone('Calm').where_domain('Arts')
+                built = get()
+                self.assertIs(get(), built)
+                builder.where_audience('General')
+                rebuilt = get()
+                self.assertIsNot(rebuilt, built)
+                self.assertEqual(len(rebuilt.predicates), 3)
+
+
+class TestLazyQueryTotal(unittest.TestCase):
+    """Test page contents versus pre-pagination total, and early-exit paging."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = make_index(['Arts', 'Science'] * 5)
+    
+    def test_paged_result(self):
+        """Test a page of results and its total."""
+        calls = []
+        pred = CustomPredicate(lambda item: calls.append(item.id) or item.id != 'id-4', 'not 4')
+        builder = QueryBuilder(self.index).where(pred).offset(1).limit(2)
+        with mock.patch('query.query_builder._count_matches', return_value=9):
+            result = builder.execute()
+        self.assertEqual([item.id for item in result], ['id-1', 'id-2'])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(result.total, 9)
+        self.assertEqual(len(result), 9)
+        self.assertEqual(QueryBuilder(self.index).where(pred).limit(2).count(), 9)
+    
+    def test_total_fixed_at_execute(self):
+        """Test the total ignores index changes made after execute()."""
+        result = QueryBuilder(self.index).where_domain('Science').limit(2).execute()
+        self.index.add('late', SemanticDescriptor(domain='Science'), item_id='late')
+        self.assertEqual(result.total, 5)
+        self.assertEqual(len(result), 5)
+    
+    def test_exact_count_from_index(self):
+        """Test count() from the index without fetching items."""
+        builder = QueryBuilder(self.index).where_domain('Science').limit(1)
+        with mock.patch.object(TextIndex, 'get_many', side_effect=AssertionError):
+            self.assertEqual(builder.count(), 5)
+        self.assertEqual(builder.execute().total, 5)
+
+
+class TestCompiledQueryPaths(unittest.TestCase):
+    """Test that large scans in QueryBuilder run the compiled predicate."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = make_index(['Science'] * 100)
+    
+    def test_compiled_in_scans(self):
+        """Test count(), first() and execute() scan with the compiled predicate."""
+        pred = TextContains('9') | TextContains('text 1')
+        builder = QueryBuilder(self.index).where(pred)
+        with mock.patch.object(TextContains, 'test', side_effect=AssertionError):
+            self.assertEqual(builder.count(), 29)
+            self.assertEqual(builder.first().id, 'id-1')
+            self.assertEqual(len(builder.clone().limit(3).execute().items), 3)
+        self.assertEqual(pred.compile()(self.index.get('id-19')), True)
+
+
+class TestConveniencePredicates(unittest.TestCase):
+    """Test that the convenience helpers reuse their predicates."""
+    
+    def test_predicates_are_shared(self):
+        """Test helper predicates are built once and reused."""
+        from query import filters
+        self.assertIs(filters._narrowed(filters._RESEARCH, None), filters._RESEARCH)
+        first = filters._narrowed(filters._RESEARCH, 'Science', 'Stable')
+        self.assertIs(filters._narrowed(filters._RESEARCH, 'Science', 'Stable'), first)
+    
+    def test_results_match_filter(self):
+        """Test helper results are unchanged."""
+        items = [
+            IndexedText(id=str(i), text='t', descriptor=SemanticDescriptor(
+                domain=domain, intent=intent, stability='Stable'))
+            for i, (domain, intent) in enumerate([
+                ('Science', 'Research → Conceptual'), ('Arts', 'Research'),
+                ('Science → Biology', 'Documentation → Tutorial'),
+            ])
+        ]
+        self.assertEqual([i.id for i in find_research_posts(items, 'Science', 'Stable')], ['0'])
+        self.assertEqual([i.id for i in find_research_posts(items)], ['0', '1'])
+        self.assertEqual([i.id for i in find_tutorials(items, 'Science')], ['2'])
+
+
+class TestNotResolve(unittest.TestCase):
+    """Test that NOT of an exact condition resolves to the complement."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = make_index(['Science', 'Arts', 'Science → Physics', 'Arts'])
+    
+    def test_complement(self):
+        """Test NOT of an exact condition resolves to the complement."""
+        ids, rest = NotPredicate(FieldEquals('domain', 'Arts')).resolve(self.index)
+        self.assertEqual(ids, {'id-0', 'id-2'})
+        self.assertIsNone(rest)
+        
+        pred = AndPredicate(HierarchyMatches('domain', 'Science'),
+                            NotPredicate(HierarchyMatches('domain', 'Science', exact=True)))
+        self.assertEqual(pred.resolve(self.index), ({'id-2'}, None))
+    
+    def test_inexact_is_tested(self):
+        """Test NOT of an inexact condition is tested item by item."""
+        for inner in [TextContains('1', case_sensitive=True),
+                      MetadataEquals('k', 'v'),
+                      AndPredicate(FieldEquals('domain', 'Arts'),
+                                   TextContains('1', case_sensitive=True))]:
+            with self.subTest(inner=inner.explain()):
+                pred = NotPredicate(inner)
+                self.assertEqual(pred.resolve(self.index), (None, pred))
+                expected = [item.id for item in self.index.get_all() if pred(item)]
+                result = QueryBuilder(self.index).where(pred).execute()
+                self.assertEqual([item.id for item in result], expected)
+
+
+class TestParallelQuery(unittest.TestCase):
+    """Test that QueryBuilder.execute(workers=...) tests candidates in worker processes."""
+    
+    def test_matches_serial(self):
+        """Test execute(workers=2) matches a serial run."""
+        index = make_index(['Arts', 'Science', 'Science'] * 10)
+        pred = AndPredicate(FieldEquals('domain', 'Science'), TextContains('1', case_sensitive=True))
+        expected = [item.id for item in index.get_all() if pred(item)]
+        with mock.patch('query.filters.filter_items_parallel',
+                        wraps=filter_items_parallel) as parallel:
+            result = QueryBuilder(index).where(pred).execute(workers=2)
+        self.assertEqual([item.id for item in result], expected)
+        self.assertEqual(parallel.call_args.args[2], 2)
+
+
+class TestSortedFirst(unittest.TestCase):
+    """Test that sorted first() agrees with execute() without running it."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TextIndex(validate_on_add=False)
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.index.bulk_load(
+            IndexedText(id=f'id-{i}', text=f'text {i}',
+                        descriptor=SemanticDescriptor(domain='Science' if i % 2 else 'Arts'),
+                        created_at=base + timedelta(days=i // 3))
+            for i in range(12)
+        )
+    
+    def test_matches_execute(self):
+        """Test sorted first() matches execute() without running it."""
+        for descending in (True, False):
+            for offset in (0, 2, 20):
+                with self.subTest(descending=descending, offset=offset):
+                    query = (QueryBuilder(self.index).where_domain('Science')
+                             .order_by_created(descending).offset(offset))
+                    page = query.clone().limit(1).execute().items
+                    with mock.patch.object(QueryBuilder, 'execute', side_effect=AssertionError):
+                        first = query.first()
+                    self.assertIs(first, page[0] if page else None)
+    
+    def test_limit_ignored(self):
+        """Test first() ignores the query's limit."""
+        for query in (QueryBuilder(self.index), QueryBuilder(self.index).order_by_created()):
+            expected = query.clone().execute().items[0]
+            self.assertIs(query.clone().limit(0).first(), expected)
+            self.assertIs(query.clone().limit(5).first(), expected)
+
+
+class TestCloneSharing(unittest.TestCase):
+    """Test that clones share predicates and the built tree."""
+    
+    def test_shared_until_changed(self):
+        """Test a clone shares the built tree until it adds a condition."""
+        base = QueryBuilder(TextIndex()).where_domain('Science').where_tone('Calm')
+        tree = base.build_predicate()
+        cloned = base.clone()
+        self.assertIs(cloned.build_predicate(), tree)
+        self.assertIs(cloned._predicates[0], base._predicates[0])
+        
+        cloned.where_audience('General')
+        self.assertIsNot(cloned.build_predicate(), tree)
+        self.assertIs(base.build_predicate(), tree)
+        self.assertEqual(len(cloned.build_predicate().predicates), 3)
+
+
+class TestLazyQueryExplanation(unittest.TestCase):
+    """Test that the result explanation is built on first access."""
+    
+    def test_built_on_access(self):
+        """Test the explanation is built on first access only."""
+        query = QueryBuilder(TextIndex()).where_domain('Science').limit(5)
+        with mock.patch.object(HierarchyMatches, 'explain',
+                               autospec=True, return_value='domain matches') as explain:
+            result = query.execute()
+            query.where_tone('Calm')
+            self.assertFalse(explain.called)
+            self.assertEqual(result.query_explanation,
+                             'SELECT items WHERE domain matches LIMIT 5')
+            self.assertIs(result.query_explanation, result.query_explanation)
+            self.assertEqual(explain.call_count, 1)
+    
+    def test_explicit_text(self):
+        """Test an explanation given explicitly is kept."""
+        result = QueryResult(items=[], query_explanation='given')
+        self.assertEqual(result.query_explanation, 'given')
+        result.query_explanation = 'changed'
+        self.assertEqual(result, QueryResult(items=[], query_explanation='changed'))
+
+
 if __name__ == '__main__':
     unittest.main()
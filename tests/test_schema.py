@@ -5,9 +5,12 @@ Tests for schema loading and structure validation.
 import unittest
 import json
 from pathlib import Path
+import tempfile
+import sys
 
 from core import SchemaValidator
 from core.errors import SchemaError, SchemaVersionError
+from core.validate import _get_validator
 
 
 class TestSchemaLoading(unittest.TestCase):
@@ -284,5 +287,123 @@ class TestSchemaReadme(unittest.TestCase):
         self.assertIn('Schema v1', content)
 
 
+class TestPrecomputedValidValues(unittest.TestCase):
+    """Test that value tables precomputed at load time stay consistent."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = _get_validator('v1')
+    
+    def test_matches_schema_extraction(self):
+        """Test precomputed values match extraction from the schema."""
+        for field_name, schema in self.validator._schemas.items():
+            with self.subTest(field=field_name):
+                self.assertEqual(
+                    self.validator.get_valid_values(field_name),
+                    self.validator._extract_values(schema['values']),
+                )
+    
+    def test_get_valid_values_returns_copy(self):
+        """Test get_valid_values returns a copy."""
+        self.validator.get_valid_values('domain').add('Mutated')
+        self.assertNotIn('Mutated', self.validator.get_valid_values('domain'))
+        self.assertEqual(self.validator.get_valid_values('no_such_field'), set())
+
+
+class TestLazySchemaLoading(unittest.TestCase):
+    """Test that schemas are checked up front and their tables built on use."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.schema_dir = Path(self.tmp.name)
+        (self.schema_dir / 'domain.json').write_text(
+            json.dumps({'values': ['Science'], 'required': True}), encoding='utf-8'
+        )
+        (self.schema_dir / 'tone.json').write_text(
+            json.dumps({'values': ['Neutral']}), encoding='utf-8'
+        )
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+    
+    def test_unused_tables_not_built(self):
+        """Test a field's value tables are not built until it is used."""
+        validator = SchemaValidator(schema_dir=self.schema_dir)
+        self.assertTrue(validator.validate_field('domain', 'Science'))
+        self.assertIn('tone', validator._schemas)
+        self.assertNotIn('tone', validator._valid_values)
+    
+    def test_broken_schema_fails_at_construction(self):
+        """Test a broken schema raises SchemaError when the validator is built."""
+        (self.schema_dir / 'broken.json').write_text('{not json', encoding='utf-8')
+        with self.assertRaises(SchemaError):
+            SchemaValidator(schema_dir=self.schema_dir)
+    
+    def test_malformed_schema_fails_at_construction(self):
+        """Test a schema without values raises SchemaError when the validator is built."""
+        (self.schema_dir / 'broken.json').write_text(json.dumps({'required': True}), encoding='utf-8')
+        with self.assertRaises(SchemaError):
+            SchemaValidator(schema_dir=self.schema_dir)
+    
+    def test_unknown_field_check_does_not_build_tables(self):
+        """Test unknown-field warnings do not build value tables."""
+        validator = SchemaValidator(schema_dir=self.schema_dir)
+        result = validator.validate_values({'domain': 'Science', 'other': 'x'})
+        self.assertTrue(result)
+        self.assertIn('other', result.warnings[0])
+        self.assertNotIn('tone', validator._valid_values)
+
+
+class TestSchemaValueInterning(unittest.TestCase):
+    """Test that schema-derived value paths are interned."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = _get_validator('v1')
+    
+    def test_paths_are_interned(self):
+        """Test valid value paths are interned strings."""
+        for value in self.validator.get_valid_values('domain'):
+            with self.subTest(value=value):
+                self.assertIs(sys.intern(value), value)
+
+
+class TestSharedSchemaParsing(unittest.TestCase):
+    """Test that validators share parsed schema files until they change."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.schema_file = Path(self.tmp.name) / 'domain.json'
+        self.schema_file.write_text(json.dumps({'values': ['Science']}), encoding='utf-8')
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+    
+    def test_parsed_once(self):
+        """Test validators share a parsed schema file."""
+        first = SchemaValidator(schema_dir=self.tmp.name)
+        second = SchemaValidator(schema_dir=self.tmp.name)
+        self.assertIs(first._schemas['domain'], second._schemas['domain'])
+    
+    def test_get_schema_returns_copy(self):
+        """Test changing a returned schema affects no validator."""
+        first = SchemaValidator(schema_dir=self.tmp.name)
+        second = SchemaValidator(schema_dir=self.tmp.name)
+        first.get_schema('domain')['values'].append('Arts')
+        self.assertEqual(first.get_schema('domain')['values'], ['Science'])
+        self.assertFalse(second.validate_field('domain', 'Arts'))
+    
+    def test_rewritten_file_is_reparsed(self):
+        """Test a rewritten schema file is parsed again."""
+        self.assertTrue(SchemaValidator(schema_dir=self.tmp.name).validate_field('domain', 'Science'))
+        self.schema_file.write_text(json.dumps({'values': ['Science', 'Arts']}), encoding='utf-8')
+        validator = SchemaValidator(schema_dir=self.tmp.name)
+        self.assertTrue(validator.validate_field('domain', 'Arts'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for index serialization formats.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import codec, SemanticDescriptor
+from indexer.adapters import FileAdapter
+from indexer.index_text import compute_content_hash, IndexedText, TextIndex
+from indexer.serialize import (
+    CSVSerializer,
+    MsgpackSerializer,
+    NDJSONSerializer,
+    save_to_file,
+)
+from indexer.serialize import msgpack as indexer_msgpack
+
+# indexer.serialize is shadowed by the serialize() function re-exported
+# from indexer, so patch targets are looked up on the module object itself
+serialize_module = sys.modules['indexer.serialize']
+
+
+class TestNDJSONByteSerialization(unittest.TestCase):
+    """Test that the bytes-based NDJSON writers keep the line format."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        index = TextIndex(validate_on_add=False)
+        for i in range(3):
+            index.add(f'text {i}', SemanticDescriptor(domain='Science'))
+        self.items = index.get_all()
+    
+    def test_str_and_file_agree(self):
+        """Test string, bytes and file output agree."""
+        lines = [codec.dumps(item.to_dict()) for item in self.items]
+        self.assertEqual(NDJSONSerializer.serialize(self.items), "\n".join(lines))
+        self.assertEqual(NDJSONSerializer.serialize([]), '')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'items.ndjson'
+            save_to_file(self.items, path)
+            self.assertEqual(path.read_bytes(), NDJSONSerializer.serialize_bytes(self.items))
+            self.assertEqual(path.read_text(encoding='utf-8'), ''.join(l + "\n" for l in lines))
+
+
+class TestNDJSONStreamingLoad(unittest.TestCase):
+    """Test lazy NDJSON reads and iterable bulk loading."""
+    
+    def test_iter_from_file_is_lazy(self):
+        """Test iter_from_file() yields items one at a time."""
+        index = TextIndex(validate_on_add=False)
+        for i in range(3):
+            index.add(f'text {i}', SemanticDescriptor(domain='Science'))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'items.ndjson'
+            save_to_file(index.get_all(), path)
+            stream = NDJSONSerializer.iter_from_file(path)
+            self.assertEqual(next(stream).text, 'text 0')
+            self.assertEqual([item.text for item in stream], ['text 1', 'text 2'])
+    
+    def test_from_list_accepts_generator(self):
+        """Test from_list() accepts a generator."""
+        records = [
+            IndexedText(id=f'id-{i}', text=f'text {i}',
+                        descriptor=SemanticDescriptor(domain='Science')).to_dict()
+            for i in range(3)
+        ]
+        index = TextIndex.from_list((r for r in records), validate_on_add=False)
+        self.assertEqual(index.count(), 3)
+        self.assertEqual(index._hash_to_id[compute_content_hash('text 1')], 'id-1')
+
+
+class TestCSVPositionalRows(unittest.TestCase):
+    """Test that positional CSV rows keep the column layout."""
+    
+    def test_round_trip(self):
+        """Test a CSV round trip with quoting and metadata."""
+        index = TextIndex(validate_on_add=False)
+        index.add('a, "quoted"\nline', SemanticDescriptor(domain='Science', intent='Research'),
+                  metadata={'k': 'é'})
+        items = index.get_all()
+        data = CSVSerializer.serialize(items)
+        self.assertTrue(data.startswith(','.join(CSVSerializer.FIELDNAMES)))
+        loaded = CSVSerializer.deserialize(data)
+        self.assertEqual([i.to_dict() for i in loaded], [i.to_dict() for i in items])
+
+
+class TestMsgpackSerializer(unittest.TestCase):
+    """Test the optional msgpack index format."""
+    
+    @unittest.skipIf(indexer_msgpack is None, 'msgpack not installed')
+    def test_file_round_trip(self):
+        """Test a msgpack file round trip."""
+        index = TextIndex(validate_on_add=False)
+        index.add('hello', SemanticDescriptor(domain='Science'), metadata={'k': 'é'})
+        with tempfile.TemporaryDirectory() as tmp:
+            adapter = FileAdapter(Path(tmp) / 'index.msgpack')
+            adapter.save(index)
+            loaded = adapter.load()
+        self.assertEqual(loaded.to_list(), index.to_list())
+    
+    def test_missing_dependency(self):
+        """Test serialize() raises ImportError without msgpack."""
+        with mock.patch.object(serialize_module, 'msgpack', None):
+            with self.assertRaises(ImportError):
+                MsgpackSerializer.serialize([])
+
+
+if __name__ == '__main__':
+    unittest.main()
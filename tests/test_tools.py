@@ -0,0 +1,245 @@
+"""
+Tests for the schema migration helper and schema linter tools.
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from core.errors import ValidationError
+from tools import migration_helper, schema_linter
+from tools.migration_helper import (
+    MigrationError,
+    iter_descriptors,
+    load_descriptors,
+    migrate_descriptor,
+    migrate_lines,
+)
+from tools.schema_linter import (
+    SchemaLintError,
+    extract_values,
+    lint_schema_files,
+)
+
+
+VALID = {'domain': 'Science', 'intent': 'Research'}
+INVALID = {'domain': 'Not A Domain', 'intent': 'Research'}
+
+
+class TestMigrateDescriptor(unittest.TestCase):
+    """Test field renaming and collision detection."""
+
+    def test_no_renames_returns_copy(self):
+        """Test a mapping that touches no field returns an equal copy."""
+        migrated = migrate_descriptor(VALID, {'audience': 'readers'})
+        self.assertEqual(migrated, VALID)
+        self.assertIsNot(migrated, VALID)
+
+    def test_rename_keeps_order(self):
+        """Test renamed fields keep their position."""
+        migrated = migrate_descriptor(
+            {'area': 'Science', 'intent': 'Research'}, {'area': 'domain'}
+        )
+        self.assertEqual(list(migrated.items()),
+                         [('domain', 'Science'), ('intent', 'Research')])
+
+    def test_first_collision_reported(self):
+        """Test the collision reported is the first a key-by-key pass hits."""
+        descriptor = {'p': '1', 'a': '2', 'q': '3', 'b': '4'}
+        with self.assertRaises(MigrationError) as ctx:
+            migrate_descriptor(descriptor, {'a': 'q', 'b': 'p'})
+        self.assertIn("'q'", str(ctx.exception))
+
+
+class TestJSONLinesMigration(unittest.TestCase):
+    """Test line-by-line migration of .jsonl descriptor files."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'descriptors.jsonl'
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def write_lines(self, *lines):
+        self.path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    def test_blank_lines_skipped(self):
+        """Test blank lines are skipped but still counted."""
+        self.write_lines(json.dumps(VALID), '', '   ', json.dumps(VALID))
+        self.assertEqual([n for n, _ in iter_descriptors(self.path)], [1, 4])
+
+    def test_invalid_json_reports_line(self):
+        """Test invalid JSON is reported with its line number."""
+        self.write_lines(json.dumps(VALID), '', '{not json')
+        with self.assertRaises(MigrationError) as ctx:
+            list(iter_descriptors(self.path))
+        self.assertIn('line 3', str(ctx.exception))
+
+    def test_non_object_reports_line(self):
+        """Test a line holding something other than an object is rejected."""
+        self.write_lines(json.dumps(VALID), '["domain"]')
+        with self.assertRaises(MigrationError) as ctx:
+            list(iter_descriptors(self.path))
+        self.assertIn('line 2', str(ctx.exception))
+
+    def test_migrate_lines_output(self):
+        """Test each descriptor is written as one migrated JSON line."""
+        self.write_lines(json.dumps({'area': 'Science', 'intent': 'Research'}),
+                         '', json.dumps(VALID))
+        out = io.StringIO()
+        with redirect_stdout(out):
+            migrate_lines(self.path, 'v1', 'v1', {'area': 'domain'})
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            record = json.loads(line)
+            self.assertEqual(record['descriptor'], VALID)
+            self.assertEqual(record['to_version'], 'v1')
+
+    def test_migrate_lines_invalid_reports_line(self):
+        """Test a descriptor failing validation is reported by line number."""
+        self.write_lines(json.dumps(VALID), '', json.dumps(INVALID))
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(ValidationError) as ctx:
+            migrate_lines(self.path, 'v1', 'v1', {})
+        self.assertIn('line 3', str(ctx.exception))
+        self.assertEqual(len(out.getvalue().splitlines()), 1)
+
+
+class TestArrayMigration(unittest.TestCase):
+    """Test migrating a file holding an array of descriptors."""
+
+    def setUp(self):
+        """Set up a temporary directory with a migration map."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.mapping = self.dir / 'mapping.json'
+        self.mapping.write_text(json.dumps({'area': 'domain'}), encoding='utf-8')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def run_main(self, descriptors):
+        path = self.dir / 'descriptors.json'
+        path.write_text(json.dumps(descriptors), encoding='utf-8')
+        argv = ['migration_helper.py', str(path), 'v1', 'v1', str(self.mapping)]
+        out = io.StringIO()
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(out):
+            migration_helper.main()
+        return json.loads(out.getvalue())
+
+    def test_load_descriptors(self):
+        """Test single objects and arrays are told apart."""
+        path = self.dir / 'one.json'
+        path.write_text(json.dumps(VALID), encoding='utf-8')
+        self.assertEqual(load_descriptors(path), ([VALID], False))
+        path.write_text(json.dumps([VALID, VALID]), encoding='utf-8')
+        self.assertEqual(load_descriptors(path), ([VALID, VALID], True))
+        path.write_text(json.dumps([VALID, 'domain']), encoding='utf-8')
+        with self.assertRaises(MigrationError):
+            load_descriptors(path)
+
+    def test_batch_output(self):
+        """Test an array is migrated and written as a list."""
+        output = self.run_main([{'area': 'Science', 'intent': 'Research'}, VALID])
+        self.assertEqual(output['descriptors'], [VALID, VALID])
+        self.assertNotIn('descriptor', output)
+
+    def test_single_output(self):
+        """Test a single object keeps the single-descriptor output."""
+        output = self.run_main({'area': 'Science', 'intent': 'Research'})
+        self.assertEqual(output['descriptor'], VALID)
+
+    def test_batch_errors_name_descriptor(self):
+        """Test batch validation errors say which descriptor failed."""
+        with self.assertRaises(ValidationError) as ctx:
+            self.run_main([VALID, INVALID])
+        self.assertTrue(ctx.exception.errors)
+        for error in ctx.exception.errors:
+            self.assertTrue(error.startswith('descriptor 1:'))
+
+
+class TestSchemaLinter(unittest.TestCase):
+    """Test the linter's hierarchy walk and parallel file linting."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def write_schema(self, name, values, version='v1'):
+        path = self.dir / name
+        path.write_text(json.dumps({'version': version, 'values': values}),
+                        encoding='utf-8')
+        return path
+
+    def test_leaf_and_parent_allowed(self):
+        """Test a value may be both a leaf and a parent."""
+        seen = set()
+        extract_values(['Science', {'Science': ['Biology', 'Physics']}], seen)
+        self.assertIn('Science/Biology::leaf', seen)
+        self.assertIn('Science::parent', seen)
+
+    def test_duplicates_detected(self):
+        """Test duplicate leaves and parents are reported."""
+        for values in (['Arts', 'Arts'],
+                       [{'Science': ['Biology', 'Biology']}],
+                       [{'Science': []}, {'Science': []}]):
+            with self.subTest(values=values):
+                with self.assertRaises(SchemaLintError):
+                    extract_values(values, set())
+
+    def test_invalid_entries(self):
+        """Test non-string leaves and non-list children are rejected."""
+        for values in ([1], [{'Science': 'Biology'}], [None]):
+            with self.subTest(values=values):
+                with self.assertRaises(SchemaLintError):
+                    extract_values(values, set())
+
+    def test_deep_hierarchy(self):
+        """Test nesting deeper than the recursion limit is walked."""
+        values = ['Leaf']
+        for depth in range(sys.getrecursionlimit() + 100):
+            values = [{f'Level {depth}': values}]
+        seen = set()
+        extract_values(values, seen)
+        self.assertEqual(sum(key.endswith('::leaf') for key in seen), 1)
+
+    def test_parallel_lint_reports_first_failure(self):
+        """Test --jobs reports the error a sequential run would hit first."""
+        files = [
+            (self.write_schema('good.json', ['A', {'B': ['C']}]), 'v1'),
+            (self.write_schema('duplicate.json', ['A', 'A']), 'v1'),
+            (self.write_schema('wrong_version.json', ['A'], version='v2'), 'v1'),
+        ]
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                with self.assertRaises(SchemaLintError) as ctx:
+                    lint_schema_files(files, jobs=jobs)
+                self.assertIn('Duplicate value', str(ctx.exception))
+        lint_schema_files(files[:1] * 3, jobs=2)
+
+    def test_main_jobs_option(self):
+        """Test the bundled schemas pass linting with --jobs."""
+        out = io.StringIO()
+        argv = ['schema_linter.py', '--jobs', '2']
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(out):
+            schema_linter.main()
+        self.assertIn('passed', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
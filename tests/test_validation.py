@@ -3,15 +3,33 @@ Tests for descriptor validation.
 """
 
 import unittest
+from unittest import mock
+import sys
 
 from core import (
     SemanticDescriptor,
-    SchemaValidator,
     validate,
     normalize_value,
     normalize_descriptor,
+    get_hierarchy_path,
+    get_hierarchy_depth,
+    get_parent_value,
+    get_root_value,
+    normalize_descriptors_batch,
+    are_values_equivalent,
+    ValidationResult,
+    SchemaValidator,
+    clear_normalize_caches,
 )
 from core.errors import ValidationError, NormalizationError
+# Shared per-version validator: schemas are parsed once per test run
+from core.validate import _get_validator
+from core.normalize import _normalize_value_cached
+from core import descriptor as descriptor_module
+
+# core.validate is shadowed by the validate() function re-exported from
+# core, so patch targets are looked up on the module object itself
+validate_module = sys.modules['core.validate']
 
 
 class TestDescriptorValidation(unittest.TestCase):
@@ -19,7 +37,7 @@ class TestDescriptorValidation(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.validator = SchemaValidator(version="v1")
+        self.validator = _get_validator("v1")
     
     def test_valid_complete_descriptor(self):
         """Test validation of complete valid descriptor."""
@@ -151,7 +169,7 @@ class TestFieldValidation(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.validator = SchemaValidator(version="v1")
+        self.validator = _get_validator("v1")
     
     def test_validate_domain_field(self):
         """Test domain field validation."""
@@ -189,7 +207,7 @@ class TestExplainInvalid(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.validator = SchemaValidator(version="v1")
+        self.validator = _get_validator("v1")
     
     def test_explain_invalid_field(self):
         """Test explanation for invalid field name."""
@@ -357,7 +375,7 @@ class TestValidationResultString(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.validator = SchemaValidator(version="v1")
+        self.validator = _get_validator("v1")
     
     def test_valid_result_string(self):
         """Test string representation of valid result."""
@@ -384,7 +402,7 @@ class TestEdgeCases(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.validator = SchemaValidator(version="v1")
+        self.validator = _get_validator("v1")
     
     def test_empty_descriptor(self):
         """Test validation of empty descriptor."""
@@ -429,5 +447,382 @@ class TestEdgeCases(unittest.TestCase):
         self.assertFalse(result.valid)
 
 
+class TestSeparatorNormalizationSinglePass(unittest.TestCase):
+    """Test that every separator variant normalizes identically."""
+    
+    def test_separator_variants(self):
+        """Test each separator spelling normalizes the same."""
+        variants = [
+            'Science->Biology',
+            'Science -> Biology',
+            'Science>Biology',
+            'Science  >  Biology',
+            'Science→Biology',
+            'Science   →   Biology',
+        ]
+        for value in variants:
+            with self.subTest(value=value):
+                self.assertEqual(normalize_value(value), 'Science → Biology')
+    
+    def test_multi_level_path(self):
+        """Test a three-level path with mixed separators."""
+        self.assertEqual(
+            normalize_value('  Science ->Biology>  Systems   Biology '),
+            'Science → Biology → Systems Biology',
+        )
+
+
+class TestNormalizationCaching(unittest.TestCase):
+    """Test that memoized normalization behaves like the uncached version."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        clear_normalize_caches()
+    
+    def test_repeat_calls_hit_cache(self):
+        """Test repeated calls hit the cache."""
+        normalize_value('Science -> Biology')
+        normalize_value('Science -> Biology')
+        self.assertGreaterEqual(_normalize_value_cached.cache_info().hits, 1)
+    
+    def test_clear_normalize_caches(self):
+        """Test clearing empties the normalization cache."""
+        normalize_value('Science -> Biology')
+        clear_normalize_caches()
+        self.assertEqual(_normalize_value_cached.cache_info().currsize, 0)
+    
+    def test_strict_and_lenient_cached_separately(self):
+        """Test strict and lenient results are cached apart."""
+        self.assertEqual(normalize_value('   ', strict=False), '')
+        with self.assertRaises(NormalizationError):
+            normalize_value('   ', strict=True)
+    
+    def test_non_string_still_rejected(self):
+        """Test unhashable values still raise NormalizationError."""
+        with self.assertRaises(NormalizationError):
+            normalize_value(['not', 'hashable'])
+    
+    def test_hierarchy_path_returns_fresh_list(self):
+        """Test get_hierarchy_path returns a new list each call."""
+        path = get_hierarchy_path('Science → Biology')
+        path.append('mutated')
+        self.assertEqual(get_hierarchy_path('Science → Biology'),
+                         ['Science', 'Biology'])
+
+
+class TestHierarchyAccessors(unittest.TestCase):
+    """Test hierarchy helpers built on the cached path split."""
+    
+    def test_accessors(self):
+        """Test depth, parent and root of hierarchical values."""
+        cases = [
+            ('Science', 1, None, 'Science'),
+            ('Science → Biology', 2, 'Science', 'Science'),
+            ('Science → Biology → Systems Biology', 3,
+             'Science → Biology', 'Science'),
+        ]
+        for value, depth, parent, root in cases:
+            with self.subTest(value=value):
+                self.assertEqual(get_hierarchy_depth(value), depth)
+                self.assertEqual(get_parent_value(value), parent)
+                self.assertEqual(get_root_value(value), root)
+
+
+class TestBatchNormalization(unittest.TestCase):
+    """Test that batch normalization matches per-descriptor normalization."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.batch = [
+            {'Domain': 'Science -> Biology', 'intent': '  Research  '},
+            {'domain': 'Technology>Software', 'Region Code': 'EU'},
+            {},
+        ]
+    
+    def test_matches_single_normalization(self):
+        """Test batch results match normalize_descriptor()."""
+        self.assertEqual(
+            normalize_descriptors_batch(self.batch),
+            [normalize_descriptor(d) for d in self.batch],
+        )
+    
+    def test_strict_errors_preserved(self):
+        """Test batch normalization raises the same errors."""
+        with self.assertRaises(NormalizationError):
+            normalize_descriptors_batch([{'domain': '   '}])
+        with self.assertRaises(NormalizationError):
+            normalize_descriptors_batch([{'Domain': 'a', 'domain': 'b'}])
+        with self.assertRaises(NormalizationError):
+            normalize_descriptors_batch([{'domain': 1}])
+    
+    def test_from_dicts_matches_from_dict(self):
+        """Test from_dicts() matches from_dict()."""
+        self.assertEqual(
+            SemanticDescriptor.from_dicts(self.batch),
+            [SemanticDescriptor.from_dict(d) for d in self.batch],
+        )
+
+
+class TestValidationErrorMessage(unittest.TestCase):
+    """Test the joined ValidationError message format."""
+    
+    def test_message_layout(self):
+        """Test the errors and warnings sections."""
+        error = ValidationError('Invalid', errors=['e1', 'e2'], warnings=['w1'])
+        self.assertEqual(
+            str(error),
+            "Invalid\n\nErrors:\n  • e1\n  • e2\n\nWarnings:\n  • w1",
+        )
+    
+    def test_message_without_details(self):
+        """Test a message without errors or warnings."""
+        self.assertEqual(str(ValidationError('Invalid')), 'Invalid')
+
+
+class TestNormalizedValueInterning(unittest.TestCase):
+    """Test that equal canonical values share one string object."""
+    
+    def test_descriptors_share_values(self):
+        """Test equal values share one string object."""
+        a = SemanticDescriptor(domain='Science -> Biology')
+        b = SemanticDescriptor.from_dicts([{'Domain': 'Science>Biology'}])[0]
+        self.assertEqual(a, b)
+        self.assertIs(a.domain, b.domain)
+    
+    def test_identity_equality(self):
+        """Test a descriptor equals itself."""
+        descriptor = SemanticDescriptor(domain='Science')
+        self.assertTrue(descriptor == descriptor)
+
+
+class TestSharedValidator(unittest.TestCase):
+    """Test that descriptor validation reuses one validator per version."""
+    
+    def test_validator_reused(self):
+        """Test one validator is kept per schema version."""
+        self.assertIs(_get_validator('v1'), _get_validator('v1'))
+    
+    def test_module_validate_uses_shared_validator(self):
+        """Test validate() does not construct a new validator."""
+        _get_validator('v1')
+        with mock.patch.object(validate_module, 'SchemaValidator') as constructor:
+            validate({'domain': 'Science'}, partial=True)
+        constructor.assert_not_called()
+    
+    def test_required_fields_copy(self):
+        """Test get_required_fields returns a copy."""
+        validator = _get_validator('v1')
+        validator.get_required_fields().add('mutated')
+        self.assertNotIn('mutated', validator.get_required_fields())
+    
+    def test_is_complete(self):
+        """Test is_complete against the shared required fields."""
+        required = _get_validator('v1').get_required_fields()
+        descriptor = SemanticDescriptor()
+        self.assertEqual(descriptor.is_complete(), not required)
+
+
+class TestValueEquivalenceShortCircuit(unittest.TestCase):
+    """Test are_values_equivalent fast paths keep the original results."""
+    
+    def test_cases(self):
+        """Test equal, variant and non-string values."""
+        cases = [
+            ('Science → Biology', 'Science → Biology', True),
+            ('Science->Biology', 'Science → Biology', True),
+            ('Science', 'Biology', False),
+            (None, None, False),
+            (1, 1, False),
+        ]
+        for value1, value2, expected in cases:
+            with self.subTest(value1=value1, value2=value2):
+                self.assertIs(are_values_equivalent(value1, value2), expected)
+
+
+class TestSuggestionBackends(unittest.TestCase):
+    """Test explain_invalid suggestions with and without rapidfuzz."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = _get_validator('v1')
+    
+    def test_substring_fallback(self):
+        """Test substring suggestions without rapidfuzz."""
+        with mock.patch.object(validate_module, 'process', None):
+            explanation = self.validator.explain_invalid('domain', 'Biology')
+        self.assertIn('Did you mean', explanation)
+        self.assertIn('Science → Biology', explanation)
+    
+    def test_word_overlap_fallback_ranks_by_shared_words(self):
+        """Test word-overlap suggestions rank by shared words."""
+        with mock.patch.object(validate_module, 'process', None):
+            self.validator.get_schema('domain')
+            suggestions = self.validator._suggest('domain', 'Fake Engineering Software')
+        self.assertEqual(suggestions[0], 'Engineering → Software Engineering')
+        self.assertIn('Engineering', suggestions)
+    
+    def test_no_match_lists_allowed_values(self):
+        """Test allowed values are listed when nothing matches."""
+        with mock.patch.object(validate_module, 'process', None):
+            explanation = self.validator.explain_invalid('domain', 'Zzzz')
+        self.assertIn("Allowed values for 'domain' include", explanation)
+
+
+class TestValidationWithoutExplanation(unittest.TestCase):
+    """Test the explain=False fast path keeps the verdicts."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = _get_validator('v1')
+    
+    def test_same_verdict(self):
+        """Test explain=False gives the same verdict."""
+        for value in ('Science → Biology', 'Fake Domain'):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    bool(self.validator.validate_field('domain', value, explain=False)),
+                    bool(self.validator.validate_field('domain', value)),
+                )
+    
+    def test_short_message_skips_explanation(self):
+        """Test explain=False reports a short message without suggestions."""
+        with mock.patch.object(self.validator, 'explain_invalid') as explain:
+            result = self.validator.validate_values({'domain': 'Fake'}, explain=False)
+        explain.assert_not_called()
+        self.assertEqual(result.errors, ["Invalid value 'Fake' for field 'domain'"])
+    
+    def test_is_valid_uses_fast_path(self):
+        """Test is_valid does not build explanations."""
+        with mock.patch.object(self.validator, 'explain_invalid') as explain:
+            self.assertFalse(SemanticDescriptor(domain='Fake').is_valid(partial=True))
+        explain.assert_not_called()
+
+
+class TestValidationResultSlots(unittest.TestCase):
+    """Test the slotted ValidationResult layout."""
+    
+    def test_no_instance_dict(self):
+        """Test ValidationResult instances have no __dict__."""
+        result = ValidationResult(valid=True, errors=[], warnings=[])
+        self.assertFalse(hasattr(result, '__dict__'))
+    
+    def test_results_do_not_share_lists(self):
+        """Test results do not share their warning lists."""
+        validator = _get_validator('v1')
+        first = validator.validate_field('domain', 'Science')
+        first.warnings.append('mutated')
+        self.assertEqual(validator.validate_field('domain', 'Science').warnings, [])
+
+
+class TestBatchValidation(unittest.TestCase):
+    """Test validate_many against per-descriptor validation."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = _get_validator('v1')
+        self.descriptors = [
+            {'domain': 'Science → Biology'},
+            {'domain': 'Fake Domain'},
+            {},
+        ]
+    
+    def test_matches_single_validation(self):
+        """Test validate_many matches validating one at a time."""
+        for partial in (False, True):
+            with self.subTest(partial=partial):
+                valid, errors = self.validator.validate_many(self.descriptors, partial=partial)
+                for i, descriptor in enumerate(self.descriptors):
+                    if partial:
+                        expected = self.validator.validate_values(descriptor)
+                    else:
+                        expected = self.validator.validate_complete_descriptor(descriptor)
+                    self.assertEqual(valid[i], expected.valid)
+                    self.assertEqual(errors[i], expected.errors)
+    
+    def test_empty_batch(self):
+        """Test validate_many on an empty batch."""
+        self.assertEqual(self.validator.validate_many([]), ([], []))
+
+
+class TestGeneratedCompleteCheck(unittest.TestCase):
+    """Test the generated fast path of validate_complete_descriptor."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = _get_validator('v1')
+    
+    def test_valid_descriptor_skips_generic_path(self):
+        """Test a valid descriptor is accepted by the fast path alone."""
+        descriptor = {'domain': 'Science → Biology', 'intent': 'Announcement'}
+        with mock.patch.object(self.validator, 'validate_values') as generic:
+            result = self.validator.validate_complete_descriptor(descriptor)
+        generic.assert_not_called()
+        self.assertTrue(result.valid)
+        self.assertEqual((result.errors, result.warnings), ([], []))
+    
+    def test_rejections_fall_back_to_generic_path(self):
+        """Test rejected descriptors are reported by the generic path."""
+        cases = [
+            {'domain': 'Science → Biology'},
+            {'domain': 'Fake', 'intent': 'Announcement'},
+            {'domain': 'Arts', 'intent': 'Announcement', 'bogus': 'x'},
+        ]
+        for descriptor in cases:
+            with self.subTest(descriptor=descriptor):
+                self.assertFalse(self.validator._complete_check(descriptor))
+                result = self.validator.validate_complete_descriptor(descriptor)
+                self.assertTrue(result.errors or result.warnings)
+
+
+class TestValidationMemo(unittest.TestCase):
+    """Test that clean complete validation is remembered until a change."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.descriptor = SemanticDescriptor(domain='Science', intent='Announcement')
+    
+    def test_revalidation_skips_validator(self):
+        """Test re-validating an unchanged descriptor skips the validator."""
+        self.assertTrue(self.descriptor.validate())
+        with mock.patch.object(descriptor_module, '_get_validator') as get_validator:
+            self.assertTrue(self.descriptor.validate())
+            self.assertTrue(self.descriptor.is_valid())
+        get_validator.assert_not_called()
+    
+    def test_changes_reset_memo(self):
+        """Test field changes reset the memo."""
+        self.assertTrue(self.descriptor.validate())
+        self.descriptor.set_field('domain', 'Fake Domain')
+        self.assertFalse(self.descriptor.validate())
+        self.descriptor.domain = 'Arts'
+        self.assertTrue(self.descriptor.validate())
+        self.descriptor.set_field('region', 'Europe')
+        self.assertTrue(self.descriptor.validate().warnings)
+
+
+class TestExplanationCache(unittest.TestCase):
+    """Test that explanations of invalid values are built once per value."""
+    
+    def test_suggestions_computed_once(self):
+        """Test suggestions for a value are computed once."""
+        validator = SchemaValidator(version='v1')
+        first = validator.validate_field('domain', 'Sciense')
+        with mock.patch.object(validator, '_suggest', side_effect=AssertionError):
+            again = validator.validate_field('domain', 'Sciense')
+            self.assertEqual(validator.explain_invalid('domain', 'Sciense'), first.errors[0])
+        self.assertEqual(again.errors, first.errors)
+        self.assertIn('not recognized', validator.explain_invalid('missing', 'x'))
+
+
+class TestInternedPathSegments(unittest.TestCase):
+    """Test that split hierarchy components are interned."""
+    
+    def test_segments_are_interned(self):
+        """Test hierarchy path segments are interned."""
+        for part in get_hierarchy_path(''.join(['Sci', 'ence → Bio', 'logy'])):
+            self.assertIs(sys.intern(part), part)
+        self.assertIs(get_hierarchy_path(''.join(['Ar', 'ts']))[0], sys.intern('Arts'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,13 +3,19 @@
 Schema Migration Helper for Semantic Dropdown Search.
 
 Safely migrates semantic descriptors between schema versions.
+
+The descriptor file may hold one descriptor object or an array of them;
+an array is validated as one batch. A .jsonl/.ndjson file holds one
+descriptor object per line and is migrated one line at a time, writing
+one JSON line per descriptor, so memory use does not grow with the file.
 """
 
 import json
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Tuple
 
+from core import codec
 from core.validate import SchemaValidator
 from core.normalize import normalize_descriptor
 from core.errors import ValidationError
@@ -21,8 +27,7 @@ class MigrationError(Exception):
 
 def load_descriptor(path: Path) -> Dict[str, str]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = codec.loads(path.read_bytes())
         if not isinstance(data, dict):
             raise MigrationError("Descriptor must be a JSON object")
         return data
@@ -30,10 +35,43 @@ def load_descriptor(path: Path) -> Dict[str, str]:
         raise MigrationError(f"Invalid JSON: {e}")
 
 
+def load_descriptors(path: Path) -> Tuple[List[Dict[str, str]], bool]:
+    """Descriptors in path, and whether the file held an array of them."""
+    try:
+        data = codec.loads(path.read_bytes())
+    except json.JSONDecodeError as e:
+        raise MigrationError(f"Invalid JSON: {e}")
+    if isinstance(data, dict):
+        return [data], False
+    if isinstance(data, list) and all(isinstance(d, dict) for d in data):
+        return data, True
+    raise MigrationError("Descriptor must be a JSON object or an array of objects")
+
+
+# Descriptor files with one JSON object per line
+_JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+
+
+def iter_descriptors(path: Path) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """(line number, descriptor) for each non-blank line of a JSON lines file."""
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                data = codec.loads(line)
+            except json.JSONDecodeError as e:
+                raise MigrationError(f"Invalid JSON on line {line_number}: {e}")
+            if not isinstance(data, dict):
+                raise MigrationError(
+                    f"Descriptor on line {line_number} must be a JSON object"
+                )
+            yield line_number, data
+
+
 def load_migration_map(path: Path) -> Dict[str, str]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            mapping = json.load(f)
+        mapping = codec.loads(path.read_bytes())
         if not isinstance(mapping, dict):
             raise MigrationError("Migration map must be a JSON object")
         return mapping
@@ -45,19 +83,61 @@ def migrate_descriptor(
     descriptor: Dict[str, str],
     mapping: Dict[str, str]
 ) -> Dict[str, str]:
-    migrated = {}
-
-    for field, value in descriptor.items():
-        new_field = mapping.get(field, field)
-        if new_field in migrated:
-            raise MigrationError(
-                f"Field collision after migration: '{new_field}'"
-            )
-        migrated[new_field] = value
+    if mapping.keys().isdisjoint(descriptor):
+        # Nothing to rename, so nothing can collide
+        return dict(descriptor)
+
+    get = mapping.get
+    new_fields = [get(field, field) for field in descriptor]
+    migrated = dict(zip(new_fields, descriptor.values()))
+
+    if len(migrated) != len(new_fields):
+        # Report the first field that collides, as a key-by-key pass would
+        seen = set()
+        for new_field in new_fields:
+            if new_field in seen:
+                raise MigrationError(
+                    f"Field collision after migration: '{new_field}'"
+                )
+            seen.add(new_field)
 
     return migrated
 
 
+def migrate_lines(
+    path: Path,
+    from_version: str,
+    to_version: str,
+    mapping: Dict[str, str],
+) -> None:
+    """
+    Migrate a JSON lines descriptor file, writing one JSON line per
+    descriptor to stdout as it goes.
+
+    Stops at the first descriptor that fails validation; lines before it
+    have already been written.
+    """
+    validator = SchemaValidator(version=to_version)
+    write = sys.stdout.write
+
+    for line_number, descriptor in iter_descriptors(path):
+        migrated = normalize_descriptor(
+            migrate_descriptor(descriptor, mapping), strict=True
+        )
+        result = validator.validate_complete_descriptor(migrated)
+        if not result:
+            raise ValidationError(
+                f"Migration produced invalid descriptor on line {line_number}",
+                errors=result.errors,
+                warnings=result.warnings,
+            )
+        write(codec.dumps({
+            "from_version": from_version,
+            "to_version": to_version,
+            "descriptor": migrated,
+        }) + "\n")
+
+
 def main():
     if len(sys.argv) != 5:
         print(
@@ -72,29 +152,51 @@ def main():
     to_version = sys.argv[3]
     mapping_path = Path(sys.argv[4])
 
-    descriptor = load_descriptor(descriptor_path)
     mapping = load_migration_map(mapping_path)
 
-    migrated = migrate_descriptor(descriptor, mapping)
-    migrated = normalize_descriptor(migrated, strict=True)
+    if descriptor_path.suffix.lower() in _JSON_LINES_SUFFIXES:
+        migrate_lines(descriptor_path, from_version, to_version, mapping)
+        return
+
+    descriptors, is_batch = load_descriptors(descriptor_path)
+
+    migrated = [
+        normalize_descriptor(migrate_descriptor(d, mapping), strict=True)
+        for d in descriptors
+    ]
 
     validator = SchemaValidator(version=to_version)
-    result = validator.validate_complete_descriptor(migrated)
 
-    if not result:
-        raise ValidationError(
-            "Migration produced invalid descriptor",
-            errors=result.errors,
-            warnings=result.warnings,
-        )
+    if not is_batch:
+        result = validator.validate_complete_descriptor(migrated[0])
+        if not result:
+            raise ValidationError(
+                "Migration produced invalid descriptor",
+                errors=result.errors,
+                warnings=result.warnings,
+            )
+    else:
+        valid, errors = validator.validate_many(migrated)
+        if not all(valid):
+            raise ValidationError(
+                "Migration produced invalid descriptors",
+                errors=[
+                    f"descriptor {i}: {error}"
+                    for i, row in enumerate(errors)
+                    for error in row
+                ],
+            )
 
     output = {
         "from_version": from_version,
         "to_version": to_version,
-        "descriptor": migrated,
     }
+    if is_batch:
+        output["descriptors"] = migrated
+    else:
+        output["descriptor"] = migrated[0]
 
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    print(codec.dumps(output, indent=2))
 
 
 if __name__ == "__main__":
@@ -5,14 +5,24 @@ Schema Linter for Semantic Dropdown Search.
 Validates schema files for correctness, consistency, and v1 invariants.
 """
 
+import argparse
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Set, List, Dict
+from typing import Set, List, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 
 REQUIRED_KEYS = {"version", "values"}
 
+# Marks the end of an iterator in extract_values
+_EXHAUSTED = object()
+
 
 class SchemaLintError(Exception):
     pass
@@ -20,15 +30,17 @@ class SchemaLintError(Exception):
 
 def load_json(path: Path) -> Dict:
     try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson's error type subclasses it
         raise SchemaLintError(f"{path.name}: Invalid JSON ({e})")
 
 
 def extract_values(values: List, seen: Set[str], path: str = ""):
     """
-    Recursively extract values and detect duplicates.
+    Extract values and detect duplicates.
 
     Duplicate detection uses the full path (e.g. "Science/Biology") so that
     the same short label can legitimately appear as both a leaf value and as
@@ -38,36 +50,54 @@ def extract_values(values: List, seen: Set[str], path: str = ""):
     subcategory) AND once as a dict parent (selectable with subcategories).
     Only true duplicates — two strings or two dicts with the same full path —
     are reported as errors.
+
+    The hierarchy is walked depth-first with an explicit stack of
+    iterators rather than recursion, so depth is not limited by the
+    interpreter's recursion limit; entries are visited (and errors
+    reported) in the same order as a recursive walk. Entries come from
+    load_json(), which only produces exact str/dict/list objects, so types
+    are compared directly instead of with isinstance().
     """
-    for item in values:
-        full_path = ""  # will be set below for each item type
+    add = seen.add
+    # (iterator, path, True if it yields (key, children) pairs of a dict)
+    stack = [(iter(values), path, False)]
+    while stack:
+        items, path, is_dict = stack[-1]
+        entry = next(items, _EXHAUSTED)
+        if entry is _EXHAUSTED:
+            stack.pop()
+            continue
+
+        if is_dict:
+            key, children = entry
+            full_path = f"{path}/{key}" if path else key
+            # Dict parents are tracked with a "_parent" suffix
+            parent_key = f"{full_path}::parent"
+            if parent_key in seen:
+                raise SchemaLintError(f"Duplicate value detected: '{key}'")
+            add(parent_key)
 
-        if isinstance(item, str):
-            full_path = f"{path}/{item}" if path else item
+            if type(children) is not list:
+                raise SchemaLintError(
+                    f"Children of '{key}' must be a list"
+                )
+
+            stack.append((iter(children), full_path, False))
+
+        elif type(entry) is str:
+            full_path = f"{path}/{entry}" if path else entry
             # String leaves are tracked with a "_leaf" suffix
             leaf_key = f"{full_path}::leaf"
             if leaf_key in seen:
-                raise SchemaLintError(f"Duplicate value detected: '{item}'")
-            seen.add(leaf_key)
-
-        elif isinstance(item, dict):
-            for key, children in item.items():
-                full_path = f"{path}/{key}" if path else key
-                # Dict parents are tracked with a "_parent" suffix
-                parent_key = f"{full_path}::parent"
-                if parent_key in seen:
-                    raise SchemaLintError(f"Duplicate value detected: '{key}'")
-                seen.add(parent_key)
-
-                if not isinstance(children, list):
-                    raise SchemaLintError(
-                        f"Children of '{key}' must be a list"
-                    )
-
-                extract_values(children, seen, full_path)
+                raise SchemaLintError(f"Duplicate value detected: '{entry}'")
+            add(leaf_key)
+
+        elif type(entry) is dict:
+            stack.append((iter(entry.items()), path, True))
+
         else:
             raise SchemaLintError(
-                f"Invalid schema entry type: {type(item).__name__}"
+                f"Invalid schema entry type: {type(entry).__name__}"
             )
 
 
@@ -120,7 +150,34 @@ def lint_registry(schema_root: Path):
                 )
 
 
+def lint_schema_files(files: List[Tuple[Path, str]], jobs: int = 1):
+    """
+    Lint (schema_file, expected_version) pairs, across `jobs` processes
+    if more than one.
+
+    Files are independent, so they can be linted in any order; results
+    are still collected in the given order, so the error reported is the
+    one a sequential run would hit first.
+    """
+    if jobs < 2 or len(files) < 2:
+        for schema_file, version in files:
+            lint_schema_file(schema_file, version)
+        return
+
+    paths, versions = zip(*files)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for _ in executor.map(lint_schema_file, paths, versions):
+            pass
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Lint the schema files.")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="lint schema files across this many processes (default: 1)",
+    )
+    args = parser.parse_args()
+
     root = Path(__file__).resolve().parents[1]
     schema_root = root / "schema"
 
@@ -130,6 +187,7 @@ def main():
 
     lint_registry(schema_root)
 
+    files = []
     for version_dir in schema_root.iterdir():
         if not version_dir.is_dir() or version_dir.name == "__pycache__":
             continue
@@ -138,7 +196,9 @@ def main():
             if schema_file.name == "registry.json":
                 continue
 
-            lint_schema_file(schema_file, version_dir.name)
+            files.append((schema_file, version_dir.name))
+
+    lint_schema_files(files, args.jobs)
 
     print("✓ All schemas passed linting")
 